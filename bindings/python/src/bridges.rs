@@ -19,7 +19,7 @@ use amplifier_core::errors::{AmplifierError, HookError, SessionError};
 use amplifier_core::models::{HookAction, HookResult};
 use amplifier_core::traits::HookHandler;
 
-use crate::helpers::{is_approval_granted, json_dumps_safe, try_model_dump};
+use crate::helpers::{is_approval_granted, json_dumps_safe, try_model_dump, value_to_py};
 
 // ---------------------------------------------------------------------------
 // PyHookHandlerBridge — wraps a Python callable as a Rust HookHandler
@@ -32,12 +32,39 @@ use crate::helpers::{is_approval_granted, json_dumps_safe, try_model_dump};
 /// and return a dict (or None for a default continue result).
 pub(crate) struct PyHookHandlerBridge {
     pub(crate) callable: Py<PyAny>,
+    /// Whether `callable` is a coroutine function, classified once at
+    /// registration. Sync handlers are called and their result serialized
+    /// in a single GIL section, with no `into_future` round trip.
+    pub(crate) is_async: bool,
 }
 
 // Safety: Py<PyAny> is Send+Sync (PyO3 handles GIL acquisition).
 unsafe impl Send for PyHookHandlerBridge {}
 unsafe impl Sync for PyHookHandlerBridge {}
 
+/// Outcome of invoking a Python hook handler while holding the GIL.
+enum HandlerCall {
+    /// Sync handler: its result, already serialized to JSON.
+    Ready(String),
+    /// Async handler: the coroutine it returned, still to be awaited.
+    Pending(Py<PyAny>),
+}
+
+/// Serialize a Python hook handler result to a JSON string.
+///
+/// Python hook handlers typically return Pydantic BaseModel instances
+/// (e.g. amplifier_core.models.HookResult). stdlib json.dumps() cannot
+/// serialize Pydantic models directly, so we first try model_dump() to
+/// convert to a plain dict, then json.dumps() the dict. For non-Pydantic
+/// return values (plain dicts, etc.) we fall back to json.dumps() directly.
+fn hook_result_json(py: Python<'_>, result: &Bound<'_, PyAny>) -> String {
+    if result.is_none() {
+        return "{}".to_string();
+    }
+    let serializable = try_model_dump(result);
+    json_dumps_safe(py, &serializable).unwrap_or_else(|_| "{}".to_string())
+}
+
 impl HookHandler for PyHookHandlerBridge {
     fn handle(
         &self,
@@ -47,101 +74,85 @@ impl HookHandler for PyHookHandlerBridge {
         let event = event.to_string();
 
         Box::pin(async move {
-            // Clone the Py<PyAny> reference inside the GIL to safely use in this async block
-            let callable = Python::try_attach(|py| Ok::<_, PyErr>(self.callable.clone_ref(py)))
-                .ok_or_else(|| HookError::HandlerFailed {
-                    message: "Failed to attach to Python runtime".to_string(),
-                    handler_name: None,
-                })?
-                .map_err(|e| HookError::HandlerFailed {
-                    message: format!("Failed to clone Python callable reference: {e}"),
-                    handler_name: None,
-                })?;
-
-            // Step 1: Call the Python handler (inside GIL) — returns either a
-            // sync result or a coroutine object, plus whether it's a coroutine.
-            let (is_coro, py_result_or_coro) =
-                Python::try_attach(|py| -> PyResult<(bool, Py<PyAny>)> {
-                    let json_mod = py.import("json")?;
-                    let data_str = serde_json::to_string(&data).unwrap_or_else(|e| {
-                        log::warn!(
-                            "Failed to serialize hook data to JSON (using empty object): {e}"
-                        );
-                        "{}".to_string()
-                    });
-                    let py_data = json_mod.call_method1("loads", (&data_str,))?;
-
-                    let call_result = callable.call(py, (&event, py_data), None)?;
-                    let bound = call_result.bind(py);
-
-                    // Check if the result is a coroutine (async handler)
+            // Step 1: Call the Python handler (inside GIL). A sync handler's
+            // result is serialized right here; an async handler's coroutine
+            // is handed on to step 2.
+            let call = Python::try_attach(|py| -> PyResult<HandlerCall> {
+                // Build the handler's dict directly from the Value. Each handler
+                // gets its own copy: handlers may mutate `data` in place, so one
+                // dict cannot be shared across the handlers of an emit.
+                let py_data = value_to_py(py, &data)?;
+
+                let call_result = self.callable.bind(py).call1((&event, py_data))?;
+
+                // A sync callable may still return a coroutine, so only the
+                // registration-time classification skips this check.
+                let is_coro = self.is_async || {
                     let inspect = py.import("inspect")?;
-                    let is_coro: bool = inspect.call_method1("iscoroutine", (bound,))?.extract()?;
-
-                    Ok((is_coro, call_result))
-                })
-                .ok_or_else(|| HookError::HandlerFailed {
-                    message: "Failed to attach to Python runtime".to_string(),
-                    handler_name: None,
-                })?
-                .map_err(|e| HookError::HandlerFailed {
-                    message: format!("Python handler call error: {e}"),
-                    handler_name: None,
-                })?;
-
-            // Step 2: If it's a coroutine, convert to a Rust Future via
-            // pyo3_async_runtimes::tokio::into_future() and await OUTSIDE the GIL.
-            // This is the key fix: the old code used run_coroutine_threadsafe /
-            // asyncio.run() which either deadlocked or created a throwaway event loop.
-            // into_future() properly drives the coroutine on the caller's event loop.
-            let py_result = if is_coro {
-                let future = Python::try_attach(|py| {
-                    pyo3_async_runtimes::tokio::into_future(py_result_or_coro.into_bound(py))
-                })
-                .ok_or_else(|| HookError::HandlerFailed {
-                    message: "Failed to attach to Python runtime for coroutine conversion"
-                        .to_string(),
-                    handler_name: None,
-                })?
-                .map_err(|e| HookError::HandlerFailed {
-                    message: format!("Failed to convert coroutine: {e}"),
-                    handler_name: None,
-                })?;
-
-                // Await OUTSIDE the GIL — drives the Python coroutine on the
-                // caller's asyncio event loop via pyo3-async-runtimes task locals.
-                future.await.map_err(|e| HookError::HandlerFailed {
-                    message: format!("Python async handler error: {e}"),
-                    handler_name: None,
-                })?
-            } else {
-                py_result_or_coro
-            };
-
-            // Step 3: Parse the Python result into a HookResult (reacquire GIL)
-            //
-            // Python hook handlers typically return Pydantic BaseModel instances
-            // (e.g. amplifier_core.models.HookResult). stdlib json.dumps() cannot
-            // serialize Pydantic models directly, so we first try model_dump() to
-            // convert to a plain dict, then json.dumps() the dict. For non-Pydantic
-            // return values (plain dicts, etc.) we fall back to json.dumps() directly.
-            let result_json: String = Python::try_attach(|py| -> PyResult<String> {
-                let bound = py_result.bind(py);
-                if bound.is_none() {
-                    return Ok("{}".to_string());
+                    inspect
+                        .call_method1("iscoroutine", (&call_result,))?
+                        .extract()?
+                };
+
+                if is_coro {
+                    Ok(HandlerCall::Pending(call_result.unbind()))
+                } else {
+                    Ok(HandlerCall::Ready(hook_result_json(py, &call_result)))
                 }
-                let serializable = try_model_dump(bound);
-                Ok(json_dumps_safe(py, &serializable).unwrap_or_else(|_| "{}".to_string()))
             })
             .ok_or_else(|| HookError::HandlerFailed {
-                message: "Failed to attach to Python runtime for result parsing".to_string(),
+                message: "Failed to attach to Python runtime".to_string(),
                 handler_name: None,
             })?
             .map_err(|e| HookError::HandlerFailed {
-                message: format!("Failed to serialize handler result: {e}"),
+                message: format!("Python handler call error: {e}"),
                 handler_name: None,
             })?;
 
+            let result_json = match call {
+                HandlerCall::Ready(json) => json,
+                HandlerCall::Pending(coro) => {
+                    // Step 2: Convert the coroutine to a Rust Future via
+                    // pyo3_async_runtimes::tokio::into_future() and await OUTSIDE the GIL.
+                    // This is the key fix: the old code used run_coroutine_threadsafe /
+                    // asyncio.run() which either deadlocked or created a throwaway event loop.
+                    // into_future() properly drives the coroutine on the caller's event loop.
+                    //
+                    // The TaskLocals it needs are read from the tokio task-local
+                    // scope that future_into_py() set up when the emit began, so
+                    // get_running_loop() / copy_context() run once per dispatch,
+                    // not once per async handler.
+                    let future = Python::try_attach(|py| {
+                        pyo3_async_runtimes::tokio::into_future(coro.into_bound(py))
+                    })
+                    .ok_or_else(|| HookError::HandlerFailed {
+                        message: "Failed to attach to Python runtime for coroutine conversion"
+                            .to_string(),
+                        handler_name: None,
+                    })?
+                    .map_err(|e| HookError::HandlerFailed {
+                        message: format!("Failed to convert coroutine: {e}"),
+                        handler_name: None,
+                    })?;
+
+                    // Await OUTSIDE the GIL — drives the Python coroutine on the
+                    // caller's asyncio event loop via pyo3-async-runtimes task locals.
+                    let py_result = future.await.map_err(|e| HookError::HandlerFailed {
+                        message: format!("Python async handler error: {e}"),
+                        handler_name: None,
+                    })?;
+
+                    // Step 3: Serialize the awaited result (reacquire GIL)
+                    Python::try_attach(|py| hook_result_json(py, py_result.bind(py))).ok_or_else(
+                        || HookError::HandlerFailed {
+                            message: "Failed to attach to Python runtime for result parsing"
+                                .to_string(),
+                            handler_name: None,
+                        },
+                    )?
+                }
+            };
+
             let hook_result: HookResult = serde_json::from_str(&result_json).unwrap_or_else(|e| {
                 log::error!(
                     "SECURITY: Hook handler returned unparseable result — failing closed (Deny): {e} — json: {result_json}"
@@ -3,6 +3,7 @@
 //! Contains methods for inter-module communication: capability registry,
 //! cleanup function registration, and contribution channel management.
 
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 
@@ -86,9 +87,16 @@ impl PyCoordinator {
             ))
         })?;
         let list = list_any.cast::<PyList>()?;
-        let entry = PyDict::new(py);
-        entry.set_item("name", name)?;
-        entry.set_item("callback", &callback)?;
+        // Classify the callback once here so collect_contributions() does
+        // not re-run inspect.iscoroutinefunction() on every emission.
+        let is_coro: bool = py
+            .import("inspect")?
+            .getattr("iscoroutinefunction")?
+            .call1((&callback,))?
+            .extract()?;
+        // Contributors are stored as (callback, name, is_coro) tuples: cheaper
+        // to build than a dict and unpacked positionally by the helper.
+        let entry = (&callback, name, is_coro).into_pyobject(py)?;
         list.append(entry)?;
         Ok(())
     }
@@ -105,14 +113,26 @@ impl PyCoordinator {
     ) -> PyResult<Bound<'py, PyAny>> {
         // Build a Python coroutine that handles both sync and async callbacks,
         // matching the Python ModuleCoordinator.collect_contributions behavior.
-        let channels = self.channels_dict.clone_ref(py);
+        // Resolve the channel here so the helper receives the contributor
+        // list itself rather than the whole channels dict.
+        let contributors = match self.channels_dict.bind(py).get_item(&channel)? {
+            Some(list) if !list.is_empty()? => list,
+            // Fast path: a channel with no contributors resolves to [] without
+            // entering the helper or the tokio runtime.
+            _ => {
+                return py
+                    .import("amplifier_core._async_compat")?
+                    .getattr(intern!(py, "_ready"))?
+                    .call1((PyList::empty(py),));
+            }
+        };
 
         // Create a Python helper function to do the collection properly in Python
         // This handles async callbacks naturally since it runs in the Python event loop
         let collect_code = py.import("amplifier_core._collect_helper");
         if let Ok(helper_mod) = collect_code {
-            let collect_fn = helper_mod.getattr("collect_contributions")?;
-            let coro = collect_fn.call1((&channels, &channel))?;
+            let collect_fn = helper_mod.getattr(intern!(py, "collect_contributions_list"))?;
+            let coro = collect_fn.call1((&contributors, &channel))?;
             // Return the coroutine directly - it will be awaited by the caller
             Ok(coro)
         } else {
@@ -126,23 +146,19 @@ impl PyCoordinator {
                  Async contributor callbacks will be skipped.",
                 channel
             );
-            let channels_ref = channels;
+            let contributors_ref = contributors.unbind();
             wrap_future_as_coroutine(
                 py,
                 pyo3_async_runtimes::tokio::future_into_py(py, async move {
                     let results: Vec<Py<PyAny>> =
                         Python::try_attach(|py| -> PyResult<Vec<Py<PyAny>>> {
-                            let channels_dict = channels_ref.bind(py);
-                            let contributors = match channels_dict.get_item(&channel)? {
-                                Some(list) => list,
-                                None => return Ok(Vec::new()),
-                            };
+                            let contributors = contributors_ref.bind(py);
                             let list = contributors.cast::<PyList>()?;
                             let mut results: Vec<Py<PyAny>> = Vec::new();
 
                             for i in 0..list.len() {
                                 let entry = list.get_item(i)?;
-                                let callback = entry.get_item("callback")?;
+                                let callback = entry.get_item(0)?;
                                 match callback.call0() {
                                     Ok(result) => {
                                         if !result.is_none() {
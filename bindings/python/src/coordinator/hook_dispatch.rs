@@ -13,8 +13,9 @@
 //! This avoids capturing raw pointers in a `Send + 'static` future.
 
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
 
 use crate::bridges::PyContextManagerBridge;
 use crate::helpers::{is_approval_granted, wrap_future_as_coroutine};
@@ -69,70 +70,60 @@ impl PyCoordinator {
         hook_name: &str,
     ) -> PyResult<Bound<'py, PyAny>> {
         // Snapshot all fields we need from the Python HookResult object while
-        // we hold the GIL.
-        let action: String = result.getattr("action")?.extract()?;
-        let context_injection: Option<String> = {
-            let val = result.getattr("context_injection")?;
-            if val.is_none() {
-                None
-            } else {
-                Some(val.extract()?)
-            }
-        };
-        let context_injection_role: String = result.getattr("context_injection_role")?.extract()?;
-        let ephemeral: bool = result.getattr("ephemeral")?.extract()?;
-        let suppress_output: bool = result.getattr("suppress_output")?.extract()?;
-        let user_message: Option<String> = {
-            let val = result.getattr("user_message")?;
-            if val.is_none() {
-                None
-            } else {
-                Some(val.extract()?)
-            }
-        };
-        let user_message_level: String = result.getattr("user_message_level")?.extract()?;
-        let user_message_source: Option<String> = {
-            let val = result.getattr("user_message_source")?;
-            if val.is_none() {
-                None
-            } else {
-                Some(val.extract()?)
-            }
-        };
-        let approval_prompt: Option<String> = {
-            let val = result.getattr("approval_prompt")?;
-            if val.is_none() {
-                None
-            } else {
-                Some(val.extract()?)
-            }
-        };
-        let approval_options: Option<Vec<String>> = {
-            let val = result.getattr("approval_options")?;
-            if val.is_none() {
-                None
-            } else {
-                Some(val.extract()?)
-            }
-        };
-        let approval_timeout: f64 = result.getattr("approval_timeout")?.extract()?;
-        let approval_default: String = result.getattr("approval_default")?.extract()?;
-
-        // Read coordinator config
-        let size_limit: Option<usize> = {
-            let val = self.get_injection_size_limit(py)?;
-            if val.bind(py).is_none() {
-                None
-            } else {
-                Some(val.extract(py)?)
-            }
-        };
-        let budget: Option<usize> = {
-            let val = self.get_injection_budget_per_turn(py)?;
-            if val.bind(py).is_none() {
-                None
-            } else {
-                Some(val.extract(py)?)
+        // we hold the GIL. Attribute names are interned; Option<T> extraction
+        // maps Python None to None. The action string is borrowed and classified
+        // once; only the two flags below are carried through the phases.
+        let action = result.getattr(intern!(py, "action"))?;
+        let action = action.cast::<PyString>()?.to_str()?;
+        let is_inject_context = action == "inject_context";
+        let is_ask_user = action == "ask_user";
+        let suppress_output: bool = result.getattr(intern!(py, "suppress_output"))?.extract()?;
+        let user_message: Option<String> =
+            result.getattr(intern!(py, "user_message"))?.extract()?;
+
+        // Fast path: a plain result (no injection, no approval, nothing to
+        // show or suppress) needs no routing. Hand it straight back without
+        // reading the remaining fields or entering the tokio runtime.
+        if !is_inject_context
+            && !is_ask_user
+            && user_message.as_deref().is_none_or(str::is_empty)
+            && !suppress_output
+        {
+            return py
+                .import("amplifier_core._async_compat")?
+                .getattr(intern!(py, "_ready"))?
+                .call1((result,));
+        }
+
+        let context_injection: Option<String> = result
+            .getattr(intern!(py, "context_injection"))?
+            .extract()?;
+        let context_injection_role: String = result
+            .getattr(intern!(py, "context_injection_role"))?
+            .extract()?;
+        let ephemeral: bool = result.getattr(intern!(py, "ephemeral"))?.extract()?;
+        let user_message_level: String = result
+            .getattr(intern!(py, "user_message_level"))?
+            .extract()?;
+        let user_message_source: Option<String> = result
+            .getattr(intern!(py, "user_message_source"))?
+            .extract()?;
+        let approval_prompt: Option<String> =
+            result.getattr(intern!(py, "approval_prompt"))?.extract()?;
+        let approval_options: Option<Vec<String>> =
+            result.getattr(intern!(py, "approval_options"))?.extract()?;
+        let approval_timeout: f64 = result.getattr(intern!(py, "approval_timeout"))?.extract()?;
+        let approval_default: String =
+            result.getattr(intern!(py, "approval_default"))?.extract()?;
+
+        // Read coordinator config and the context mount once; Phase A and
+        // Phase D both reuse these instead of going back through the dicts.
+        let (size_limit, budget) = self.injection_limits(py)?;
+        let context_obj: Py<PyAny> = {
+            let mp = self.mount_points.bind(py);
+            match mp.get_item(intern!(py, "context"))? {
+                Some(c) if !c.is_none() => c.unbind(),
+                _ => py.None(),
             }
         };
 
@@ -153,7 +144,7 @@ impl PyCoordinator {
         // `message_to_inject` is the pre-built message dict to pass into the
         // async block.  It is Some(_) when we should call add_message, None
         // when the injection is ephemeral or has no context to inject.
-        let message_to_inject: Option<Py<PyAny>> = if action == "inject_context" {
+        let message_to_inject: Option<Py<PyAny>> = if is_inject_context {
             match context_injection.as_deref() {
                 Some(content) if !content.is_empty() => {
                     // A.1. Sanitize content FIRST (fail closed if unavailable).
@@ -226,30 +217,27 @@ impl PyCoordinator {
 
                     // A.5. Build message dict for async injection (ONLY if not ephemeral).
                     let msg_opt = if !ephemeral {
-                        let ctx_bound = self.mount_points.bind(py);
-                        let ctx_item = ctx_bound.get_item("context")?;
-                        let has_context = ctx_item.as_ref().is_some_and(|c| {
-                            !c.is_none() && c.hasattr("add_message").unwrap_or(false)
-                        });
+                        let ctx = context_obj.bind(py);
+                        let has_context = !ctx.is_none()
+                            && ctx.hasattr(intern!(py, "add_message")).unwrap_or(false);
 
                         if has_context {
-                            let datetime_mod = py.import("datetime")?;
-                            let utc = datetime_mod.getattr("timezone")?.getattr("utc")?;
-                            let now = datetime_mod
-                                .getattr("datetime")?
-                                .call_method1("now", (utc,))?
-                                .call_method0("isoformat")?;
+                            // Same shape as Python
+                            // datetime.now(timezone.utc).isoformat(), formatted
+                            // in Rust instead of via four Python-level calls.
+                            let now = chrono::Utc::now()
+                                .to_rfc3339_opts(chrono::SecondsFormat::Micros, false);
 
                             let metadata = PyDict::new(py);
-                            metadata.set_item("source", "hook")?;
-                            metadata.set_item("hook_name", &hook_name_owned)?;
-                            metadata.set_item("event", &event)?;
-                            metadata.set_item("timestamp", &now)?;
+                            metadata.set_item(intern!(py, "source"), intern!(py, "hook"))?;
+                            metadata.set_item(intern!(py, "hook_name"), &hook_name_owned)?;
+                            metadata.set_item(intern!(py, "event"), &event)?;
+                            metadata.set_item(intern!(py, "timestamp"), &now)?;
 
                             let msg = PyDict::new(py);
-                            msg.set_item("role", &context_injection_role)?;
-                            msg.set_item("content", &sanitized_content)?;
-                            msg.set_item("metadata", metadata)?;
+                            msg.set_item(intern!(py, "role"), &context_injection_role)?;
+                            msg.set_item(intern!(py, "content"), &sanitized_content)?;
+                            msg.set_item(intern!(py, "metadata"), metadata)?;
 
                             Some(msg.into_any().unbind())
                         } else {
@@ -286,7 +274,7 @@ impl PyCoordinator {
         // Fires on result.user_message FIELD being truthy, NOT on action field.
         // Done synchronously to avoid capturing display_system_obj in the future.
         // -----------------------------------------------------------------------
-        if action != "ask_user" {
+        if !is_ask_user {
             if let Some(ref msg_text) = user_message {
                 if !msg_text.is_empty() {
                     let source_name = user_message_source.as_deref().unwrap_or(&hook_name_owned);
@@ -316,21 +304,10 @@ impl PyCoordinator {
         // -----------------------------------------------------------------------
         // Phase C (sync): suppress_output — log only
         // -----------------------------------------------------------------------
-        if suppress_output && action != "ask_user" {
+        if suppress_output && !is_ask_user {
             log::debug!("Hook '{}' requested output suppression", hook_name_owned);
         }
 
-        // -----------------------------------------------------------------------
-        // Grab context object for Phase D async add_message call
-        // -----------------------------------------------------------------------
-        let context_obj: Py<PyAny> = {
-            let mp = self.mount_points.bind(py);
-            match mp.get_item("context")? {
-                Some(c) if !c.is_none() => c.unbind(),
-                _ => py.None(),
-            }
-        };
-
         // Grab approval system for Phase E ask_user
         let approval_obj = self.approval_system_obj.clone_ref(py);
 
@@ -366,7 +343,7 @@ impl PyCoordinator {
                 // Phase E (async): approval request — call request_approval
                 //                  (RETURNS EARLY)
                 // -------------------------------------------------------
-                if action == "ask_user" {
+                if is_ask_user {
                     let prompt =
                         approval_prompt.unwrap_or_else(|| "Allow this operation?".to_string());
 
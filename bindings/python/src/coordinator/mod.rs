@@ -9,6 +9,7 @@ use std::collections::HashMap;
 use std::sync::Arc;
 
 use pyo3::exceptions::PyRuntimeError;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use serde_json::Value;
@@ -43,7 +44,11 @@ pub(crate) struct PyCoordinator {
     pub(crate) py_cancellation: Py<PyCancellationToken>,
     /// Session back-reference.
     pub(crate) session_ref: Py<PyAny>,
-    /// Session ID (from session object).
+    /// Session ID, read from the session object once in `new()`.
+    ///
+    /// `session_id`, `parent_id` and `config` are resolved at construction so
+    /// their getters return cached values without an attribute lookup on the
+    /// session object.
     pub(crate) session_id: String,
     /// Parent ID (from session object).
     pub(crate) parent_id: Option<String>,
@@ -53,7 +58,7 @@ pub(crate) struct PyCoordinator {
     pub(crate) capabilities: Py<PyDict>,
     /// Cleanup callables.
     pub(crate) cleanup_fns: Py<PyList>,
-    /// Contribution channels: channel -> list of {name, callback}.
+    /// Contribution channels: channel -> list of (callback, name, is_coro).
     pub(crate) channels_dict: Py<PyDict>,
     /// Per-turn injection counter (Python-side, mirrors Rust kernel).
     pub(crate) current_turn_injections: usize,
@@ -103,16 +108,16 @@ impl PyCoordinator {
         // so we build a valid-but-placeholder struct first.
         let (session_id, parent_id, config_obj_py, session_ref, rust_config) = match &session {
             Some(sess) => {
-                let sid: String = sess.getattr("session_id")?.extract()?;
+                let sid: String = sess.getattr(intern!(py, "session_id"))?.extract()?;
                 let pid: Option<String> = {
-                    let p = sess.getattr("parent_id")?;
+                    let p = sess.getattr(intern!(py, "parent_id"))?;
                     if p.is_none() {
                         None
                     } else {
                         Some(p.extract()?)
                     }
                 };
-                let cfg = sess.getattr("config")?;
+                let cfg = sess.getattr(intern!(py, "config"))?;
                 let rc: HashMap<String, Value> = {
                     let serializable = try_model_dump(&cfg);
                     let json_str: String = json_dumps_safe(py, &serializable)?;
@@ -136,46 +141,16 @@ impl PyCoordinator {
             }
         };
 
-        let inner = Arc::new(amplifier_core::Coordinator::new(rust_config));
-
-        // Create the hooks registry
-        let hooks_instance = Py::new(py, PyHookRegistry::new())?;
-        let hooks_any: Py<PyAny> = hooks_instance.clone_ref(py).into_any();
-
-        // Create the cancellation token
-        let cancel_instance = Py::new(py, PyCancellationToken::new())?;
-
-        // Build mount_points dict matching Python ModuleCoordinator
-        let mp = PyDict::new(py);
-        mp.set_item("orchestrator", py.None())?;
-        mp.set_item("providers", PyDict::new(py))?;
-        mp.set_item("tools", PyDict::new(py))?;
-        mp.set_item("context", py.None())?;
-        mp.set_item("hooks", &hooks_any)?;
-        mp.set_item("module-source-resolver", py.None())?;
-
-        Ok(Self {
-            inner,
-            mount_points: mp.unbind(),
-            py_hooks: hooks_any,
-            py_cancellation: cancel_instance,
-            session_ref,
+        Self::from_parts(
+            py,
             session_id,
             parent_id,
-            config_dict: config_obj_py,
-            capabilities: PyDict::new(py).unbind(),
-            cleanup_fns: PyList::empty(py).unbind(),
-            channels_dict: PyDict::new(py).unbind(),
-            current_turn_injections: 0,
-            approval_system_obj: approval_system
-                .map(|a| a.unbind())
-                .unwrap_or_else(|| py.None()),
-            display_system_obj: display_system
-                .map(|d| d.unbind())
-                .unwrap_or_else(|| py.None()),
-            loader_obj: py.None(),
-            session_state_dict: PyDict::new(py).unbind(),
-        })
+            config_obj_py,
+            session_ref,
+            rust_config,
+            approval_system,
+            display_system,
+        )
     }
 
     // -----------------------------------------------------------------------
@@ -420,7 +395,7 @@ impl PyCoordinator {
         // tools: list of mounted tool names from mount_points["tools"]
         let mp = self.mount_points.bind(py);
         let tools_dict = mp
-            .get_item("tools")?
+            .get_item(intern!(py, "tools"))?
             .ok_or_else(|| PyErr::new::<PyRuntimeError, _>("mount_points missing 'tools'"))?;
         // keys are always str in these dicts — unwrap_or_default() is safe
         let tools_keys: Vec<String> = tools_dict
@@ -433,7 +408,7 @@ impl PyCoordinator {
 
         // providers: list of mounted provider names from mount_points["providers"]
         let providers_dict = mp
-            .get_item("providers")?
+            .get_item(intern!(py, "providers"))?
             .ok_or_else(|| PyErr::new::<PyRuntimeError, _>("mount_points missing 'providers'"))?;
         // keys are always str in these dicts — unwrap_or_default() is safe
         let provider_keys: Vec<String> = providers_dict
@@ -445,14 +420,14 @@ impl PyCoordinator {
         dict.set_item("providers", PyList::new(py, &provider_keys)?)?;
 
         // has_orchestrator: whether orchestrator mount point is not None
-        let orch = mp.get_item("orchestrator")?.ok_or_else(|| {
+        let orch = mp.get_item(intern!(py, "orchestrator"))?.ok_or_else(|| {
             PyErr::new::<PyRuntimeError, _>("mount_points missing 'orchestrator'")
         })?;
         dict.set_item("has_orchestrator", !orch.is_none())?;
 
         // has_context: whether context mount point is not None
         let ctx = mp
-            .get_item("context")?
+            .get_item(intern!(py, "context"))?
             .ok_or_else(|| PyErr::new::<PyRuntimeError, _>("mount_points missing 'context'"))?;
         dict.set_item("has_context", !ctx.is_none())?;
 
@@ -475,3 +450,63 @@ impl PyCoordinator {
         Ok(dict)
     }
 }
+
+impl PyCoordinator {
+    /// Build a coordinator from already-resolved session fields.
+    ///
+    /// `new()` resolves these from a session object; `RustSession::new()`
+    /// calls this directly with the config it has already converted to
+    /// JSON, so the session config is not dumped and re-parsed a second time.
+    #[allow(clippy::too_many_arguments)]
+    pub(crate) fn from_parts(
+        py: Python<'_>,
+        session_id: String,
+        parent_id: Option<String>,
+        config_obj_py: Py<PyAny>,
+        session_ref: Py<PyAny>,
+        rust_config: HashMap<String, Value>,
+        approval_system: Option<Bound<'_, PyAny>>,
+        display_system: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<Self> {
+        let inner = Arc::new(amplifier_core::Coordinator::new(rust_config));
+
+        // Create the hooks registry
+        let hooks_instance = Py::new(py, PyHookRegistry::new())?;
+        let hooks_any: Py<PyAny> = hooks_instance.clone_ref(py).into_any();
+
+        // Create the cancellation token
+        let cancel_instance = Py::new(py, PyCancellationToken::new())?;
+
+        // Build mount_points dict matching Python ModuleCoordinator
+        let mp = PyDict::new(py);
+        mp.set_item(intern!(py, "orchestrator"), py.None())?;
+        mp.set_item(intern!(py, "providers"), PyDict::new(py))?;
+        mp.set_item(intern!(py, "tools"), PyDict::new(py))?;
+        mp.set_item(intern!(py, "context"), py.None())?;
+        mp.set_item(intern!(py, "hooks"), &hooks_any)?;
+        mp.set_item(intern!(py, "module-source-resolver"), py.None())?;
+
+        Ok(Self {
+            inner,
+            mount_points: mp.unbind(),
+            py_hooks: hooks_any,
+            py_cancellation: cancel_instance,
+            session_ref,
+            session_id,
+            parent_id,
+            config_dict: config_obj_py,
+            capabilities: PyDict::new(py).unbind(),
+            cleanup_fns: PyList::empty(py).unbind(),
+            channels_dict: PyDict::new(py).unbind(),
+            current_turn_injections: 0,
+            approval_system_obj: approval_system
+                .map(|a| a.unbind())
+                .unwrap_or_else(|| py.None()),
+            display_system_obj: display_system
+                .map(|d| d.unbind())
+                .unwrap_or_else(|| py.None()),
+            loader_obj: py.None(),
+            session_state_dict: PyDict::new(py).unbind(),
+        })
+    }
+}
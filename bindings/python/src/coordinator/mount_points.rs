@@ -6,8 +6,9 @@
 use std::sync::Arc;
 
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
 
 use crate::bridges::{PyApprovalProviderBridge, PyDisplayServiceBridge};
 use crate::cancellation::PyCancellationToken;
@@ -15,6 +16,25 @@ use crate::helpers::wrap_future_as_coroutine;
 
 use super::PyCoordinator;
 
+/// Resolve a mount-point name to the key used in the `mount_points` dict.
+///
+/// The built-in mount points map to interned Python strings, so the
+/// `mount()` / `get()` / `unmount()` hot paths hash and compare against a
+/// cached `PyString` instead of allocating a new one per call. Any other
+/// name (unknown, or a key a caller added via the `mount_points` setter)
+/// falls back to a fresh `PyString`.
+pub(super) fn mount_point_key<'py>(py: Python<'py>, mount_point: &str) -> Bound<'py, PyString> {
+    match mount_point {
+        "orchestrator" => intern!(py, "orchestrator").clone(),
+        "providers" => intern!(py, "providers").clone(),
+        "tools" => intern!(py, "tools").clone(),
+        "context" => intern!(py, "context").clone(),
+        "hooks" => intern!(py, "hooks").clone(),
+        "module-source-resolver" => intern!(py, "module-source-resolver").clone(),
+        other => PyString::new(py, other),
+    }
+}
+
 #[pymethods]
 impl PyCoordinator {
     // -----------------------------------------------------------------------
@@ -53,9 +73,10 @@ impl PyCoordinator {
         name: Option<String>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let mp = self.mount_points.bind(py);
+        let key = mount_point_key(py, mount_point);
 
         // Validate mount point exists
-        if !mp.contains(mount_point)? {
+        if !mp.contains(&key)? {
             return Err(PyErr::new::<PyValueError, _>(format!(
                 "Unknown mount point: {mount_point}"
             )));
@@ -69,12 +90,12 @@ impl PyCoordinator {
 
         match mount_point {
             "orchestrator" | "context" | "module-source-resolver" => {
-                mp.set_item(mount_point, &module)?;
+                mp.set_item(&key, &module)?;
             }
             "providers" | "tools" => {
                 let resolved_name = match name {
                     Some(n) => n,
-                    None => match module.getattr("name") {
+                    None => match module.getattr(intern!(py, "name")) {
                         Ok(attr) => attr.extract::<String>()?,
                         Err(_) => {
                             return Err(PyErr::new::<PyValueError, _>(format!(
@@ -83,7 +104,7 @@ impl PyCoordinator {
                         }
                     },
                 };
-                let sub_dict = mp.get_item(mount_point)?.ok_or_else(|| {
+                let sub_dict = mp.get_item(&key)?.ok_or_else(|| {
                     PyErr::new::<PyRuntimeError, _>(format!(
                         "Mount point sub-dict missing: {mount_point}"
                     ))
@@ -114,8 +135,9 @@ impl PyCoordinator {
         name: Option<&str>,
     ) -> PyResult<Py<PyAny>> {
         let mp = self.mount_points.bind(py);
+        let key = mount_point_key(py, mount_point);
 
-        if !mp.contains(mount_point)? {
+        if !mp.contains(&key)? {
             return Err(PyErr::new::<PyValueError, _>(format!(
                 "Unknown mount point: {mount_point}"
             )));
@@ -123,13 +145,13 @@ impl PyCoordinator {
 
         match mount_point {
             "orchestrator" | "context" | "hooks" | "module-source-resolver" => {
-                let item = mp.get_item(mount_point)?.ok_or_else(|| {
+                let item = mp.get_item(&key)?.ok_or_else(|| {
                     PyErr::new::<PyRuntimeError, _>(format!("Mount point missing: {mount_point}"))
                 })?;
                 Ok(item.unbind())
             }
             "providers" | "tools" => {
-                let sub_dict_any = mp.get_item(mount_point)?.ok_or_else(|| {
+                let sub_dict_any = mp.get_item(&key)?.ok_or_else(|| {
                     PyErr::new::<PyRuntimeError, _>(format!("Mount point missing: {mount_point}"))
                 })?;
                 match name {
@@ -162,8 +184,9 @@ impl PyCoordinator {
         name: Option<&str>,
     ) -> PyResult<Bound<'py, PyAny>> {
         let mp = self.mount_points.bind(py);
+        let key = mount_point_key(py, mount_point);
 
-        if !mp.contains(mount_point)? {
+        if !mp.contains(&key)? {
             return Err(PyErr::new::<PyValueError, _>(format!(
                 "Unknown mount point: {mount_point}"
             )));
@@ -171,11 +194,11 @@ impl PyCoordinator {
 
         match mount_point {
             "orchestrator" | "context" | "module-source-resolver" => {
-                mp.set_item(mount_point, py.None())?;
+                mp.set_item(&key, py.None())?;
             }
             "providers" | "tools" => {
                 if let Some(n) = name {
-                    let sub_any = mp.get_item(mount_point)?.ok_or_else(|| {
+                    let sub_any = mp.get_item(&key)?.ok_or_else(|| {
                         PyErr::new::<PyRuntimeError, _>(format!(
                             "Mount point missing: {mount_point}"
                         ))
@@ -401,6 +424,33 @@ impl PyCoordinator {
         }
     }
 
+    /// `(injection_size_limit, injection_budget_per_turn)` from session config.
+    ///
+    /// Reads the session section once for both values; used by
+    /// `process_hook_result()`, which needs them together.
+    pub(crate) fn injection_limits(
+        &self,
+        py: Python<'_>,
+    ) -> PyResult<(Option<usize>, Option<usize>)> {
+        let session = self
+            .config_dict
+            .bind(py)
+            .call_method1(intern!(py, "get"), (intern!(py, "session"),))?;
+        if session.is_none() {
+            return Ok((None, None));
+        }
+        let size_limit = session
+            .call_method1(intern!(py, "get"), (intern!(py, "injection_size_limit"),))?
+            .extract()?;
+        let budget = session
+            .call_method1(
+                intern!(py, "get"),
+                (intern!(py, "injection_budget_per_turn"),),
+            )?
+            .extract()?;
+        Ok((size_limit, budget))
+    }
+
     /// Per-injection size limit from session config. Returns `None` or an int.
     pub(crate) fn get_injection_size_limit<'py>(&self, py: Python<'py>) -> PyResult<Py<PyAny>> {
         let config = self.config_dict.bind(py);
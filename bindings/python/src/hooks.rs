@@ -5,9 +5,11 @@
 use std::collections::HashMap;
 use std::sync::Arc;
 
+use amplifier_core::models::{HookAction, HookResult};
 use pyo3::exceptions::PyRuntimeError;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PyString};
 use serde_json::Value;
 
 use crate::bridges::PyHookHandlerBridge;
@@ -45,6 +47,25 @@ impl PyUnregisterFn {
     }
 }
 
+// ---------------------------------------------------------------------------
+// hook_result_to_py — kernel HookResult -> Python HookResult model
+// ---------------------------------------------------------------------------
+
+/// Convert a kernel `HookResult` into a Python `amplifier_core.models.HookResult`.
+///
+/// The result is serialized to JSON and validated straight into the model:
+/// pydantic parses it natively, with no intermediate `json.loads()` dict.
+/// Shared by every `emit()` path so they build identical objects.
+fn hook_result_to_py<'py>(py: Python<'py>, result: &HookResult) -> PyResult<Bound<'py, PyAny>> {
+    let result_json = serde_json::to_string(result).unwrap_or_else(|e| {
+        log::warn!("Failed to serialize hook result to JSON (using empty object): {e}");
+        "{}".to_string()
+    });
+    py.import("amplifier_core.models")?
+        .getattr(intern!(py, "HookResult"))?
+        .call_method1(intern!(py, "model_validate_json"), (&result_json,))
+}
+
 // ---------------------------------------------------------------------------
 // PyHookRegistry — wraps amplifier_core::HookRegistry
 // ---------------------------------------------------------------------------
@@ -96,7 +117,14 @@ impl PyHookRegistry {
     ) -> PyResult<Py<PyAny>> {
         let handler_name =
             name.unwrap_or_else(|| format!("_auto_{event}_{}", uuid::Uuid::new_v4()));
-        let bridge = Arc::new(PyHookHandlerBridge { callable: handler });
+        let is_async: bool = py
+            .import("inspect")?
+            .call_method1("iscoroutinefunction", (&handler,))?
+            .extract()?;
+        let bridge = Arc::new(PyHookHandlerBridge {
+            callable: handler,
+            is_async,
+        });
         let unregister_fn =
             self.inner
                 .register(event, bridge, priority, Some(handler_name.clone()));
@@ -134,24 +162,31 @@ impl PyHookRegistry {
         let value: Value = serde_json::from_str(&json_str)
             .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Invalid JSON: {e}")))?;
 
+        // Nothing listens for this event: the kernel would just echo the data
+        // back, so build that result here instead of spawning a tokio future.
+        if !inner.has_handlers(&event) {
+            let result = HookResult {
+                action: HookAction::Continue,
+                data: match value {
+                    Value::Object(map) => Some(map.into_iter().collect()),
+                    _ => Some(Default::default()),
+                },
+                ..Default::default()
+            };
+            let obj = hook_result_to_py(py, &result)?;
+            return py
+                .import("amplifier_core._async_compat")?
+                .call_method1(intern!(py, "_ready"), (obj,));
+        }
+
         wrap_future_as_coroutine(
             py,
             pyo3_async_runtimes::tokio::future_into_py(py, async move {
                 let result = inner.emit(&event, value).await;
-                // Convert HookResult to a JSON string, then parse it back as a
-                // Python HookResult object so callers can access .action, .data, etc.
-                let result_json = serde_json::to_string(&result).unwrap_or_else(|e| {
-                    log::warn!("Failed to serialize hook result to JSON (using empty object): {e}");
-                    "{}".to_string()
-                });
+                // Hand back a Python HookResult object so callers can access
+                // .action, .data, etc.
                 Python::try_attach(|py| -> PyResult<Py<PyAny>> {
-                    let json_mod = py.import("json")?;
-                    let dict = json_mod.call_method1("loads", (&result_json,))?;
-                    // Create a proper HookResult from the dict
-                    let models = py.import("amplifier_core.models")?;
-                    let hook_result_cls = models.getattr("HookResult")?;
-                    let obj = hook_result_cls.call_method1("model_validate", (&dict,))?;
-                    Ok(obj.unbind())
+                    Ok(hook_result_to_py(py, &result)?.unbind())
                 })
                 .ok_or_else(|| {
                     PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
@@ -236,7 +271,9 @@ impl PyHookRegistry {
         let inner = self.inner.clone();
         let serializable = try_model_dump(&data);
         let json_str: String = json_dumps_safe(py, &serializable)?;
-        let value: Value = serde_json::from_str(&json_str)
+        // Parsing is pure Rust — release the GIL while it runs.
+        let value: Value = py
+            .detach(|| serde_json::from_str(&json_str))
             .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Invalid JSON: {e}")))?;
         let timeout_dur = std::time::Duration::from_secs_f64(timeout);
 
@@ -244,18 +281,24 @@ impl PyHookRegistry {
             py,
             pyo3_async_runtimes::tokio::future_into_py(py, async move {
                 let results = inner.emit_and_collect(&event, value, timeout_dur).await;
-                // Convert each HashMap<String, Value> to a Python dict.
-                // Serializes each result to a JSON string then json.loads() to dict.
+                // Serialize every result to JSON before attaching, so the GIL
+                // is only held for the json.loads() calls below.
+                let result_jsons: Vec<String> = results
+                    .iter()
+                    .map(|r| {
+                        serde_json::to_string(r).unwrap_or_else(|e| {
+                            log::warn!("Failed to serialize emit_and_collect result to JSON (using empty object): {e}");
+                            "{}".to_string()
+                        })
+                    })
+                    .collect();
+                // Convert each JSON string to a Python dict via json.loads().
                 // Returns Py<PyAny> (a Python list of dicts).
                 Python::try_attach(|py| -> PyResult<Py<PyAny>> {
                     let json_mod = py.import("json")?;
                     let list = PyList::empty(py);
-                    for r in &results {
-                        let json_str = serde_json::to_string(r).unwrap_or_else(|e| {
-                            log::warn!("Failed to serialize emit_and_collect result to JSON (using empty object): {e}");
-                            "{}".to_string()
-                        });
-                        let dict = json_mod.call_method1("loads", (&json_str,))?;
+                    for json_str in &result_jsons {
+                        let dict = json_mod.call_method1(intern!(py, "loads"), (json_str,))?;
                         list.append(dict)?;
                     }
                     Ok(list.into_any().unbind())
@@ -269,21 +312,54 @@ impl PyHookRegistry {
         )
     }
 
-    // Class-level event name constants matching Python HookRegistry
+    // Class-level event name constants matching Python HookRegistry.
+    // Built once when the type object is created, from the same interned
+    // strings as the `_engine` module-level event constants.
     #[classattr]
-    const SESSION_START: &'static str = "session:start";
+    #[allow(non_snake_case)]
+    fn SESSION_START(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::SESSION_START).unbind()
+    }
+
     #[classattr]
-    const SESSION_END: &'static str = "session:end";
+    #[allow(non_snake_case)]
+    fn SESSION_END(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::SESSION_END).unbind()
+    }
+
     #[classattr]
-    const PROMPT_SUBMIT: &'static str = "prompt:submit";
+    #[allow(non_snake_case)]
+    fn PROMPT_SUBMIT(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::PROMPT_SUBMIT).unbind()
+    }
+
     #[classattr]
-    const TOOL_PRE: &'static str = "tool:pre";
+    #[allow(non_snake_case)]
+    fn TOOL_PRE(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::TOOL_PRE).unbind()
+    }
+
     #[classattr]
-    const TOOL_POST: &'static str = "tool:post";
+    #[allow(non_snake_case)]
+    fn TOOL_POST(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::TOOL_POST).unbind()
+    }
+
     #[classattr]
-    const CONTEXT_PRE_COMPACT: &'static str = "context:pre_compact";
+    #[allow(non_snake_case)]
+    fn CONTEXT_PRE_COMPACT(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::CONTEXT_PRE_COMPACT).unbind()
+    }
+
     #[classattr]
-    const ORCHESTRATOR_COMPLETE: &'static str = "orchestrator:complete";
+    #[allow(non_snake_case)]
+    fn ORCHESTRATOR_COMPLETE(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::ORCHESTRATOR_COMPLETE).unbind()
+    }
+
     #[classattr]
-    const USER_NOTIFICATION: &'static str = "user:notification";
+    #[allow(non_snake_case)]
+    fn USER_NOTIFICATION(py: Python<'_>) -> Py<PyString> {
+        PyString::intern(py, amplifier_core::events::USER_NOTIFICATION).unbind()
+    }
 }
@@ -15,6 +15,7 @@
 
 use prost::Message as ProstMessage;
 use pyo3::prelude::*;
+use pyo3::types::{PyList, PyString};
 
 // ---------------------------------------------------------------------------
 // Submodules
@@ -141,121 +142,98 @@ fn _engine(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // -----------------------------------------------------------------------
     // Event constants — expose all 41 canonical events from amplifier_core
+    //
+    // Values are interned so every exposure of an event name (these module
+    // attributes, ALL_EVENTS, RustHookRegistry class attributes) shares one
+    // Python string object.
     // -----------------------------------------------------------------------
+    use amplifier_core::events;
+    let py = m.py();
+    let add_event = |name: &str, value: &str| m.add(name, PyString::intern(py, value));
 
     // Session lifecycle
-    m.add("SESSION_START", amplifier_core::events::SESSION_START)?;
-    m.add("SESSION_END", amplifier_core::events::SESSION_END)?;
-    m.add("SESSION_FORK", amplifier_core::events::SESSION_FORK)?;
-    m.add("SESSION_RESUME", amplifier_core::events::SESSION_RESUME)?;
+    add_event("SESSION_START", events::SESSION_START)?;
+    add_event("SESSION_END", events::SESSION_END)?;
+    add_event("SESSION_FORK", events::SESSION_FORK)?;
+    add_event("SESSION_RESUME", events::SESSION_RESUME)?;
 
     // Prompt lifecycle
-    m.add("PROMPT_SUBMIT", amplifier_core::events::PROMPT_SUBMIT)?;
-    m.add("PROMPT_COMPLETE", amplifier_core::events::PROMPT_COMPLETE)?;
+    add_event("PROMPT_SUBMIT", events::PROMPT_SUBMIT)?;
+    add_event("PROMPT_COMPLETE", events::PROMPT_COMPLETE)?;
 
     // Planning
-    m.add("PLAN_START", amplifier_core::events::PLAN_START)?;
-    m.add("PLAN_END", amplifier_core::events::PLAN_END)?;
+    add_event("PLAN_START", events::PLAN_START)?;
+    add_event("PLAN_END", events::PLAN_END)?;
 
     // Provider calls
-    m.add("PROVIDER_REQUEST", amplifier_core::events::PROVIDER_REQUEST)?;
-    m.add(
-        "PROVIDER_RESPONSE",
-        amplifier_core::events::PROVIDER_RESPONSE,
-    )?;
-    m.add("PROVIDER_RETRY", amplifier_core::events::PROVIDER_RETRY)?;
-    m.add("PROVIDER_ERROR", amplifier_core::events::PROVIDER_ERROR)?;
-    m.add(
-        "PROVIDER_THROTTLE",
-        amplifier_core::events::PROVIDER_THROTTLE,
-    )?;
-    m.add(
+    add_event("PROVIDER_REQUEST", events::PROVIDER_REQUEST)?;
+    add_event("PROVIDER_RESPONSE", events::PROVIDER_RESPONSE)?;
+    add_event("PROVIDER_RETRY", events::PROVIDER_RETRY)?;
+    add_event("PROVIDER_ERROR", events::PROVIDER_ERROR)?;
+    add_event("PROVIDER_THROTTLE", events::PROVIDER_THROTTLE)?;
+    add_event(
         "PROVIDER_TOOL_SEQUENCE_REPAIRED",
-        amplifier_core::events::PROVIDER_TOOL_SEQUENCE_REPAIRED,
+        events::PROVIDER_TOOL_SEQUENCE_REPAIRED,
     )?;
-    m.add("PROVIDER_RESOLVE", amplifier_core::events::PROVIDER_RESOLVE)?;
+    add_event("PROVIDER_RESOLVE", events::PROVIDER_RESOLVE)?;
 
     // LLM events
-    m.add("LLM_REQUEST", amplifier_core::events::LLM_REQUEST)?;
-    m.add("LLM_RESPONSE", amplifier_core::events::LLM_RESPONSE)?;
+    add_event("LLM_REQUEST", events::LLM_REQUEST)?;
+    add_event("LLM_RESPONSE", events::LLM_RESPONSE)?;
 
     // Content block events
-    m.add(
-        "CONTENT_BLOCK_START",
-        amplifier_core::events::CONTENT_BLOCK_START,
-    )?;
-    m.add(
-        "CONTENT_BLOCK_DELTA",
-        amplifier_core::events::CONTENT_BLOCK_DELTA,
-    )?;
-    m.add(
-        "CONTENT_BLOCK_END",
-        amplifier_core::events::CONTENT_BLOCK_END,
-    )?;
+    add_event("CONTENT_BLOCK_START", events::CONTENT_BLOCK_START)?;
+    add_event("CONTENT_BLOCK_DELTA", events::CONTENT_BLOCK_DELTA)?;
+    add_event("CONTENT_BLOCK_END", events::CONTENT_BLOCK_END)?;
 
     // Thinking events
-    m.add("THINKING_DELTA", amplifier_core::events::THINKING_DELTA)?;
-    m.add("THINKING_FINAL", amplifier_core::events::THINKING_FINAL)?;
+    add_event("THINKING_DELTA", events::THINKING_DELTA)?;
+    add_event("THINKING_FINAL", events::THINKING_FINAL)?;
 
     // Tool invocations
-    m.add("TOOL_PRE", amplifier_core::events::TOOL_PRE)?;
-    m.add("TOOL_POST", amplifier_core::events::TOOL_POST)?;
-    m.add("TOOL_ERROR", amplifier_core::events::TOOL_ERROR)?;
+    add_event("TOOL_PRE", events::TOOL_PRE)?;
+    add_event("TOOL_POST", events::TOOL_POST)?;
+    add_event("TOOL_ERROR", events::TOOL_ERROR)?;
 
     // Context management
-    m.add(
-        "CONTEXT_PRE_COMPACT",
-        amplifier_core::events::CONTEXT_PRE_COMPACT,
-    )?;
-    m.add(
-        "CONTEXT_POST_COMPACT",
-        amplifier_core::events::CONTEXT_POST_COMPACT,
-    )?;
-    m.add(
-        "CONTEXT_COMPACTION",
-        amplifier_core::events::CONTEXT_COMPACTION,
-    )?;
-    m.add("CONTEXT_INCLUDE", amplifier_core::events::CONTEXT_INCLUDE)?;
+    add_event("CONTEXT_PRE_COMPACT", events::CONTEXT_PRE_COMPACT)?;
+    add_event("CONTEXT_POST_COMPACT", events::CONTEXT_POST_COMPACT)?;
+    add_event("CONTEXT_COMPACTION", events::CONTEXT_COMPACTION)?;
+    add_event("CONTEXT_INCLUDE", events::CONTEXT_INCLUDE)?;
 
     // Orchestrator lifecycle
-    m.add(
-        "ORCHESTRATOR_COMPLETE",
-        amplifier_core::events::ORCHESTRATOR_COMPLETE,
-    )?;
-    m.add("EXECUTION_START", amplifier_core::events::EXECUTION_START)?;
-    m.add("EXECUTION_END", amplifier_core::events::EXECUTION_END)?;
+    add_event("ORCHESTRATOR_COMPLETE", events::ORCHESTRATOR_COMPLETE)?;
+    add_event("EXECUTION_START", events::EXECUTION_START)?;
+    add_event("EXECUTION_END", events::EXECUTION_END)?;
 
     // User notifications
-    m.add(
-        "USER_NOTIFICATION",
-        amplifier_core::events::USER_NOTIFICATION,
-    )?;
+    add_event("USER_NOTIFICATION", events::USER_NOTIFICATION)?;
 
     // Artifacts
-    m.add("ARTIFACT_WRITE", amplifier_core::events::ARTIFACT_WRITE)?;
-    m.add("ARTIFACT_READ", amplifier_core::events::ARTIFACT_READ)?;
+    add_event("ARTIFACT_WRITE", events::ARTIFACT_WRITE)?;
+    add_event("ARTIFACT_READ", events::ARTIFACT_READ)?;
 
     // Policy / approvals
-    m.add("POLICY_VIOLATION", amplifier_core::events::POLICY_VIOLATION)?;
-    m.add(
-        "APPROVAL_REQUIRED",
-        amplifier_core::events::APPROVAL_REQUIRED,
-    )?;
-    m.add("APPROVAL_GRANTED", amplifier_core::events::APPROVAL_GRANTED)?;
-    m.add("APPROVAL_DENIED", amplifier_core::events::APPROVAL_DENIED)?;
+    add_event("POLICY_VIOLATION", events::POLICY_VIOLATION)?;
+    add_event("APPROVAL_REQUIRED", events::APPROVAL_REQUIRED)?;
+    add_event("APPROVAL_GRANTED", events::APPROVAL_GRANTED)?;
+    add_event("APPROVAL_DENIED", events::APPROVAL_DENIED)?;
 
     // Cancellation lifecycle
-    m.add("CANCEL_REQUESTED", amplifier_core::events::CANCEL_REQUESTED)?;
-    m.add("CANCEL_COMPLETED", amplifier_core::events::CANCEL_COMPLETED)?;
+    add_event("CANCEL_REQUESTED", events::CANCEL_REQUESTED)?;
+    add_event("CANCEL_COMPLETED", events::CANCEL_COMPLETED)?;
 
     // Module lifecycle events
-    m.add(
+    add_event(
         "MODULE_ON_SESSION_READY_FAILED",
-        amplifier_core::events::MODULE_ON_SESSION_READY_FAILED,
+        events::MODULE_ON_SESSION_READY_FAILED,
     )?;
 
     // Aggregate list of all events
-    m.add("ALL_EVENTS", amplifier_core::events::ALL_EVENTS.to_vec())?;
+    let all_events = events::ALL_EVENTS
+        .iter()
+        .map(|event| PyString::intern(py, event));
+    m.add("ALL_EVENTS", PyList::new(py, all_events)?)?;
 
     // -----------------------------------------------------------------------
     // Capabilities — expose all 16 well-known capability constants
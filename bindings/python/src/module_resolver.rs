@@ -13,10 +13,11 @@ use pyo3::types::PyDict;
 ///
 /// Returns a dict with keys: "transport", "module_type", "artifact_type",
 /// and artifact-specific keys ("artifact_path", "endpoint", "package_name").
+///
+/// The manifest read and parse run with the GIL released.
 #[pyfunction]
 pub(crate) fn resolve_module(py: Python<'_>, path: String) -> PyResult<Py<PyDict>> {
-    let manifest = amplifier_core::module_resolver::resolve_module(std::path::Path::new(&path))
-        .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("{e}")))?;
+    let manifest = resolve_manifest(py, &path)?;
 
     let dict = PyDict::new(py);
     let transport_str = match manifest.transport {
@@ -78,8 +79,7 @@ pub(crate) const RUST_TRANSPORT_ERROR_MSG: &str =
 #[cfg(feature = "wasm")]
 #[pyfunction]
 pub(crate) fn load_wasm_from_path(py: Python<'_>, path: String) -> PyResult<Py<PyDict>> {
-    let manifest = amplifier_core::module_resolver::resolve_module(std::path::Path::new(&path))
-        .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("{e}")))?;
+    let manifest = resolve_manifest(py, &path)?;
 
     if manifest.transport == amplifier_core::transport::Transport::Rust {
         return Err(PyErr::new::<PyValueError, _>(RUST_TRANSPORT_ERROR_MSG));
@@ -92,17 +92,40 @@ pub(crate) fn load_wasm_from_path(py: Python<'_>, path: String) -> PyResult<Py<P
         )));
     }
 
-    let engine = amplifier_core::wasm_engine::WasmEngine::new().map_err(|e| {
-        PyErr::new::<PyRuntimeError, _>(format!("WASM engine creation failed: {e}"))
-    })?;
-
     let coordinator = std::sync::Arc::new(amplifier_core::Coordinator::new_for_test());
-    let loaded =
-        amplifier_core::module_resolver::load_module(&manifest, engine.inner(), Some(coordinator))
-            .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Module loading failed: {e}")))?;
+    let loaded = load_wasm_module(py, &manifest, coordinator)?;
 
     let dict = PyDict::new(py);
     dict.set_item("status", "loaded")?;
     dict.set_item("module_type", loaded.variant_name())?;
     Ok(dict.unbind())
 }
+
+/// Read and parse the module manifest at `path` without holding the GIL.
+pub(crate) fn resolve_manifest(
+    py: Python<'_>,
+    path: &str,
+) -> PyResult<amplifier_core::module_resolver::ModuleManifest> {
+    py.detach(|| {
+        amplifier_core::module_resolver::resolve_module(std::path::Path::new(path))
+            .map_err(|e| e.to_string())
+    })
+    .map_err(PyErr::new::<PyRuntimeError, _>)
+}
+
+/// Create a WASM engine and compile/instantiate the module described by
+/// `manifest`, with the GIL released for the whole (CPU-heavy) step.
+#[cfg(feature = "wasm")]
+pub(crate) fn load_wasm_module(
+    py: Python<'_>,
+    manifest: &amplifier_core::module_resolver::ModuleManifest,
+    coordinator: std::sync::Arc<amplifier_core::Coordinator>,
+) -> PyResult<amplifier_core::module_resolver::LoadedModule> {
+    py.detach(|| {
+        let engine = amplifier_core::wasm_engine::WasmEngine::new()
+            .map_err(|e| format!("WASM engine creation failed: {e}"))?;
+        amplifier_core::module_resolver::load_module(manifest, engine.inner(), Some(coordinator))
+            .map_err(|e| format!("Module loading failed: {e}"))
+    })
+    .map_err(PyErr::new::<PyRuntimeError, _>)
+}
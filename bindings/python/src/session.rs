@@ -2,13 +2,16 @@
 // PySession — wraps amplifier_core::Session
 // ---------------------------------------------------------------------------
 
+use std::collections::HashMap;
 use std::sync::Arc;
 
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
 use serde_json::Value;
 
+use crate::coordinator::PyCoordinator;
 use crate::helpers::{json_dumps_safe, wrap_future_as_coroutine};
 use crate::hooks::PyHookRegistry;
 
@@ -21,8 +24,8 @@ use crate::hooks::PyHookRegistry;
 /// Hybrid approach: the Session creates and owns a `PyCoordinator` internally.
 /// `initialize()` delegates to a Python helper (`_session_init.py`) that calls
 /// the Python loader to load modules from config.
-/// `execute(prompt)` delegates to a Python helper (`_session_exec.py`) that
-/// calls the orchestrator.
+/// `execute(prompt)` reads the mount points in Rust and calls the
+/// orchestrator's `execute()` directly.
 /// `cleanup()` runs the coordinator's cleanup functions.
 ///
 /// Matches the Python `AmplifierSession` constructor signature:
@@ -44,6 +47,9 @@ pub(crate) struct PySession {
     cached_session_id: String,
     /// Cached parent_id.
     cached_parent_id: Option<String>,
+    /// Whether `session.raw` was set in the config at construction; read
+    /// once here instead of on every execute().
+    raw_config: bool,
 }
 
 #[pymethods]
@@ -112,6 +118,12 @@ impl PySession {
         let json_str: String = json_dumps_safe(py, config.as_any())?;
         let value: Value = serde_json::from_str(&json_str)
             .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Invalid config JSON: {e}")))?;
+        // The coordinator's kernel config is the same top-level map; take it
+        // from the parsed value instead of dumping the dict to JSON again.
+        let coordinator_config: HashMap<String, Value> = match &value {
+            Value::Object(map) => map.clone().into_iter().collect(),
+            _ => HashMap::new(),
+        };
         let session_config = amplifier_core::SessionConfig::from_value(value)
             .map_err(|e| PyErr::new::<PyValueError, _>(format!("Invalid session config: {e}")))?;
 
@@ -127,9 +139,10 @@ impl PySession {
         let actual_session_id = session.session_id().to_string();
         let actual_parent_id = session.parent_id().map(|s| s.to_string());
 
-        // ---- Create a "fake session" Python object for coordinator construction ----
-        // The PyCoordinator::new() expects a Python object with .session_id,
-        // .parent_id, .config attributes. We create a simple namespace object.
+        // ---- Create a "fake session" Python object for the coordinator ----
+        // coordinator.session must be a Python object with .session_id,
+        // .parent_id, .config attributes until initialize() swaps in the real
+        // session. We create a simple namespace object.
         let types_mod = py.import("types")?;
         let ns_cls = types_mod.getattr("SimpleNamespace")?;
         let kwargs = PyDict::new(py);
@@ -142,18 +155,17 @@ impl PySession {
         // RustCoordinator now has process_hook_result() and cleanup()
         // with fatal-exception logic built in — no Python wrapper needed.
         let coord_any: Py<PyAny> = {
-            let engine = py.import("amplifier_core._engine")?;
-            let coord_cls = engine.getattr("RustCoordinator")?;
-            let coord_kwargs = PyDict::new(py);
-            coord_kwargs.set_item("session", fake_session.clone())?;
-            if let Some(ref approval) = approval_system {
-                coord_kwargs.set_item("approval_system", approval)?;
-            }
-            if let Some(ref display) = display_system {
-                coord_kwargs.set_item("display_system", display)?;
-            }
-            let coord = coord_cls.call((), Some(&coord_kwargs))?;
-            coord.unbind()
+            let coordinator = PyCoordinator::from_parts(
+                py,
+                actual_session_id.clone(),
+                actual_parent_id.clone(),
+                config.clone().into_any().unbind(),
+                fake_session.unbind(),
+                coordinator_config,
+                approval_system,
+                display_system,
+            )?;
+            Py::new(py, coordinator)?.into_any()
         };
 
         // ---- Set default fields on the hook registry ----
@@ -180,6 +192,7 @@ impl PySession {
             is_resumed,
             cached_session_id: actual_session_id,
             cached_parent_id: actual_parent_id,
+            raw_config: raw_field_configured(config)?,
         })
     }
 
@@ -336,8 +349,8 @@ impl PySession {
     /// 1. Checks initialization flag (error if not initialized)
     /// 2. Emits pre-execution events (session:start or session:resume)
     ///    with optional `raw` field when session.raw=true
-    /// 3. Delegates orchestrator call to `_session_exec.run_orchestrator()`
-    ///    via `into_future` (Python handles mount point access + kwargs)
+    /// 3. Calls `orchestrator.execute()` with the mounted context, providers,
+    ///    tools and hooks, awaiting it via `into_future`
     /// 4. Checks cancellation after execution
     /// 5. Emits cancel:completed event if cancelled
     /// 6. Returns the result string
@@ -352,14 +365,8 @@ impl PySession {
             }
         }
 
-        // Step 2: Prepare the Python orchestrator coroutine (we have the GIL here)
-        let helper = py.import("amplifier_core._session_exec")?;
-        let run_fn = helper.getattr("run_orchestrator")?;
-        let raw_fn = helper.getattr("emit_raw_field_if_configured")?;
-
-        // Prepare the orchestrator call coroutine
-        let orch_coro = run_fn.call1((self.coordinator.bind(py), &prompt))?;
-        let orch_coro_py: Py<PyAny> = orch_coro.unbind();
+        // Step 2: The orchestrator call itself is built in step 3c, after the
+        // lifecycle events, straight from the coordinator's mount points.
 
         // Determine event name based on is_resumed
         let event_base = if self.is_resumed {
@@ -368,14 +375,14 @@ impl PySession {
             "session:start"
         };
 
-        // Prepare raw-field emission coroutine (no-op if session.raw=false)
-        let raw_coro = raw_fn.call1((
-            self.coordinator.bind(py),
-            self.config.bind(py),
-            &self.cached_session_id,
-            event_base,
-        ))?;
-        let debug_coro_py: Py<PyAny> = raw_coro.unbind();
+        // Snapshot the config for the session:config event only when
+        // session.raw is set. Redaction happens on the tokio side below, so
+        // the Python GIL is held just for this one serialization.
+        let raw_config_json: Option<String> = if self.raw_config {
+            Some(json_dumps_safe(py, self.config.bind(py).as_any())?)
+        } else {
+            None
+        };
 
         // Get the inner HookRegistry for direct Rust emit (avoids PyO3 Future/coroutine mismatch:
         // calling a #[pymethods] fn that uses future_into_py returns a Future object, but
@@ -386,10 +393,10 @@ impl PySession {
             let hook_registry = hooks.extract::<PyRef<PyHookRegistry>>()?;
             hook_registry.inner.clone()
         };
-        let pre_event_data = serde_json::json!({
-            "session_id": self.cached_session_id,
-            "parent_id": self.cached_parent_id,
-        });
+        // The lifecycle payload is only built on the one execute() call that
+        // emits it; later turns just carry the two ids.
+        let session_id = self.cached_session_id.clone();
+        let parent_id = self.cached_parent_id.clone();
 
         // Clone references for the async block
         let coordinator = self.coordinator.clone_ref(py);
@@ -416,41 +423,50 @@ impl PySession {
                     // mismatch that occurs when going through the Python PyO3 bridge
                     // (future_into_py returns a Future object, but into_future()
                     // expects a native coroutine).
+                    let pre_event_data = serde_json::json!({
+                        "session_id": session_id,
+                        "parent_id": parent_id,
+                    });
                     hooks_inner.emit(event_base, pre_event_data).await;
                 }
 
-                // 3b: Emit debug events (delegates to Python for redact_secrets/truncate_values)
-                let debug_future = Python::try_attach(|py| {
-                    pyo3_async_runtimes::tokio::into_future(debug_coro_py.into_bound(py))
-                })
-                .ok_or_else(|| {
-                    PyErr::new::<PyRuntimeError, _>("Failed to attach to Python runtime")
-                })?
-                .map_err(|e| {
-                    PyErr::new::<PyRuntimeError, _>(format!(
-                        "Failed to convert debug event coroutine: {e}"
-                    ))
-                })?;
-
-                debug_future.await.map_err(|e| {
-                    PyErr::new::<PyRuntimeError, _>(format!("Debug event emission failed: {e}"))
-                })?;
+                // 3b: Emit session:config with the redacted raw config. Parsing
+                // and redaction run here without the GIL; the payload matches
+                // _session_exec.emit_raw_field_if_configured().
+                if let Some(raw_config_json) = raw_config_json {
+                    let mut raw: Value = serde_json::from_str(&raw_config_json).map_err(|e| {
+                        PyErr::new::<PyRuntimeError, _>(format!(
+                            "Debug event emission failed: invalid config JSON: {e}"
+                        ))
+                    })?;
+                    amplifier_core::redaction::redact_secrets(&mut raw);
+                    hooks_inner
+                        .emit(
+                            "session:config",
+                            serde_json::json!({
+                                "session_id": session_id,
+                                "raw": raw,
+                            }),
+                        )
+                        .await;
+                }
 
-                // 3c: Call the Python orchestrator (mount point access + orchestrator.execute())
-                let orch_future = Python::try_attach(|py| {
-                    pyo3_async_runtimes::tokio::into_future(orch_coro_py.into_bound(py))
+                // 3c: Call orchestrator.execute() with the mounted modules. A
+                // synchronous error from the call is reported like one raised
+                // while awaiting it.
+                let orch_call = Python::try_attach(|py| {
+                    orchestrator_execute(coordinator.bind(py), &prompt)
+                        .and_then(pyo3_async_runtimes::tokio::into_future)
                 })
                 .ok_or_else(|| {
                     PyErr::new::<PyRuntimeError, _>("Failed to attach to Python runtime")
-                })?
-                .map_err(|e| {
-                    PyErr::new::<PyRuntimeError, _>(format!(
-                        "Failed to convert orchestrator coroutine: {e}"
-                    ))
                 })?;
 
                 // Await orchestrator execution outside GIL
-                let orch_result = orch_future.await;
+                let orch_result = match orch_call {
+                    Ok(orch_future) => orch_future.await,
+                    Err(e) => Err(e),
+                };
 
                 // 3d: Check cancellation and emit cancel:completed if needed
                 let is_cancelled = Python::try_attach(|py| -> PyResult<bool> {
@@ -688,6 +704,14 @@ impl PySession {
     /// Async context manager entry: initializes the session and returns self.
     fn __aenter__<'py>(slf: Bound<'py, Self>) -> PyResult<Bound<'py, PyAny>> {
         let py = slf.py();
+        // Fast path: an already-initialized session has nothing to await, so
+        // hand back a ready coroutine instead of going through initialize().
+        if slf.borrow().inner.blocking_lock().is_initialized() {
+            return py
+                .import("amplifier_core._async_compat")?
+                .getattr(intern!(py, "_ready"))?
+                .call1((&slf,));
+        }
         // Create a Python wrapper coroutine that initializes then returns self
         let helper = py.import("amplifier_core._session_init")?;
         let aenter_fn = helper.getattr("_session_aenter")?;
@@ -696,6 +720,9 @@ impl PySession {
     }
 
     /// Async context manager exit: runs cleanup.
+    ///
+    /// Returns the `cleanup()` coroutine itself, so `async with` exit costs
+    /// no extra Python frame.
     fn __aexit__<'py>(
         &self,
         py: Python<'py>,
@@ -706,3 +733,78 @@ impl PySession {
         self.cleanup(py)
     }
 }
+
+/// Whether `config["session"]["raw"]` is truthy, i.e. whether execute()
+/// should emit a `session:config` event carrying the redacted config.
+fn raw_field_configured(config: &Bound<'_, PyDict>) -> PyResult<bool> {
+    let py = config.py();
+    let Some(session_config) = config.get_item(intern!(py, "session"))? else {
+        return Ok(false);
+    };
+    let Ok(session_config) = session_config.cast_into::<PyDict>() else {
+        return Ok(false);
+    };
+    match session_config.get_item(intern!(py, "raw"))? {
+        Some(raw) => raw.is_truthy(),
+        None => Ok(false),
+    }
+}
+
+/// Start `orchestrator.execute(...)` for one turn and return its awaitable.
+///
+/// Reads the mount points straight from the `PyCoordinator` instead of going
+/// through `_session_exec.run_orchestrator()`, which made a `coordinator.get()`
+/// call per mount point from Python. The keyword arguments are the same.
+/// Without a mounted orchestrator it falls back to that helper, so the error
+/// raised is unchanged.
+fn orchestrator_execute<'py>(
+    coordinator: &Bound<'py, PyAny>,
+    prompt: &str,
+) -> PyResult<Bound<'py, PyAny>> {
+    let py = coordinator.py();
+    // Copy the handles out so no PyRef borrow is held across the call: a
+    // sync execute() may mount or unmount modules on the coordinator.
+    let (mount_points, hooks) = {
+        let coord = coordinator.cast::<PyCoordinator>()?.borrow();
+        (
+            coord.mount_points.bind(py).clone(),
+            coord.py_hooks.bind(py).clone(),
+        )
+    };
+
+    let orchestrator = match mount_points.get_item(intern!(py, "orchestrator"))? {
+        Some(orchestrator) if !orchestrator.is_none() => orchestrator,
+        _ => {
+            return py
+                .import("amplifier_core._session_exec")?
+                .getattr(intern!(py, "run_orchestrator"))?
+                .call1((coordinator, prompt));
+        }
+    };
+    let context = mount_points
+        .get_item(intern!(py, "context"))?
+        .unwrap_or_else(|| py.None().into_bound(py));
+    // Matches `coordinator.get("providers") or {}` in run_orchestrator().
+    let mounted_or_empty = |key: &Bound<'py, PyString>| -> PyResult<Bound<'py, PyAny>> {
+        match mount_points.get_item(key)? {
+            Some(modules) if modules.is_truthy()? => Ok(modules),
+            _ => Ok(PyDict::new(py).into_any()),
+        }
+    };
+
+    let kwargs = PyDict::new(py);
+    kwargs.set_item(intern!(py, "prompt"), prompt)?;
+    kwargs.set_item(intern!(py, "context"), context)?;
+    kwargs.set_item(
+        intern!(py, "providers"),
+        mounted_or_empty(intern!(py, "providers"))?,
+    )?;
+    kwargs.set_item(
+        intern!(py, "tools"),
+        mounted_or_empty(intern!(py, "tools"))?,
+    )?;
+    kwargs.set_item(intern!(py, "hooks"), hooks)?;
+    kwargs.set_item(intern!(py, "coordinator"), coordinator)?;
+
+    orchestrator.call_method(intern!(py, "execute"), (), Some(&kwargs))
+}
@@ -126,6 +126,19 @@ fn json_dumps_safe_signature_compiles() {
     let _: fn(Python<'_>, &Bound<'_, PyAny>) -> PyResult<String> = crate::helpers::json_dumps_safe;
 }
 
+/// Verify `value_to_py` exists in helpers with the expected signature.
+///
+/// Signature: `fn(Python<'py>, &Value) -> PyResult<Bound<'py, PyAny>>`.
+#[test]
+fn value_to_py_signature_compiles() {
+    fn _assert_signature<'py>(
+        py: Python<'py>,
+        value: &serde_json::Value,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        crate::helpers::value_to_py(py, value)
+    }
+}
+
 /// Structural guard: no raw `json.dumps()` calls outside `helpers.rs`.
 ///
 /// All `json.dumps()` at the Python/Rust FFI boundary must go through
@@ -762,8 +762,7 @@ pub(crate) fn load_and_mount_wasm(
     coordinator: &PyCoordinator,
     path: String,
 ) -> PyResult<Py<PyDict>> {
-    let manifest = amplifier_core::module_resolver::resolve_module(std::path::Path::new(&path))
-        .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("{e}")))?;
+    let manifest = crate::module_resolver::resolve_manifest(py, &path)?;
 
     if manifest.transport != amplifier_core::transport::Transport::Wasm {
         return Err(PyErr::new::<PyValueError, _>(format!(
@@ -772,18 +771,9 @@ pub(crate) fn load_and_mount_wasm(
         )));
     }
 
-    let engine = amplifier_core::wasm_engine::WasmEngine::new().map_err(|e| {
-        PyErr::new::<PyRuntimeError, _>(format!("WASM engine creation failed: {e}"))
-    })?;
-
     // Use the real coordinator's inner Arc<Coordinator> for orchestrator modules
     let rust_coordinator = coordinator.inner.clone();
-    let loaded = amplifier_core::module_resolver::load_module(
-        &manifest,
-        engine.inner(),
-        Some(rust_coordinator),
-    )
-    .map_err(|e| PyErr::new::<PyRuntimeError, _>(format!("Module loading failed: {e}")))?;
+    let loaded = crate::module_resolver::load_wasm_module(py, &manifest, rust_coordinator)?;
 
     let dict = PyDict::new(py);
     dict.set_item("module_type", loaded.variant_name())?;
@@ -3,8 +3,6 @@
 These tests validate the PyO3 bindings for amplifier_core::CancellationToken.
 """
 
-import asyncio
-
 import pytest
 
 from amplifier_core._engine import RustCancellationToken
@@ -14,7 +14,7 @@ import inspect
 import json
 import pytest
 
-from amplifier_core._engine import RustSession, RustHookRegistry
+from amplifier_core._engine import RustHookRegistry
 
 
 class TestAsyncMethodsReturnCoroutines:
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 
 def test_grpc_loader_module_exists():
     """The loader_grpc module is importable."""
@@ -82,6 +84,42 @@ def test_grpc_tool_bridge_serialize_input_with_decimal():
     assert json.loads(data)["cost"] == "1.23"
 
 
+def test_grpc_tool_bridge_serialize_input_non_str_keys():
+    """Non-string keys are stringified, matching stdlib json.dumps."""
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        channel=None,
+    )
+    data, _ = bridge._serialize_input({"ids": {1: "a"}, "name": "caf\u00e9"})
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {"ids": {"1": "a"}, "name": "caf\u00e9"}
+
+
+def test_grpc_tool_bridge_serialize_input_matches_stdlib_edge_cases():
+    """Big ints and NaN encode as the stdlib json module does."""
+    import math
+
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        channel=None,
+    )
+    data, _ = bridge._serialize_input({"big": 2**70, "items": [float("nan"), None]})
+    decoded = json.loads(data)
+    assert decoded["big"] == 2**70
+    assert math.isnan(decoded["items"][0])
+    assert decoded["items"][1] is None
+
+
 def test_grpc_tool_bridge_deserialize_output():
     """GrpcToolBridge._deserialize_output decodes JSON bytes to dict."""
     from amplifier_core.loader_grpc import GrpcToolBridge
@@ -134,3 +172,376 @@ def test_load_grpc_module_default_endpoint():
     }
     endpoint = _extract_endpoint(meta, "my-tool")
     assert endpoint == "localhost:50051"
+
+
+@pytest.mark.parametrize(
+    ("spec", "field"),
+    [
+        ({"description": "no name"}, "'name'"),
+        ({"name": ""}, "'name'"),
+        ({"name": "search", "parameters_json": "{not json"}, "'parameters_json'"),
+        (
+            {"name": "search", "parameters_json": {"type": "object"}},
+            "'parameters_json'",
+        ),
+    ],
+)
+def test_validate_spec_rejects_malformed_spec(spec, field):
+    """A malformed [grpc.spec] names the module path and the bad field."""
+    from pathlib import Path
+
+    from amplifier_core.loader_grpc import _validate_spec
+
+    module_path = Path("/modules/tool-search")
+    with pytest.raises(ValueError) as excinfo:
+        _validate_spec(spec, "tool-search", module_path)
+
+    message = str(excinfo.value)
+    assert str(module_path / "amplifier.toml") in message
+    assert field in message
+
+
+def test_validate_spec_accepts_complete_spec():
+    """A spec with a name and parseable parameters_json passes through."""
+    from amplifier_core.loader_grpc import _validate_spec
+
+    spec = {"name": "search", "parameters_json": '{"type": "object"}'}
+    assert _validate_spec(spec, "tool-search") is spec
+
+
+@pytest.mark.asyncio
+async def test_load_grpc_module_rejects_malformed_spec():
+    """load_grpc_module raises ValueError, not KeyError, for a spec without name."""
+    from amplifier_core.loader_grpc import load_grpc_module
+
+    meta = {"grpc": {"spec": {"description": "no name"}}}
+    with pytest.raises(ValueError, match="tool-search"):
+        await load_grpc_module("tool-search", None, meta, None)
+
+
+def test_extract_content_type_defaults_to_json():
+    """Without grpc.content_type in meta, tool payloads are JSON."""
+    from amplifier_core.loader_grpc import _extract_content_type
+
+    assert _extract_content_type({"grpc": {}}, "my-tool") == "application/json"
+    meta = {"grpc": {"content_type": "application/msgpack"}}
+    assert _extract_content_type(meta, "my-tool") == "application/msgpack"
+
+
+def test_grpc_tool_bridge_msgpack_roundtrip():
+    """A bridge configured for msgpack encodes input and decodes output as msgpack."""
+    msgspec = pytest.importorskip("msgspec")
+    from decimal import Decimal
+
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        channel=None,
+        content_type="application/msgpack",
+    )
+    data, content_type = bridge._serialize_input(
+        {"query": "hi", "cost": Decimal("1.5")}
+    )
+    assert content_type == "application/msgpack"
+    assert msgspec.msgpack.decode(data) == {"query": "hi", "cost": "1.5"}
+
+    output = msgspec.msgpack.encode({"result": [1, 2]})
+    assert bridge._deserialize_output(output, "application/msgpack") == {
+        "result": [1, 2]
+    }
+
+
+def test_grpc_tool_bridge_parses_parameters_once():
+    """get_spec() reuses the parameters parsed at construction."""
+    from unittest.mock import patch
+
+    from amplifier_core import loader_grpc
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    with patch.object(
+        loader_grpc, "_json_loads", wraps=loader_grpc._json_loads
+    ) as json_loads:
+        bridge = GrpcToolBridge(
+            name="search",
+            description="Search the web",
+            parameters_json='{"type": "object"}',
+            endpoint="localhost:50052",
+            channel=None,
+        )
+        bridge.get_spec()
+        assert bridge.get_spec()["parameters"] == {"type": "object"}
+    assert json_loads.call_count == 1
+
+
+def test_grpc_tool_bridge_get_spec_returns_copy():
+    """Mutating a returned spec does not change later get_spec() results."""
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    bridge = GrpcToolBridge(
+        name="search",
+        description="Search the web",
+        parameters_json='{"type": "object", "properties": {}}',
+        endpoint="localhost:50052",
+        channel=None,
+    )
+    spec = bridge.get_spec()
+    spec["name"] = "other"
+    spec["parameters"]["properties"]["q"] = {"type": "string"}
+    assert bridge.get_spec() == {
+        "name": "search",
+        "description": "Search the web",
+        "parameters": {"type": "object", "properties": {}},
+    }
+    assert not hasattr(bridge, "__dict__")
+
+
+def test_extract_pool_size():
+    """grpc.pool_size sets the channel count; default 4, never below 1."""
+    from amplifier_core.loader_grpc import _extract_pool_size
+
+    assert _extract_pool_size({}, "my-tool") == 4
+    assert _extract_pool_size({"grpc": {"pool_size": 2}}, "my-tool") == 2
+    assert _extract_pool_size({"grpc": {"pool_size": 0}}, "my-tool") == 1
+
+
+class _FakeStub:
+    def __init__(self, calls: list, label: str) -> None:
+        self._calls = calls
+        self._label = label
+
+    async def Execute(self, request):  # noqa: N802 - gRPC method name
+        self._calls.append(self._label)
+
+        class _Response:
+            success = True
+            output = b'{"ok": true}'
+            content_type = "application/json"
+            error = ""
+
+        return _Response()
+
+
+class _FakeChannel:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_grpc_tool_bridge_round_robins_pooled_stubs():
+    """execute() spreads calls over the pooled stubs in order."""
+    pytest.importorskip("google.protobuf")
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    calls: list[str] = []
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        channel=None,
+    )
+    bridge._stubs = [_FakeStub(calls, "a"), _FakeStub(calls, "b")]
+
+    for _ in range(3):
+        result = await bridge.execute(query="x")
+        assert result["success"] is True
+
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_grpc_tool_bridge_cleanup_closes_pooled_channels():
+    """cleanup() closes the primary channel and every pooled channel."""
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    channels = [_FakeChannel() for _ in range(3)]
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        channel=channels[0],
+    )
+    bridge._pool_channels = channels[1:]
+
+    await bridge.cleanup()
+
+    assert all(c.closed for c in channels)
+
+
+def test_extract_channel_options_applies_overrides():
+    """grpc.options overrides individual defaults and adds new options."""
+    from amplifier_core.loader_grpc import _extract_channel_options
+
+    defaults = dict(_extract_channel_options({}, "my-tool"))
+    assert defaults["grpc.keepalive_time_ms"] == 300000
+    # Stock servers reject pings on idle connections.
+    assert "grpc.keepalive_permit_without_calls" not in defaults
+    assert "grpc.http2.max_pings_without_data" not in defaults
+    assert defaults["grpc.max_receive_message_length"] == 64 * 1024 * 1024
+
+    meta = {
+        "grpc": {
+            "options": {
+                "grpc.keepalive_time_ms": 10000,
+                "grpc.primary_user_agent": "x",
+            }
+        }
+    }
+    options = dict(_extract_channel_options(meta, "my-tool"))
+    assert options["grpc.keepalive_time_ms"] == 10000
+    assert options["grpc.primary_user_agent"] == "x"
+    assert options["grpc.keepalive_timeout_ms"] == 5000
+
+
+def test_open_channels_gives_each_channel_its_own_connection(monkeypatch):
+    """Every pooled channel opts out of the shared global subchannel pool."""
+    grpc = pytest.importorskip("grpc")
+    pytest.importorskip("amplifier_core._grpc_gen.amplifier_module_pb2_grpc")
+    from amplifier_core.loader_grpc import _open_channels
+
+    built: list[tuple[str, list]] = []
+
+    def insecure_channel(target, options=None):
+        built.append((target, options))
+        return _FakeChannel()
+
+    monkeypatch.setattr(grpc.aio, "insecure_channel", insecure_channel)
+
+    channels, stubs = _open_channels(
+        "localhost:50052", 3, [("grpc.keepalive_time_ms", 300000)]
+    )
+
+    assert len(channels) == len(stubs) == 3
+    assert len(built) == 3
+    for target, options in built:
+        assert target == "localhost:50052"
+        assert dict(options) == {
+            "grpc.keepalive_time_ms": 300000,
+            "grpc.use_local_subchannel_pool": 1,
+        }
+
+
+@pytest.mark.asyncio
+async def test_load_grpc_module_closes_channels_when_get_spec_fails(monkeypatch):
+    """A failing GetSpec closes every channel the eager path opened."""
+    pytest.importorskip("grpc")
+    pytest.importorskip("amplifier_core._grpc_gen.amplifier_module_pb2_grpc")
+    from amplifier_core import loader_grpc
+
+    class _SpecFailingStub:
+        async def GetSpec(self, request):  # noqa: N802 - gRPC method name
+            raise RuntimeError("unreachable")
+
+    channels = [_FakeChannel() for _ in range(2)]
+    monkeypatch.setattr(
+        loader_grpc,
+        "_open_channels",
+        lambda endpoint, pool_size, options: (
+            channels,
+            [_SpecFailingStub() for _ in channels],
+        ),
+    )
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        await loader_grpc.load_grpc_module("my-tool", None, {}, None)
+
+    assert all(c.closed for c in channels)
+
+
+@pytest.mark.asyncio
+async def test_grpc_tool_bridge_connects_on_first_execute():
+    """A bridge given a connect callable opens its pool once, on first use."""
+    pytest.importorskip("google.protobuf")
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    calls: list[str] = []
+    connects = 0
+
+    def connect():
+        nonlocal connects
+        connects += 1
+        return [_FakeChannel(), _FakeChannel()], [
+            _FakeStub(calls, "a"),
+            _FakeStub(calls, "b"),
+        ]
+
+    bridge = GrpcToolBridge(
+        name="search",
+        description="Search the web",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+        connect=connect,
+    )
+    assert connects == 0
+    assert bridge.get_spec()["name"] == "search"
+
+    await bridge.execute(query="x")
+    await bridge.execute(query="y")
+
+    assert connects == 1
+    assert calls == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_grpc_tool_bridge_reports_unencodable_input():
+    """Input that cannot be encoded becomes an error result, not an exception."""
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    calls: list[str] = []
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+    )
+    bridge._stub = _FakeStub(calls, "a")
+    circular: list = []
+    circular.append(circular)
+
+    result = await bridge.execute(items=circular)
+
+    assert result["success"] is False
+    assert result["output"] is None
+    assert "Failed to encode tool input" in result["error"]["message"]
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_grpc_tool_bridge_reports_rpc_error_code():
+    """An RPC failure becomes an error result carrying the status code."""
+    grpc = pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from amplifier_core.loader_grpc import GrpcToolBridge
+
+    class _FailingStub:
+        async def Execute(self, request):  # noqa: N802 - gRPC method name
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNAVAILABLE,
+                initial_metadata=grpc.aio.Metadata(),
+                trailing_metadata=grpc.aio.Metadata(),
+                details="connection refused",
+            )
+
+    bridge = GrpcToolBridge(
+        name="test",
+        description="test",
+        parameters_json="{}",
+        endpoint="localhost:50052",
+    )
+    bridge._stub = _FailingStub()
+
+    result = await bridge.execute(query="x")
+
+    assert result == {
+        "success": False,
+        "output": None,
+        "error": {"code": "UNAVAILABLE", "message": "connection refused"},
+    }
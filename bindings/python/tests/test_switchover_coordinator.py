@@ -13,6 +13,10 @@ from amplifier_core._engine import (
 
 # ---- Helpers ----
 
+# Shared identity sentinel for single-slot mount/property tests. Each test
+# builds its own coordinator, so one module-level object is enough.
+_SENTINEL = object()
+
 
 class FakeSession:
     """Minimal session object for coordinator construction."""
@@ -122,7 +126,7 @@ async def test_mount_tool():
 async def test_mount_orchestrator():
     """mount() sets a single-slot module for orchestrator."""
     coord = RustCoordinator(FakeSession())
-    orch = object()
+    orch = _SENTINEL
     await coord.mount("orchestrator", orch)
     assert coord.mount_points["orchestrator"] is orch
 
@@ -131,7 +135,7 @@ async def test_mount_orchestrator():
 async def test_mount_context():
     """mount() sets a single-slot module for context."""
     coord = RustCoordinator(FakeSession())
-    ctx = object()
+    ctx = _SENTINEL
     await coord.mount("context", ctx)
     assert coord.mount_points["context"] is ctx
 
@@ -159,7 +163,7 @@ async def test_mount_unknown_raises():
     """mount() raises ValueError for unknown mount points."""
     coord = RustCoordinator(FakeSession())
     with pytest.raises(ValueError, match="Unknown mount point"):
-        await coord.mount("nonexistent", object())
+        await coord.mount("nonexistent", _SENTINEL)
 
 
 @pytest.mark.asyncio
@@ -167,14 +171,14 @@ async def test_mount_hooks_raises():
     """mount() raises ValueError if you try to mount to 'hooks'."""
     coord = RustCoordinator(FakeSession())
     with pytest.raises(ValueError, match="Hooks should be registered"):
-        await coord.mount("hooks", object())
+        await coord.mount("hooks", _SENTINEL)
 
 
 @pytest.mark.asyncio
 async def test_get_single_slot():
     """get() returns a single-slot module (orchestrator, context)."""
     coord = RustCoordinator(FakeSession())
-    orch = object()
+    orch = _SENTINEL
     await coord.mount("orchestrator", orch)
     assert coord.get("orchestrator") is orch
 
@@ -229,7 +233,7 @@ def test_get_unknown_raises():
 async def test_unmount_single_slot():
     """unmount() clears a single-slot mount point."""
     coord = RustCoordinator(FakeSession())
-    await coord.mount("orchestrator", object())
+    await coord.mount("orchestrator", _SENTINEL)
     assert coord.get("orchestrator") is not None
     await coord.unmount("orchestrator")
     assert coord.get("orchestrator") is None
@@ -538,14 +542,14 @@ def test_loader_default_none():
 
 def test_approval_system_from_constructor():
     """approval_system can be passed in constructor."""
-    approval = object()
+    approval = _SENTINEL
     coord = RustCoordinator(FakeSession(), approval_system=approval)
     assert coord.approval_system is approval
 
 
 def test_display_system_from_constructor():
     """display_system can be passed in constructor."""
-    display = object()
+    display = _SENTINEL
     coord = RustCoordinator(FakeSession(), display_system=display)
     assert coord.display_system is display
 
@@ -553,7 +557,7 @@ def test_display_system_from_constructor():
 def test_approval_system_settable():
     """approval_system can be set after construction."""
     coord = RustCoordinator(FakeSession())
-    approval = object()
+    approval = _SENTINEL
     coord.approval_system = approval
     assert coord.approval_system is approval
 
@@ -561,7 +565,7 @@ def test_approval_system_settable():
 def test_display_system_settable():
     """display_system can be set after construction."""
     coord = RustCoordinator(FakeSession())
-    display = object()
+    display = _SENTINEL
     coord.display_system = display
     assert coord.display_system is display
 
@@ -569,7 +573,7 @@ def test_display_system_settable():
 def test_loader_settable():
     """loader can be set after construction."""
     coord = RustCoordinator(FakeSession())
-    loader = object()
+    loader = _SENTINEL
     coord.loader = loader
     assert coord.loader is loader
 
@@ -73,6 +73,16 @@ def test_event_constants_on_class():
     assert RustHookRegistry.USER_NOTIFICATION == "user:notification"
 
 
+def test_event_constants_are_shared_interned_strings():
+    """Class-level event constants are the same objects as the module-level ones."""
+    from amplifier_core import _engine
+
+    assert RustHookRegistry.TOOL_PRE is _engine.TOOL_PRE
+    assert RustHookRegistry.SESSION_START is _engine.SESSION_START
+    assert _engine.TOOL_PRE in _engine.ALL_EVENTS
+    assert any(event is _engine.TOOL_PRE for event in _engine.ALL_EVENTS)
+
+
 # ---------------------------------------------------------------------------
 # Task 3: PyHookHandlerBridge async handler tests (into_future fix)
 # ---------------------------------------------------------------------------
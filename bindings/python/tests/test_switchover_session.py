@@ -41,6 +41,17 @@ def test_session_generates_uuid():
     assert s1.session_id != s2.session_id
 
 
+def test_session_generated_id_is_uuid4():
+    """The generated session ID is a canonical UUID4 string built by the Rust kernel."""
+    import uuid
+
+    config = {"session": {"orchestrator": "loop-basic", "context": "context-simple"}}
+    session_id = RustSession(config=config).session_id
+    parsed = uuid.UUID(session_id)
+    assert parsed.version == 4
+    assert str(parsed) == session_id
+
+
 def test_session_validates_config_empty():
     """Session raises for empty config."""
     with pytest.raises(Exception):
@@ -239,10 +250,12 @@ def test_session_init_has_no_dead_code():
 
 
 def test_session_exec_is_thin_helper():
-    """_session_exec.py must still exist as a thin boundary helper called by Rust.
+    """_session_exec.py must still exist as a thin boundary helper.
 
-    Rust's PySession::execute() imports amplifier_core._session_exec and calls
-    run_orchestrator() and emit_raw_field_if_configured(). CANNOT be deleted.
+    Rust's PySession::execute() calls the orchestrator and emits
+    session:config itself, but falls back to run_orchestrator() when no
+    orchestrator is mounted so the error raised is unchanged. Both helpers
+    stay importable for callers driving a coordinator from Python.
     """
     from amplifier_core._session_exec import run_orchestrator, emit_raw_field_if_configured
 
@@ -254,9 +267,15 @@ def test_collect_helper_is_boundary_helper():
     """_collect_helper.py must still exist as a boundary helper called by Rust.
 
     Rust's PyCoordinator::collect_contributions() imports
-    amplifier_core._collect_helper and calls collect_contributions().
-    CANNOT be deleted without breaking the Rust build.
+    amplifier_core._collect_helper and calls collect_contributions_list()
+    with the already-resolved contributor list. collect_contributions()
+    remains as the dict-taking wrapper. CANNOT be deleted without breaking
+    the Rust build.
     """
-    from amplifier_core._collect_helper import collect_contributions
+    from amplifier_core._collect_helper import (
+        collect_contributions,
+        collect_contributions_list,
+    )
 
     assert callable(collect_contributions)
+    assert callable(collect_contributions_list)
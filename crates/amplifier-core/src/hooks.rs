@@ -39,6 +39,7 @@ use crate::traits::HookHandler;
 // ---------------------------------------------------------------------------
 
 /// A registered handler with its priority and name.
+#[derive(Clone)]
 struct HandlerEntry {
     handler: Arc<dyn HookHandler>,
     priority: i32,
@@ -66,7 +67,11 @@ struct HandlerEntry {
 pub struct HookRegistry {
     /// Handlers keyed by event name, sorted by priority within each event.
     /// Wrapped in `Arc` so unregister closures can safely hold a reference.
-    handlers: Arc<Mutex<HashMap<String, Vec<HandlerEntry>>>>,
+    ///
+    /// Each event's list is an immutable `Arc<[HandlerEntry]>` that
+    /// register/unregister replace wholesale, so `emit()` snapshots it with a
+    /// refcount bump instead of copying every entry.
+    handlers: Arc<Mutex<HashMap<String, Arc<[HandlerEntry]>>>>,
     /// Default fields merged into every `emit()` call.
     defaults: Mutex<Option<Value>>,
     /// Monotonically increasing ID for handler entries.
@@ -120,10 +125,17 @@ impl HookRegistry {
 
         {
             let mut handlers = self.handlers.lock().unwrap();
-            let event_handlers = handlers.entry(event.to_string()).or_default();
-            event_handlers.push(entry);
-            // Keep sorted by priority (lower = higher priority)
-            event_handlers.sort_by_key(|e| e.priority);
+            let mut event_handlers: Vec<HandlerEntry> = handlers
+                .get(event)
+                .map(|entries| entries.to_vec())
+                .unwrap_or_default();
+            // Keep sorted by priority (lower = higher priority) by inserting
+            // after every entry with priority <= ours: a binary search instead
+            // of a full re-sort, and registration order is kept among equal
+            // priorities. emit() iterates the list as-is.
+            let idx = event_handlers.partition_point(|e| e.priority <= priority);
+            event_handlers.insert(idx, entry);
+            handlers.insert(event.to_string(), event_handlers.into());
         }
 
         // The unregister closure holds an Arc clone of the handlers map,
@@ -135,7 +147,13 @@ impl HookRegistry {
         Box::new(move || {
             let mut handlers = handlers_ref.lock().unwrap();
             if let Some(event_handlers) = handlers.get_mut(&event_key) {
-                event_handlers.retain(|e| e.id != id);
+                if event_handlers.iter().any(|e| e.id == id) {
+                    *event_handlers = event_handlers
+                        .iter()
+                        .filter(|e| e.id != id)
+                        .cloned()
+                        .collect();
+                }
             }
         })
     }
@@ -159,36 +177,19 @@ impl HookRegistry {
     /// Action precedence: Deny > AskUser > InjectContext > Modify > Continue
     pub async fn emit(&self, event: &str, data: Value) -> HookResult {
         // Snapshot handlers for this event (avoids holding the lock during async calls).
-        let entries: Vec<(Arc<dyn HookHandler>, String)> = {
-            let handlers = self.handlers.lock().unwrap();
-            match handlers.get(event) {
-                Some(entries) => entries
-                    .iter()
-                    .map(|e| (e.handler.clone(), e.name.clone()))
-                    .collect(),
-                None => {
-                    return HookResult {
-                        action: HookAction::Continue,
-                        data: Some(value_to_map(&data)),
-                        ..Default::default()
-                    };
-                }
-            }
-        };
-
-        if entries.is_empty() {
+        let Some(entries) = self.snapshot(event) else {
             return HookResult {
                 action: HookAction::Continue,
                 data: Some(value_to_map(&data)),
                 ..Default::default()
             };
-        }
+        };
 
         // Merge default fields with event data (event data takes precedence).
         let mut current_data = {
             let defaults = self.defaults.lock().unwrap();
             match defaults.as_ref() {
-                Some(defaults_val) => merge_json(defaults_val, &data),
+                Some(defaults_val) => merge_json(defaults_val, data),
                 None => data,
             }
         };
@@ -208,8 +209,9 @@ impl HookRegistry {
         let mut special_result: Option<HookResult> = None;
         let mut inject_context_results: Vec<HookResult> = Vec::new();
 
-        for (handler, name) in &entries {
-            let result = match handler.handle(event, current_data.clone()).await {
+        for entry in entries.iter() {
+            let name = &entry.name;
+            let result = match entry.handler.handle(event, current_data.clone()).await {
                 Ok(r) => r,
                 Err(e) => {
                     // Error in handler -- log and continue (matches Python behaviour).
@@ -240,20 +242,22 @@ impl HookRegistry {
                 }
             }
 
-            // Collect inject_context for merging at end
-            if result.action == HookAction::InjectContext && result.context_injection.is_some() {
-                inject_context_results.push(result.clone());
-            }
-
-            // Preserve ask_user (only first one -- can't merge approvals)
-            if result.action == HookAction::AskUser && special_result.is_none() {
-                special_result = Some(result);
+            match result.action {
+                // Collect inject_context for merging at end
+                HookAction::InjectContext if result.context_injection.is_some() => {
+                    inject_context_results.push(result);
+                }
+                // Preserve ask_user (only first one -- can't merge approvals)
+                HookAction::AskUser if special_result.is_none() => {
+                    special_result = Some(result);
+                }
+                _ => {}
             }
         }
 
         // Merge inject_context results if any
         if !inject_context_results.is_empty() {
-            let merged_inject = merge_inject_context_results(&inject_context_results);
+            let merged_inject = merge_inject_context_results(inject_context_results);
             if special_result.is_none() {
                 // No ask_user captured -- inject_context wins
                 special_result = Some(merged_inject);
@@ -278,7 +282,8 @@ impl HookRegistry {
     ///
     /// Unlike [`emit()`](Self::emit) which processes action semantics,
     /// this method simply collects `result.data` from all handlers for
-    /// aggregation. Each handler is called with a timeout.
+    /// aggregation. Handlers run concurrently, each with its own timeout;
+    /// the collected data keeps priority order.
     ///
     /// Use for decision events where multiple hooks propose candidates
     /// (e.g., tool resolution, agent selection).
@@ -289,26 +294,28 @@ impl HookRegistry {
         timeout: Duration,
     ) -> Vec<HashMap<String, Value>> {
         // Snapshot handlers
-        let entries: Vec<(Arc<dyn HookHandler>, String)> = {
-            let handlers = self.handlers.lock().unwrap();
-            match handlers.get(event) {
-                Some(entries) => entries
-                    .iter()
-                    .map(|e| (e.handler.clone(), e.name.clone()))
-                    .collect(),
-                None => return Vec::new(),
-            }
+        let Some(entries) = self.snapshot(event) else {
+            return Vec::new();
         };
 
-        if entries.is_empty() {
-            return Vec::new();
-        }
+        // Run every handler concurrently on this task, each under its own
+        // timeout. join_all keeps the results in priority order. Polling in
+        // place (rather than spawning) keeps any task-local state, such as
+        // the Python binding's event-loop locals, visible to the handlers.
+        let calls = entries.iter().map(|entry| {
+            let data = data.clone();
+            async move {
+                let outcome =
+                    tokio::time::timeout(timeout, entry.handler.handle(event, data)).await;
+                (&entry.name, outcome)
+            }
+        });
+        let outcomes = futures::future::join_all(calls).await;
 
-        let mut responses = Vec::new();
+        let mut responses = Vec::with_capacity(outcomes.len());
 
-        for (handler, name) in &entries {
-            let fut = handler.handle(event, data.clone());
-            let result = match tokio::time::timeout(timeout, fut).await {
+        for (name, outcome) in outcomes {
+            let result = match outcome {
                 Ok(Ok(r)) => r,
                 Ok(Err(e)) => {
                     // Handler error -- log and skip
@@ -338,6 +345,26 @@ impl HookRegistry {
         responses
     }
 
+    /// Whether any handler is registered for `event`.
+    ///
+    /// Lets callers skip building an async emit when it would be a no-op.
+    pub fn has_handlers(&self, event: &str) -> bool {
+        self.snapshot(event).is_some()
+    }
+
+    /// Snapshot the handlers registered for `event`, or `None` if there are none.
+    ///
+    /// Shared by [`emit()`](Self::emit) and
+    /// [`emit_and_collect()`](Self::emit_and_collect); the snapshot is an
+    /// `Arc` clone, so the lock is released before any handler runs.
+    fn snapshot(&self, event: &str) -> Option<Arc<[HandlerEntry]>> {
+        let handlers = self.handlers.lock().unwrap();
+        handlers
+            .get(event)
+            .filter(|entries| !entries.is_empty())
+            .cloned()
+    }
+
     /// List registered handlers.
     ///
     /// If `event` is `Some`, only return handlers for that event.
@@ -379,16 +406,17 @@ impl Default for HookRegistry {
 
 /// Merge two JSON values: `base` is overridden by `overlay`.
 /// Both should be objects; non-object values result in `overlay` winning.
-fn merge_json(base: &Value, overlay: &Value) -> Value {
+///
+/// Takes `overlay` by value so its entries are moved into the copy of
+/// `base` rather than cloned a second time.
+fn merge_json(base: &Value, overlay: Value) -> Value {
     match (base, overlay) {
         (Value::Object(base_map), Value::Object(overlay_map)) => {
             let mut merged = base_map.clone();
-            for (k, v) in overlay_map {
-                merged.insert(k.clone(), v.clone());
-            }
+            merged.extend(overlay_map);
             Value::Object(merged)
         }
-        _ => overlay.clone(),
+        (_, overlay) => overlay,
     }
 }
 
@@ -404,13 +432,9 @@ fn value_to_map(value: &Value) -> HashMap<String, Value> {
 ///
 /// Combines injections with `"\n\n"` separator, preserving settings from
 /// the first result (role, ephemeral, suppress_output).
-fn merge_inject_context_results(results: &[HookResult]) -> HookResult {
-    if results.is_empty() {
-        return HookResult::default();
-    }
-
-    if results.len() == 1 {
-        return results[0].clone();
+fn merge_inject_context_results(mut results: Vec<HookResult>) -> HookResult {
+    if results.len() <= 1 {
+        return results.pop().unwrap_or_default();
     }
 
     // Combine all injections
@@ -634,6 +658,28 @@ mod tests {
         }
     }
 
+    /// Handler that returns its label only once every handler sharing the
+    /// barrier has been entered -- it times out if handlers run one at a time.
+    struct BarrierHandler(Arc<tokio::sync::Barrier>, &'static str);
+
+    impl HookHandler for BarrierHandler {
+        fn handle(
+            &self,
+            _event: &str,
+            _data: serde_json::Value,
+        ) -> Pin<Box<dyn Future<Output = Result<HookResult, HookError>> + Send + '_>> {
+            Box::pin(async move {
+                self.0.wait().await;
+                let mut map = HashMap::new();
+                map.insert("label".to_string(), serde_json::json!(self.1));
+                Ok(HookResult {
+                    data: Some(map),
+                    ..Default::default()
+                })
+            })
+        }
+    }
+
     // ---------------------------------------------------------------
     // emit() basic
     // ---------------------------------------------------------------
@@ -684,6 +730,24 @@ mod tests {
         assert_eq!(*order, vec!["high", "low"]);
     }
 
+    #[tokio::test]
+    async fn equal_priority_keeps_registration_order() {
+        let registry = HookRegistry::new();
+        let log = Arc::new(tokio::sync::Mutex::new(Vec::new()));
+
+        for (label, priority) in [("first", 5), ("early", 0), ("second", 5), ("third", 5)] {
+            let handler = Arc::new(LoggingHandler {
+                label,
+                log: log.clone(),
+            });
+            let _ = registry.register("test:event", handler, priority, Some(label.into()));
+        }
+
+        registry.emit("test:event", serde_json::json!({})).await;
+        let order = log.lock().await;
+        assert_eq!(*order, vec!["early", "first", "second", "third"]);
+    }
+
     // ---------------------------------------------------------------
     // Deny short-circuits
     // ---------------------------------------------------------------
@@ -828,6 +892,29 @@ mod tests {
         assert_eq!(handler.call_count(), 1); // Not called again
     }
 
+    #[tokio::test]
+    async fn unregister_keeps_remaining_order() {
+        let registry = HookRegistry::new();
+        let log = Arc::new(tokio::sync::Mutex::new(Vec::new()));
+
+        let mut unregisters = Vec::new();
+        for (label, priority) in [("a", 0), ("b", 5), ("c", 10)] {
+            let handler = Arc::new(LoggingHandler {
+                label,
+                log: log.clone(),
+            });
+            unregisters.push(registry.register("test:event", handler, priority, None));
+        }
+
+        unregisters[1]();
+        registry.emit("test:event", serde_json::json!({})).await;
+        assert_eq!(*log.lock().await, vec!["a", "c"]);
+        assert_eq!(
+            registry.list_handlers(Some("test:event"))["test:event"].len(),
+            2
+        );
+    }
+
     // ---------------------------------------------------------------
     // Default fields
     // ---------------------------------------------------------------
@@ -971,6 +1058,28 @@ mod tests {
         assert_eq!(results[0]["fast"], serde_json::json!(true));
     }
 
+    #[tokio::test]
+    async fn emit_and_collect_runs_handlers_concurrently() {
+        let registry = HookRegistry::new();
+        let barrier = Arc::new(tokio::sync::Barrier::new(2));
+        let first = Arc::new(BarrierHandler(barrier.clone(), "first"));
+        let second = Arc::new(BarrierHandler(barrier, "second"));
+
+        let _ = registry.register("test:event", second, 10, None);
+        let _ = registry.register("test:event", first, 0, None);
+
+        let results = registry
+            .emit_and_collect(
+                "test:event",
+                serde_json::json!({}),
+                std::time::Duration::from_secs(1),
+            )
+            .await;
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0]["label"], serde_json::json!("first"));
+        assert_eq!(results[1]["label"], serde_json::json!("second"));
+    }
+
     // ---------------------------------------------------------------
     // list_handlers
     // ---------------------------------------------------------------
@@ -1000,6 +1109,20 @@ mod tests {
         assert!(!handlers.contains_key("tool:post"));
     }
 
+    #[tokio::test]
+    async fn has_handlers_tracks_registration() {
+        let registry = HookRegistry::new();
+        assert!(!registry.has_handlers("tool:pre"));
+
+        let h = Arc::new(SimpleHandler(HookResult::default()));
+        let unregister = registry.register("tool:pre", h, 0, Some("my-hook".into()));
+        assert!(registry.has_handlers("tool:pre"));
+        assert!(!registry.has_handlers("tool:post"));
+
+        unregister();
+        assert!(!registry.has_handlers("tool:pre"));
+    }
+
     // ---------------------------------------------------------------
     // Event timestamp stamping
     // ---------------------------------------------------------------
@@ -1110,7 +1233,7 @@ mod tests {
             append_to_last_tool_result: true,
             ..Default::default()
         };
-        let merged = merge_inject_context_results(&[r1, r2]);
+        let merged = merge_inject_context_results(vec![r1, r2]);
         assert!(
             merged.append_to_last_tool_result,
             "merged result must have append_to_last_tool_result=true when both inputs are true"
@@ -1131,7 +1254,7 @@ mod tests {
             append_to_last_tool_result: true,
             ..Default::default()
         };
-        let merged = merge_inject_context_results(&[r1, r2]);
+        let merged = merge_inject_context_results(vec![r1, r2]);
         assert!(
             merged.append_to_last_tool_result,
             "merged result must have append_to_last_tool_result=true when at least one input is true (OR semantics)"
@@ -1152,7 +1275,7 @@ mod tests {
             append_to_last_tool_result: false,
             ..Default::default()
         };
-        let merged = merge_inject_context_results(&[r1, r2]);
+        let merged = merge_inject_context_results(vec![r1, r2]);
         assert!(
             !merged.append_to_last_tool_result,
             "merged result must have append_to_last_tool_result=false when both inputs are false"
@@ -16,6 +16,7 @@
 //! - `hooks` — HookRegistry event dispatch pipeline
 //! - `coordinator` — ModuleCoordinator mount points and capabilities
 //! - `session` — AmplifierSession lifecycle management
+//! - `redaction` — Secret redaction for observability payloads
 
 pub mod bridges;
 pub mod cancellation;
@@ -29,6 +30,7 @@ pub mod hooks;
 pub mod messages;
 pub mod models;
 pub mod module_resolver;
+pub mod redaction;
 pub mod retry;
 pub mod session;
 pub mod testing;
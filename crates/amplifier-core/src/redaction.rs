@@ -0,0 +1,92 @@
+//! Secret redaction for observability payloads.
+//!
+//! Rust counterpart of `amplifier_core.utils.redact_secrets`. The session
+//! uses it to redact the raw mount plan for `session:config` events on the
+//! tokio side, so the scan does not run in Python while holding the GIL.
+
+use serde_json::Value;
+
+/// Known sensitive key names (lowercase). Must match the Python
+/// `amplifier_core.utils.truncate.SENSITIVE_KEYS` set.
+pub const SENSITIVE_KEYS: &[&str] = &[
+    "api_key",
+    "apikey",
+    "api-key",
+    "secret",
+    "password",
+    "token",
+    "credential",
+    "credentials",
+    "private_key",
+    "privatekey",
+    "auth",
+    "authorization",
+];
+
+/// Placeholder that replaces every redacted value.
+pub const REDACTED: &str = "[REDACTED]";
+
+/// Replace the values of sensitive keys with `"[REDACTED]"`, in place.
+///
+/// Walks nested objects and arrays. Keys are compared case-insensitively
+/// against [`SENSITIVE_KEYS`], matching Python `redact_secrets()`.
+pub fn redact_secrets(value: &mut Value) {
+    match value {
+        Value::Object(map) => {
+            for (key, item) in map.iter_mut() {
+                if is_sensitive_key(key) {
+                    *item = Value::String(REDACTED.to_string());
+                } else {
+                    redact_secrets(item);
+                }
+            }
+        }
+        Value::Array(items) => items.iter_mut().for_each(redact_secrets),
+        _ => {}
+    }
+}
+
+fn is_sensitive_key(key: &str) -> bool {
+    SENSITIVE_KEYS
+        .iter()
+        .any(|sensitive| key.eq_ignore_ascii_case(sensitive))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    #[test]
+    fn redacts_top_level_key() {
+        let mut value = json!({"api_key": "secret123"});
+        redact_secrets(&mut value);
+        assert_eq!(value, json!({"api_key": "[REDACTED]"}));
+    }
+
+    #[test]
+    fn leaves_other_keys_untouched() {
+        let mut value = json!({"user": "alice", "password": "hunter2"});
+        redact_secrets(&mut value);
+        assert_eq!(value, json!({"user": "alice", "password": "[REDACTED]"}));
+    }
+
+    #[test]
+    fn redacts_inside_arrays_and_nested_objects() {
+        let mut value = json!({
+            "providers": [{"module": "p", "config": {"Token": {"nested": "x"}}}]
+        });
+        redact_secrets(&mut value);
+        assert_eq!(
+            value,
+            json!({"providers": [{"module": "p", "config": {"Token": "[REDACTED]"}}]})
+        );
+    }
+
+    #[test]
+    fn scalars_pass_through() {
+        let mut value = json!("token");
+        redact_secrets(&mut value);
+        assert_eq!(value, json!("token"));
+    }
+}
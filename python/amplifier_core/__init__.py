@@ -8,6 +8,9 @@ AmplifierSession`) still give the pure-Python implementations.
 
 __version__ = "1.6.0"
 
+import importlib
+from typing import TYPE_CHECKING
+
 # --- Rust-backed primary types (THE SWITCHOVER) ---
 # These four were previously imported from their Python submodules.
 # Now they come from the Rust engine / thin Python wrappers.
@@ -21,77 +24,170 @@ from ._engine import (
 # --- Rust-backed submodule re-exports ---
 from . import capabilities  # noqa: F401  (re-export stub)
 
-# --- Pure-Python types that have no Rust equivalent yet ---
-from .cancellation import CancellationState
-from .content_models import ContentBlock
-from .content_models import ContentBlockType
-from .content_models import TextContent
-from .content_models import ThinkingContent
-from .content_models import ToolCallContent
-from .content_models import ToolResultContent
-from .interfaces import ApprovalProvider
-from .interfaces import ApprovalRequest
-from .interfaces import ApprovalResponse
-from .interfaces import ContextManager
-from .interfaces import HookHandler
-from .interfaces import Orchestrator
-from .interfaces import Provider
-from .interfaces import Tool
-from .llm_errors import AuthenticationError
-from .llm_errors import ContentFilterError
-from .llm_errors import ContextLengthError
-from .llm_errors import InvalidRequestError
-from .llm_errors import LLMError
-from .llm_errors import LLMTimeoutError
-from .llm_errors import AccessDeniedError
-from .llm_errors import NetworkError
-from .llm_errors import QuotaExceededError
-from .llm_errors import NotFoundError
-from .llm_errors import StreamError
-from .llm_errors import AbortError
-from .llm_errors import InvalidToolCallError
-from .llm_errors import ConfigurationError
-from .llm_errors import ProviderUnavailableError
-from .llm_errors import RateLimitError
-from .loader import ModuleLoader
-from .loader import ModuleValidationError
-from .message_models import ChatRequest
-from .message_models import ChatResponse
-from .message_models import Degradation
-from .message_models import ImageBlock
-from .message_models import Message
-from .message_models import ReasoningBlock
-from .message_models import RedactedThinkingBlock
-from .message_models import ResponseFormat
-from .message_models import ResponseFormatJson
-from .message_models import ResponseFormatJsonSchema
-from .message_models import ResponseFormatText
-from .message_models import TextBlock
-from .message_models import ThinkingBlock
-from .message_models import ToolCall
-from .message_models import ToolCallBlock
-from .message_models import ToolResultBlock
-from .message_models import ToolSpec
-from .message_models import Usage
-from .models import ConfigField
-from .models import HookResult
-from .models import ModelInfo
-from .models import ModuleInfo
-from .models import ProviderInfo
-from .models import SessionStatus
-from .models import ToolResult
+# --- Pure-Python types, resolved lazily on first attribute access (PEP 562) ---
+# Maps each public name to the submodule that defines it. Importing
+# amplifier_core only loads the Rust engine; submodules such as testing and
+# utils.retry are imported the first time one of their names is used.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CancellationState": ".cancellation",
+    "ContentBlock": ".content_models",
+    "ContentBlockType": ".content_models",
+    "TextContent": ".content_models",
+    "ThinkingContent": ".content_models",
+    "ToolCallContent": ".content_models",
+    "ToolResultContent": ".content_models",
+    "ApprovalProvider": ".interfaces",
+    "ApprovalRequest": ".interfaces",
+    "ApprovalResponse": ".interfaces",
+    "ContextManager": ".interfaces",
+    "HookHandler": ".interfaces",
+    "Orchestrator": ".interfaces",
+    "Provider": ".interfaces",
+    "Tool": ".interfaces",
+    "AuthenticationError": ".llm_errors",
+    "ContentFilterError": ".llm_errors",
+    "ContextLengthError": ".llm_errors",
+    "InvalidRequestError": ".llm_errors",
+    "LLMError": ".llm_errors",
+    "LLMTimeoutError": ".llm_errors",
+    "AccessDeniedError": ".llm_errors",
+    "NetworkError": ".llm_errors",
+    "QuotaExceededError": ".llm_errors",
+    "NotFoundError": ".llm_errors",
+    "StreamError": ".llm_errors",
+    "AbortError": ".llm_errors",
+    "InvalidToolCallError": ".llm_errors",
+    "ConfigurationError": ".llm_errors",
+    "ProviderUnavailableError": ".llm_errors",
+    "RateLimitError": ".llm_errors",
+    "ModuleLoader": ".loader",
+    "ModuleValidationError": ".loader",
+    "ChatRequest": ".message_models",
+    "ChatResponse": ".message_models",
+    "Degradation": ".message_models",
+    "ImageBlock": ".message_models",
+    "Message": ".message_models",
+    "ReasoningBlock": ".message_models",
+    "RedactedThinkingBlock": ".message_models",
+    "ResponseFormat": ".message_models",
+    "ResponseFormatJson": ".message_models",
+    "ResponseFormatJsonSchema": ".message_models",
+    "ResponseFormatText": ".message_models",
+    "TextBlock": ".message_models",
+    "ThinkingBlock": ".message_models",
+    "ToolCall": ".message_models",
+    "ToolCallBlock": ".message_models",
+    "ToolResultBlock": ".message_models",
+    "ToolSpec": ".message_models",
+    "Usage": ".message_models",
+    "ConfigField": ".models",
+    "HookResult": ".models",
+    "ModelInfo": ".models",
+    "ModuleInfo": ".models",
+    "ProviderInfo": ".models",
+    "SessionStatus": ".models",
+    "ToolResult": ".models",
+    "EventRecorder": ".testing",
+    "MockContextManager": ".testing",
+    "MockTool": ".testing",
+    "ScriptedOrchestrator": ".testing",
+    "MockCoordinator": ".testing",
+    "create_test_coordinator": ".testing",
+    "wait_for": ".testing",
+    "wait_for_event": ".testing",
+    "classify_error_message": ".utils.retry",
+    "RetryConfig": ".utils.retry",
+    "retry_with_backoff": ".utils.retry",
+}
 
-# --- Testing utilities (must come after Rust type imports) ---
-from .testing import EventRecorder
-from .testing import MockContextManager
-from .testing import MockTool
-from .testing import ScriptedOrchestrator
-from .testing import MockCoordinator
-from .testing import create_test_coordinator
-from .testing import wait_for
-from .utils.retry import classify_error_message
-from .utils.retry import RetryConfig
-from .utils.retry import retry_with_backoff
+if TYPE_CHECKING:
+    # Static view of the lazy names above, so type checkers and IDEs resolve
+    # them to their real definitions instead of the module __getattr__.
+    from .cancellation import CancellationState
+    from .content_models import (
+        ContentBlock,
+        ContentBlockType,
+        TextContent,
+        ThinkingContent,
+        ToolCallContent,
+        ToolResultContent,
+    )
+    from .interfaces import (
+        ApprovalProvider,
+        ApprovalRequest,
+        ApprovalResponse,
+        ContextManager,
+        HookHandler,
+        Orchestrator,
+        Provider,
+        Tool,
+    )
+    from .llm_errors import (
+        AbortError,
+        AccessDeniedError,
+        AuthenticationError,
+        ConfigurationError,
+        ContentFilterError,
+        ContextLengthError,
+        InvalidRequestError,
+        InvalidToolCallError,
+        LLMError,
+        LLMTimeoutError,
+        NetworkError,
+        NotFoundError,
+        ProviderUnavailableError,
+        QuotaExceededError,
+        RateLimitError,
+        StreamError,
+    )
+    from .loader import (
+        ModuleLoader,
+        ModuleValidationError,
+    )
+    from .message_models import (
+        ChatRequest,
+        ChatResponse,
+        Degradation,
+        ImageBlock,
+        Message,
+        ReasoningBlock,
+        RedactedThinkingBlock,
+        ResponseFormat,
+        ResponseFormatJson,
+        ResponseFormatJsonSchema,
+        ResponseFormatText,
+        TextBlock,
+        ThinkingBlock,
+        ToolCall,
+        ToolCallBlock,
+        ToolResultBlock,
+        ToolSpec,
+        Usage,
+    )
+    from .models import (
+        ConfigField,
+        HookResult,
+        ModelInfo,
+        ModuleInfo,
+        ProviderInfo,
+        SessionStatus,
+        ToolResult,
+    )
+    from .testing import (
+        create_test_coordinator,
+        EventRecorder,
+        MockContextManager,
+        MockCoordinator,
+        MockTool,
+        ScriptedOrchestrator,
+        wait_for,
+        wait_for_event,
+    )
+    from .utils.retry import (
+        classify_error_message,
+        retry_with_backoff,
+        RetryConfig,
+    )
 
 # --- Rust engine types re-exported under original names for direct access ---
 from ._engine import (
@@ -177,6 +273,7 @@ __all__ = [
     "ScriptedOrchestrator",
     "create_test_coordinator",
     "wait_for",
+    "wait_for_event",
     # Retry utilities
     "RetryConfig",
     "retry_with_backoff",
@@ -188,3 +285,16 @@ __all__ = [
     "RustCancellationToken",
     "RustCoordinator",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -10,3 +10,12 @@ methods are drop-in compatible with the old pure-Python async def methods.
 async def _wrap(awaitable):
     """Wrap a PyO3 awaitable in a proper Python coroutine."""
     return await awaitable
+
+
+async def _ready(value):
+    """Return an already-known value from a proper Python coroutine.
+
+    Used by Rust methods whose result is known without any async work, so
+    they can skip spawning a tokio future for it.
+    """
+    return value
@@ -8,8 +8,8 @@ naturally within the Python event loop.
 """
 
 import asyncio
-import inspect
 import logging
+from types import CoroutineType
 
 logger = logging.getLogger(__name__)
 
@@ -17,39 +17,82 @@ logger = logging.getLogger(__name__)
 async def collect_contributions(channels: dict, channel: str) -> list:
     """Collect contributions from a channel, handling sync and async callbacks.
 
+    Thin wrapper over :func:`collect_contributions_list` for callers that hold
+    the whole ``channels`` dict. The Rust coordinator resolves the channel
+    itself and calls :func:`collect_contributions_list` directly.
+    """
+    contributors = channels.get(channel)
+    if not contributors:
+        return []
+    return await collect_contributions_list(contributors, channel)
+
+
+async def collect_contributions_list(contributors: list, channel: str) -> list:
+    """Collect contributions from an already-resolved list of contributors.
+
     Matches Python ModuleCoordinator.collect_contributions behavior:
     - Errors in individual contributors are logged, not propagated
     - None returns are filtered out
     - Both sync and async callbacks are supported
+    - Results keep registration order
+
+    Async contributors are awaited concurrently with ``asyncio.gather``, so a
+    channel with several IO-bound contributors takes as long as the slowest
+    one rather than the sum of all of them. Each contributor is a
+    ``(callback, name, is_coro)`` tuple as stored by ``register_contributor``;
+    ``channel`` is only used in log messages.
     """
-    contributions = []
-    contributors = channels.get(channel)
-    if not contributors:
-        return contributions
+    # One slot per contributor, in registration order. Coroutines are filled
+    # in after the gather below.
+    results: list = []
+    pending: list = []
+    pending_slots: list[int] = []
 
-    for contributor in contributors:
+    for callback, name, is_coro in contributors:
         try:
-            callback = contributor["callback"]
-            # Handle both sync and async callables
-            if inspect.iscoroutinefunction(callback):
-                result = await callback()
-            else:
-                result = callback()
-                # If the result is a coroutine, await it
-                if inspect.iscoroutine(result):
-                    result = await result
-
-            if result is not None:
-                contributions.append(result)
+            result = callback()
         except asyncio.CancelledError:
-            logger.warning(
-                f"Collection cancelled during contributor "
-                f"'{contributor['name']}' on channel '{channel}'"
-            )
+            _log_cancelled(name, channel)
             break
         except Exception as e:
-            logger.warning(
-                f"Contributor '{contributor['name']}' on channel '{channel}' failed: {e}"
-            )
+            _log_failed(name, channel, e)
+            results.append(None)
+            continue
+        # is_coro is classified once by register_contributor(); the class
+        # check covers sync callables that return a coroutine.
+        if is_coro or result.__class__ is CoroutineType:
+            pending_slots.append(len(results))
+            pending.append(result)
+            results.append(None)
+        else:
+            results.append(result)
+
+    if pending:
+        try:
+            outcomes = await asyncio.gather(*pending, return_exceptions=True)
+        except asyncio.CancelledError:
+            logger.warning(f"Collection cancelled on channel '{channel}'")
+            outcomes = [None] * len(pending)
+        for slot, outcome in zip(pending_slots, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                _log_cancelled(contributors[slot][1], channel)
+            elif isinstance(outcome, Exception):
+                _log_failed(contributors[slot][1], channel, outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[slot] = outcome
+
+    return [result for result in results if result is not None]
+
+
+def _log_cancelled(name: str, channel: str) -> None:
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            f"Collection cancelled during contributor '{name}' on channel '{channel}'"
+        )
+
 
-    return contributions
+def _log_failed(name: str, channel: str, error: BaseException) -> None:
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(f"Contributor '{name}' on channel '{channel}' failed: {error}")
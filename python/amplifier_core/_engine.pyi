@@ -184,7 +184,7 @@ class RustCoordinator:
     @property
     def config(self) -> dict[str, Any]: ...
     @property
-    def channels(self) -> dict[str, list[dict[str, Any]]]: ...
+    def channels(self) -> dict[str, list[tuple[Callable[[], Any], str, bool]]]: ...
     @property
     def injection_budget_per_turn(self) -> Optional[int]: ...
     @property
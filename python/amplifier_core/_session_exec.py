@@ -3,7 +3,9 @@ Session execution helper for the Rust PyO3 bridge.
 
 Thin helper that handles the orchestrator call boundary.
 Rust owns the control flow (initialization check, event emission,
-cancellation checking, error handling). This helper handles:
+cancellation checking, error handling) and, in RustSession.execute(),
+the orchestrator call itself. This helper keeps the same call available
+from Python:
 - Getting mount points from the coordinator
 - Calling orchestrator.execute() with the correct kwargs
 """
@@ -11,6 +13,8 @@ cancellation checking, error handling). This helper handles:
 import logging
 from typing import Any
 
+from .utils import redact_secrets
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,17 +32,18 @@ async def run_orchestrator(coordinator: Any, prompt: str) -> str:
     Returns:
         Final response string from the orchestrator.
     """
-    # Mount-point presence is validated by Rust PySession::execute()
-    # before this function is called. We just retrieve and call.
+    # RustSession.execute() builds this same call in Rust and only routes
+    # through here when no orchestrator is mounted. We just retrieve and call.
     orchestrator = coordinator.get("orchestrator")
     context = coordinator.get("context")
     providers = coordinator.get("providers") or {}
     tools = coordinator.get("tools") or {}
     hooks = coordinator.hooks
 
-    logger.debug(f"Passing providers to orchestrator: {list(providers.keys())}")
-    for name, provider in providers.items():
-        logger.debug(f"  Provider '{name}': type={type(provider).__name__}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Passing providers to orchestrator: {list(providers.keys())}")
+        for name, provider in providers.items():
+            logger.debug(f"  Provider '{name}': type={type(provider).__name__}")
 
     result = await orchestrator.execute(
         prompt=prompt,
@@ -65,6 +70,10 @@ async def emit_raw_field_if_configured(
     base session event (e.g. ``session:start``) which the Rust kernel
     already emitted synchronously before calling this helper.
 
+    ``RustSession.execute()`` emits the same event itself, redacting the
+    config in Rust via ``amplifier_core::redaction``; this helper remains
+    for callers driving a coordinator from Python.
+
     The ``event_base`` parameter is retained for API compatibility but is
     NOT used as the emitted event name.  Consumers that need the raw mount
     plan should subscribe to ``session:config`` rather than ``session:start``.
@@ -75,8 +84,6 @@ async def emit_raw_field_if_configured(
         session_id: Current session ID.
         event_base: Reserved (kept for API compatibility; not used as event name).
     """
-    from .utils import redact_secrets
-
     session_config = config.get("session", {})
     raw = session_config.get("raw", False)
 
@@ -6,9 +6,14 @@ so the Rust wrapper can call it without reimplementing Python-specific
 loader logic in Rust.
 """
 
+import asyncio
 import logging
 from typing import Any
 
+from .events import MODULE_ON_SESSION_READY_FAILED
+from .events import SESSION_FORK
+from .utils import redact_secrets
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +24,115 @@ def _safe_exception_str(e: BaseException) -> str:
         return repr(e)
 
 
+async def _load_all(loader: Any, coordinator: Any, entries: list[dict]) -> list:
+    """Run ``loader.load()`` for every entry, overlapping distinct modules.
+
+    Only the loads overlap — resolving sources, validating and importing
+    modules is mostly I/O. Each distinct ``module`` id is loaded once
+    concurrently; later entries for the same module (multi-instance
+    providers) are loaded afterwards so they hit the loader's cache and
+    never resolve or install the same module twice at once, while still
+    binding their own config.
+
+    The returned mount functions (or the exception a load raised) come back
+    in ``entries`` order so the caller can mount them one at a time, keeping
+    mount, cleanup and on_session_ready order identical to the config.
+    """
+
+    def load(entry: dict) -> Any:
+        return loader.load(
+            entry["module"],
+            entry.get("config", {}),
+            source_hint=entry.get("source"),
+            coordinator=coordinator,
+        )
+
+    first: dict[str, int] = {}
+    for index, entry in enumerate(entries):
+        first.setdefault(entry["module"], index)
+
+    results: list = [None] * len(entries)
+    firsts = list(first.values())
+    loaded = await asyncio.gather(
+        *(load(entries[index]) for index in firsts), return_exceptions=True
+    )
+    for index, result in zip(firsts, loaded):
+        results[index] = result
+
+    for index, entry in enumerate(entries):
+        if first[entry["module"]] != index:
+            try:
+                results[index] = await load(entry)
+            except Exception as e:
+                results[index] = e
+    return results
+
+
+def _loaded(result: Any) -> Any:
+    """Unwrap a ``_load_all`` result, re-raising the load's exception."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _resolve_module_spec(
+    config: dict[str, Any], category: str, default_id: str
+) -> tuple[str, Any, dict]:
+    """Return ``(module_id, source_hint, module_config)`` for a required module.
+
+    ``session.<category>`` is either a module id string, with the source in
+    ``session.<category>_source`` and config in ``<category>.config``, or a
+    dict carrying ``module``, ``source`` and ``config`` itself.
+    """
+    session_config = config.get("session", {})
+    spec = session_config.get(category, default_id)
+    if isinstance(spec, dict):
+        return (
+            spec.get("module", default_id),
+            spec.get("source"),
+            spec.get("config", {}),
+        )
+    return (
+        spec,
+        session_config.get(f"{category}_source"),
+        config.get(category, {}).get("config", {}),
+    )
+
+
+async def _mount(loader: Any, coordinator: Any, mount_fn: Any) -> None:
+    """Mount a loaded module, registering its cleanup and on_session_ready."""
+    cleanup = await mount_fn(coordinator)
+    if cleanup:
+        coordinator.register_cleanup(cleanup)
+    # B1 fix: enqueue on_session_ready ONLY after successful mount
+    if on_sr := getattr(mount_fn, "__on_session_ready__", None):
+        loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
+
+
+async def _mount_required(
+    loader: Any, coordinator: Any, spec: tuple[str, Any, dict], kind: str
+) -> None:
+    """Load and mount a module the session cannot run without.
+
+    Any failure is re-raised as ``RuntimeError("Cannot initialize without
+    <kind>: ...")``.
+    """
+    module_id, source, module_config = spec
+    logger.info(f"Loading {kind}: {module_id}")
+    try:
+        mount_fn = await loader.load(
+            module_id,
+            module_config,
+            source_hint=source,
+            coordinator=coordinator,
+        )
+        await _mount(loader, coordinator, mount_fn)
+    except Exception as e:
+        raise RuntimeError(
+            f"Cannot initialize without {kind}: {_safe_exception_str(e)}"
+        )
+
+
 async def initialize_session(
     config: dict[str, Any],
     coordinator: Any,
@@ -44,65 +158,19 @@ async def initialize_session(
         loader = ModuleLoader(coordinator=coordinator)
         coordinator.loader = loader
 
-    # Load orchestrator (required)
-    orchestrator_spec = config.get("session", {}).get("orchestrator", "loop-basic")
-    if isinstance(orchestrator_spec, dict):
-        orchestrator_id = orchestrator_spec.get("module", "loop-basic")
-        orchestrator_source = orchestrator_spec.get("source")
-        orchestrator_config = orchestrator_spec.get("config", {})
-    else:
-        orchestrator_id = orchestrator_spec
-        orchestrator_source = config.get("session", {}).get("orchestrator_source")
-        orchestrator_config = config.get("orchestrator", {}).get("config", {})
-
-    logger.info(f"Loading orchestrator: {orchestrator_id}")
-    try:
-        orchestrator_mount = await loader.load(
-            orchestrator_id,
-            orchestrator_config,
-            source_hint=orchestrator_source,
-            coordinator=coordinator,
-        )
-        cleanup = await orchestrator_mount(coordinator)
-        if cleanup:
-            coordinator.register_cleanup(cleanup)
-        # B1 fix: enqueue on_session_ready ONLY after successful mount
-        if on_sr := getattr(orchestrator_mount, "__on_session_ready__", None):
-            loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
-    except Exception as e:
-        raise RuntimeError(
-            f"Cannot initialize without orchestrator: {_safe_exception_str(e)}"
-        )
-
-    # Load context manager (required)
-    context_spec = config.get("session", {}).get("context", "context-simple")
-    if isinstance(context_spec, dict):
-        context_id = context_spec.get("module", "context-simple")
-        context_source = context_spec.get("source")
-        context_config = context_spec.get("config", {})
-    else:
-        context_id = context_spec
-        context_source = config.get("session", {}).get("context_source")
-        context_config = config.get("context", {}).get("config", {})
-
-    logger.info(f"Loading context manager: {context_id}")
-    try:
-        context_mount = await loader.load(
-            context_id,
-            context_config,
-            source_hint=context_source,
-            coordinator=coordinator,
-        )
-        cleanup = await context_mount(coordinator)
-        if cleanup:
-            coordinator.register_cleanup(cleanup)
-        # B1 fix: enqueue on_session_ready ONLY after successful mount
-        if on_sr := getattr(context_mount, "__on_session_ready__", None):
-            loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
-    except Exception as e:
-        raise RuntimeError(
-            f"Cannot initialize without context manager: {_safe_exception_str(e)}"
-        )
+    # Load orchestrator and context manager (required)
+    await _mount_required(
+        loader,
+        coordinator,
+        _resolve_module_spec(config, "orchestrator", "loop-basic"),
+        "orchestrator",
+    )
+    await _mount_required(
+        loader,
+        coordinator,
+        _resolve_module_spec(config, "context", "context-simple"),
+        "context manager",
+    )
 
     # Validate multi-instance providers: at most ONE entry per module may omit instance_id.
     # That one entry is the "default" instance that keeps the provider's default mount name.
@@ -124,18 +192,35 @@ async def initialize_session(
                 f"without instance_id (at most 1 allowed as the default instance)."
             )
 
-    # Load providers
-    for provider_config in config.get("providers", []):
-        module_id = provider_config.get("module")
-        if not module_id:
-            continue
+    # Load providers, tools and hooks concurrently, then mount them in
+    # config order below. Entries without a module id are skipped.
+    provider_configs = [pc for pc in config.get("providers", []) if pc.get("module")]
+    tool_configs = [tc for tc in config.get("tools", []) if tc.get("module")]
+    hook_configs = [hc for hc in config.get("hooks", []) if hc.get("module")]
+    for provider_config in provider_configs:
         instance_id = provider_config.get("instance_id")  # multi-instance support
-        try:
-            logger.info(
-                f"Loading provider: {module_id}"
-                + (f" (instance: {instance_id})" if instance_id else "")
-            )
+        logger.info(
+            f"Loading provider: {provider_config['module']}"
+            + (f" (instance: {instance_id})" if instance_id else "")
+        )
+    for tool_config in tool_configs:
+        logger.info(f"Loading tool: {tool_config['module']}")
+    for hook_config in hook_configs:
+        logger.info(f"Loading hook: {hook_config['module']}")
+    loads = await _load_all(
+        loader, coordinator, [*provider_configs, *tool_configs, *hook_configs]
+    )
+    tools_start = len(provider_configs)
+    hooks_start = tools_start + len(tool_configs)
+    provider_loads = loads[:tools_start]
+    tool_loads = loads[tools_start:hooks_start]
+    hook_loads = loads[hooks_start:]
 
+    # Mount providers
+    for provider_config, provider_load in zip(provider_configs, provider_loads):
+        module_id = provider_config["module"]
+        instance_id = provider_config.get("instance_id")
+        try:
             # Snapshot: save any existing provider at the default mount name before
             # loading. The new provider will self-mount there and may overwrite it.
             existing_at_default: object | None = None
@@ -148,18 +233,8 @@ async def initialize_session(
                 _snap_dict = coordinator.get("providers") or {}
                 existing_at_default = _snap_dict.get(_default_name)
 
-            provider_mount = await loader.load(
-                module_id,
-                provider_config.get("config", {}),
-                source_hint=provider_config.get("source"),
-                coordinator=coordinator,
-            )
-            cleanup = await provider_mount(coordinator)
-            if cleanup:
-                coordinator.register_cleanup(cleanup)
-            # B1 fix: enqueue on_session_ready ONLY after successful mount
-            if on_sr := getattr(provider_mount, "__on_session_ready__", None):
-                loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
+            provider_mount = _loaded(provider_load)
+            await _mount(loader, coordinator, provider_mount)
 
             # Multi-instance remapping: if instance_id specified, remap mount name
             if instance_id:
@@ -191,50 +266,24 @@ async def initialize_session(
                 exc_info=True,
             )
 
-    # Load tools
-    for tool_config in config.get("tools", []):
-        module_id = tool_config.get("module")
-        if not module_id:
-            continue
+    # Mount tools
+    for tool_config, tool_load in zip(tool_configs, tool_loads):
+        module_id = tool_config["module"]
         try:
-            logger.info(f"Loading tool: {module_id}")
-            tool_mount = await loader.load(
-                module_id,
-                tool_config.get("config", {}),
-                source_hint=tool_config.get("source"),
-                coordinator=coordinator,
-            )
-            cleanup = await tool_mount(coordinator)
-            if cleanup:
-                coordinator.register_cleanup(cleanup)
-            # B1 fix: enqueue on_session_ready ONLY after successful mount
-            if on_sr := getattr(tool_mount, "__on_session_ready__", None):
-                loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
+            tool_mount = _loaded(tool_load)
+            await _mount(loader, coordinator, tool_mount)
         except Exception as e:
             logger.warning(
                 f"Failed to load tool '{module_id}': {_safe_exception_str(e)}",
                 exc_info=True,
             )
 
-    # Load hooks
-    for hook_config in config.get("hooks", []):
-        module_id = hook_config.get("module")
-        if not module_id:
-            continue
+    # Mount hooks
+    for hook_config, hook_load in zip(hook_configs, hook_loads):
+        module_id = hook_config["module"]
         try:
-            logger.info(f"Loading hook: {module_id}")
-            hook_mount = await loader.load(
-                module_id,
-                hook_config.get("config", {}),
-                source_hint=hook_config.get("source"),
-                coordinator=coordinator,
-            )
-            cleanup = await hook_mount(coordinator)
-            if cleanup:
-                coordinator.register_cleanup(cleanup)
-            # B1 fix: enqueue on_session_ready ONLY after successful mount
-            if on_sr := getattr(hook_mount, "__on_session_ready__", None):
-                loader.enqueue_on_session_ready(on_sr[0], on_sr[1])
+            hook_mount = _loaded(hook_load)
+            await _mount(loader, coordinator, hook_mount)
         except Exception as e:
             logger.warning(
                 f"Failed to load hook '{module_id}': {_safe_exception_str(e)}",
@@ -259,7 +308,6 @@ async def initialize_session(
                 f"on_session_ready for '{module_id}' raised: {_safe_exception_str(e)}",
                 exc_info=True,
             )
-            from .events import MODULE_ON_SESSION_READY_FAILED
             try:
                 await coordinator.hooks.emit(
                     MODULE_ON_SESSION_READY_FAILED,
@@ -273,9 +321,6 @@ async def initialize_session(
 
     # Emit session:fork event if this is a child session
     if parent_id:
-        from .events import SESSION_FORK
-        from .utils import redact_secrets
-
         session_config = config.get("session", {})
         session_metadata = session_config.get("metadata", {})
         raw = session_config.get("raw", False)
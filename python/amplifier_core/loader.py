@@ -8,13 +8,16 @@ With module source resolution:
 - Supports flexible module sourcing (git, local, packages)
 """
 
+import asyncio
 import contextlib
+import functools
 import importlib
 import importlib.metadata
 import inspect
 import logging
 import os
 import sys
+import tomllib
 from collections.abc import Awaitable
 from collections.abc import Callable
 from pathlib import Path
@@ -39,6 +42,28 @@ TYPE_TO_MOUNT_POINT = {
 }
 
 
+def _read_module_meta(module_path: Path) -> dict[str, Any]:
+    """Return the parsed ``amplifier.toml`` in ``module_path``, or ``{}``.
+
+    Parses are cached by path and modification time, so repeated loads of
+    the same module reuse the result until the file changes. The returned
+    dict is shared between callers and must not be mutated.
+    """
+    toml_path = module_path / "amplifier.toml"
+    try:
+        mtime_ns = toml_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _parse_module_meta(str(toml_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_module_meta(toml_path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse ``toml_path``. ``mtime_ns`` is only part of the cache key."""
+    with open(toml_path, "rb") as f:
+        return tomllib.load(f)
+
+
 class ModuleValidationError(Exception):
     """Raised when a module fails validation at load time."""
 
@@ -272,7 +297,12 @@ class ModuleLoader:
                     try:
                         from amplifier_core._engine import resolve_module
 
-                        manifest = resolve_module(str(module_path))
+                        # resolve_module releases the GIL while it reads the
+                        # manifest, so a worker thread lets concurrent loads
+                        # overlap their filesystem work.
+                        manifest = await asyncio.to_thread(
+                            resolve_module, str(module_path)
+                        )
                         transport = manifest.get("transport", "python")
 
                         if transport == "wasm":
@@ -766,18 +796,11 @@ class ModuleLoader:
         from .loader_grpc import load_grpc_module
 
         # Read amplifier.toml for gRPC config
-        try:
-            import tomli
-        except ImportError:
-            import tomllib as tomli  # type: ignore[no-redef]
-
-        toml_path = module_path / "amplifier.toml"
-        meta: dict[str, Any] = {}
-        if toml_path.exists():
-            with open(toml_path, "rb") as f:
-                meta = tomli.load(f)
+        meta = _read_module_meta(module_path)
 
-        return await load_grpc_module(module_id, config, meta, coordinator)
+        return await load_grpc_module(
+            module_id, config, meta, coordinator, module_path=module_path
+        )
 
     def _make_rust_sidecar_mount(
         self,
@@ -844,7 +867,6 @@ class ModuleLoader:
             coord: ModuleCoordinator,
         ) -> Callable | None:
             """Spawn the Rust sidecar, await READY:<port>, then connect via gRPC."""
-            import asyncio
             import select
             import socket
 
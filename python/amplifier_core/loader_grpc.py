@@ -8,12 +8,92 @@ The gRPC transport uses proto/amplifier_module.proto as the contract.
 Any language with gRPC support can implement a tool module.
 """
 
+import asyncio
+import copy
+import functools
 import json
 import logging
+import math
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Message classes only need protobuf. Resolving them once here keeps the
+    # import machinery off the per-call execute() path.
+    from amplifier_core._grpc_gen import amplifier_module_pb2
+except ImportError:  # pragma: no cover - protobuf not installed
+    amplifier_module_pb2 = None
+
+try:
+    from grpc.aio import AioRpcError
+except ImportError:  # pragma: no cover - grpcio not installed
+
+    class AioRpcError(Exception):  # type: ignore[no-redef]
+        """Stand-in so execute() can name the RPC error without grpcio."""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether ``obj`` contains a NaN or infinite float (keys included)."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(k) or _has_non_finite(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes, stringifying unsupported values.
+
+    Uses orjson when it is installed (it writes bytes directly). Input
+    orjson handles differently from the stdlib encoder goes through the
+    stdlib instead: integers beyond 64 bits, which orjson rejects, and
+    NaN/Infinity, which orjson silently writes as ``null``.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # Only output containing null can hide a non-finite float.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+# Both decoders accept bytes directly, so payloads are never decoded to str.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - only needed for application/msgpack
+    msgspec = None
+
+if msgspec is not None:
+    _msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=str)
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+
+# Errors the payload encoders raise for input they cannot represent
+# (circular references, out-of-range numbers, unsupported types).
+_ENCODE_ERRORS: tuple[type[Exception], ...] = (TypeError, ValueError, OverflowError)
+if msgspec is not None:
+    _ENCODE_ERRORS += (msgspec.EncodeError,)
+
+_MSGPACK_MISSING = (
+    "msgspec is required for application/msgpack gRPC payloads. "
+    "Install it with: pip install msgspec"
+)
+
 
 def _extract_endpoint(meta: dict[str, Any], module_id: str) -> str:
     """Extract gRPC endpoint from module metadata.
@@ -31,6 +111,141 @@ def _extract_endpoint(meta: dict[str, Any], module_id: str) -> str:
     return endpoint
 
 
+def _extract_content_type(meta: dict[str, Any], module_id: str) -> str:
+    """Extract the preferred tool payload content type from module metadata.
+
+    Args:
+        meta: Parsed amplifier.toml contents
+        module_id: Module identifier for logging
+
+    Returns:
+        MIME type string, "application/json" unless ``grpc.content_type`` is set
+    """
+    grpc_config = meta.get("grpc", {})
+    content_type = grpc_config.get("content_type", "application/json")
+    logger.debug(f"gRPC content type for '{module_id}': {content_type}")
+    return content_type
+
+
+def _extract_pool_size(meta: dict[str, Any], module_id: str) -> int:
+    """Extract the number of gRPC channels to open for a tool module.
+
+    Args:
+        meta: Parsed amplifier.toml contents
+        module_id: Module identifier for logging
+
+    Returns:
+        Channel count from ``grpc.pool_size`` (default 4, at least 1)
+    """
+    grpc_config = meta.get("grpc", {})
+    pool_size = max(1, int(grpc_config.get("pool_size", 4)))
+    logger.debug(f"gRPC channel pool size for '{module_id}': {pool_size}")
+    return pool_size
+
+
+# Default channel options: detect dead connections with keepalive pings,
+# and lift the 4 MiB message cap so large tool inputs/outputs aren't
+# rejected. Pings stay within the stock grpc-core/grpc-go server policy
+# (at most one per 5 minutes, none while no call is active); exceeding it
+# gets idle channels dropped with GOAWAY too_many_pings. Modules that
+# control their server can opt into tighter keepalive via grpc.options.
+_CHANNEL_OPTIONS: dict[str, int] = {
+    "grpc.keepalive_time_ms": 300000,
+    "grpc.keepalive_timeout_ms": 5000,
+    "grpc.max_send_message_length": 64 * 1024 * 1024,
+    "grpc.max_receive_message_length": 64 * 1024 * 1024,
+}
+
+
+def _extract_channel_options(
+    meta: dict[str, Any], module_id: str
+) -> list[tuple[str, Any]]:
+    """Build gRPC channel options, applying ``grpc.options`` overrides.
+
+    Args:
+        meta: Parsed amplifier.toml contents
+        module_id: Module identifier for logging
+
+    Returns:
+        List of (option name, value) pairs for ``grpc.aio.insecure_channel``
+    """
+    grpc_config = meta.get("grpc", {})
+    options = {**_CHANNEL_OPTIONS, **grpc_config.get("options", {})}
+    logger.debug(f"gRPC channel options for '{module_id}': {options}")
+    return list(options.items())
+
+
+def _validate_spec(
+    spec: Any, module_id: str, module_path: Path | None = None
+) -> dict[str, Any]:
+    """Check a ``[grpc.spec]`` table before mounting a bridge from it.
+
+    Args:
+        spec: The ``grpc.spec`` value from amplifier.toml
+        module_id: Module identifier for the error message
+        module_path: Module directory, when known, for the error message
+
+    Returns:
+        The spec table, unchanged
+
+    Raises:
+        ValueError: ``name`` is missing or empty, or ``parameters_json``
+            is not a JSON string
+    """
+    where = (
+        f"{module_path / 'amplifier.toml'} (module '{module_id}')"
+        if module_path is not None
+        else f"amplifier.toml of module '{module_id}'"
+    )
+    if not isinstance(spec, dict):
+        raise ValueError(f"Invalid [grpc.spec] in {where}: expected a table")
+    name = spec.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(
+            f"Invalid [grpc.spec] in {where}: 'name' must be a non-empty string"
+        )
+    parameters_json = spec.get("parameters_json", "")
+    if not isinstance(parameters_json, str):
+        raise ValueError(
+            f"Invalid [grpc.spec] in {where}: 'parameters_json' must be a string"
+        )
+    if parameters_json:
+        try:
+            _json_loads(parameters_json)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid [grpc.spec] in {where}: 'parameters_json' is not "
+                f"valid JSON ({e})"
+            ) from e
+    return spec
+
+
+def _open_channels(
+    endpoint: str, pool_size: int, options: list[tuple[str, Any]]
+) -> tuple[list[Any], list[Any]]:
+    """Open ``pool_size`` channels to ``endpoint`` with a ToolService stub each.
+
+    Several channels mean several HTTP/2 connections, so concurrent tool
+    calls don't queue behind one another on a single connection's
+    flow-control window. Channels with the same target and options would
+    otherwise share one connection through gRPC's global subchannel pool,
+    so each channel gets a local subchannel pool of its own.
+
+    Returns:
+        Tuple of (channels, stubs), index-aligned
+    """
+    import grpc.aio
+
+    from amplifier_core._grpc_gen import amplifier_module_pb2_grpc
+
+    options = [*options, ("grpc.use_local_subchannel_pool", 1)]
+    channels = [
+        grpc.aio.insecure_channel(endpoint, options=options) for _ in range(pool_size)
+    ]
+    stubs = [amplifier_module_pb2_grpc.ToolServiceStub(c) for c in channels]
+    return channels, stubs
+
+
 class GrpcToolBridge:
     """Wraps a remote gRPC ToolService as a Python tool object.
 
@@ -44,8 +259,29 @@ class GrpcToolBridge:
         parameters_json: JSON Schema string (from GetSpec response)
         endpoint: gRPC endpoint string
         channel: grpc.Channel (or None for unit tests)
+        content_type: Payload encoding for tool input, "application/json"
+            or "application/msgpack"
+        connect: Optional callable returning (channels, stubs); when given,
+            the bridge opens its channels on the first execute() instead
+            of being handed a connected stub
     """
 
+    # One bridge is mounted per remote tool; slots keep each handle small.
+    __slots__ = (
+        "_name",
+        "_description",
+        "_spec",
+        "_endpoint",
+        "_channel",
+        "_content_type",
+        "_stub",
+        "_stubs",
+        "_pool_channels",
+        "_next_stub",
+        "_connect",
+        "_connect_lock",
+    )
+
     def __init__(
         self,
         name: str,
@@ -53,13 +289,30 @@ class GrpcToolBridge:
         parameters_json: str,
         endpoint: str,
         channel: Any | None = None,
+        content_type: str = "application/json",
+        connect: Callable[[], tuple[list[Any], list[Any]]] | None = None,
     ) -> None:
+        if content_type == "application/msgpack" and msgspec is None:
+            raise ImportError(_MSGPACK_MISSING)
         self._name = name
         self._description = description
-        self._parameters_json = parameters_json
+        # The spec never changes after GetSpec, so build it once up front.
+        self._spec: dict[str, Any] = {
+            "name": name,
+            "description": description,
+            "parameters": _json_loads(parameters_json) if parameters_json else {},
+        }
         self._endpoint = endpoint
         self._channel = channel
+        self._content_type = content_type
         self._stub: Any | None = None
+        # Optional channel pool set up by load_grpc_module(): one stub per
+        # channel (the first on ``channel``), picked round-robin per call.
+        self._stubs: list[Any] = []
+        self._pool_channels: list[Any] = []
+        self._next_stub = 0
+        self._connect = connect
+        self._connect_lock = asyncio.Lock()
 
     @property
     def name(self) -> str:
@@ -70,13 +323,30 @@ class GrpcToolBridge:
         return self._description
 
     def get_spec(self) -> dict[str, Any]:
-        """Return tool spec as a dict matching the Python ToolSpec pattern."""
-        params = json.loads(self._parameters_json) if self._parameters_json else {}
-        return {
-            "name": self._name,
-            "description": self._description,
-            "parameters": params,
-        }
+        """Return tool spec as a dict matching the Python ToolSpec pattern.
+
+        The parameters schema is parsed once at construction; each call
+        returns a deep copy so callers may modify the result freely.
+        """
+        return {**self._spec, "parameters": copy.deepcopy(self._spec["parameters"])}
+
+    def _attach(self, channels: list[Any], stubs: list[Any]) -> None:
+        """Use ``channels``/``stubs`` (index-aligned) as this bridge's pool."""
+        self._channel = channels[0]
+        self._stub = stubs[0]
+        self._stubs = stubs
+        self._pool_channels = channels[1:]
+
+    async def _ensure_connected(self) -> None:
+        """Open the channel pool on first use for lazily connected bridges."""
+        if self._connect is None:
+            return
+        async with self._connect_lock:
+            if self._connect is None:
+                return
+            self._attach(*self._connect())
+            self._connect = None
+            logger.info(f"Connected to gRPC tool '{self._name}' at {self._endpoint}")
 
     def _serialize_input(self, input_dict: dict[str, Any]) -> tuple[bytes, str]:
         """Serialize tool input to bytes with content type.
@@ -84,8 +354,9 @@ class GrpcToolBridge:
         Returns:
             Tuple of (payload_bytes, content_type_string)
         """
-        data = json.dumps(input_dict, default=str).encode("utf-8")
-        return data, "application/json"
+        if self._content_type == "application/msgpack":
+            return _msgpack_encoder.encode(input_dict), "application/msgpack"
+        return _json_dumps(input_dict), "application/json"
 
     def _deserialize_output(self, output_bytes: bytes, content_type: str) -> Any:
         """Deserialize tool output bytes to Python object.
@@ -100,10 +371,13 @@ class GrpcToolBridge:
         if not output_bytes:
             return {}
         if content_type == "application/json" or not content_type:
-            return json.loads(output_bytes.decode("utf-8"))
-        # Future: handle application/msgpack
+            return _json_loads(output_bytes)
+        if content_type == "application/msgpack":
+            if msgspec is None:
+                raise ImportError(_MSGPACK_MISSING)
+            return _msgpack_decoder.decode(output_bytes)
         logger.warning(f"Unknown content type '{content_type}', attempting JSON decode")
-        return json.loads(output_bytes.decode("utf-8"))
+        return _json_loads(output_bytes)
 
     async def execute(self, **kwargs: Any) -> dict[str, Any]:
         """Execute the tool via gRPC.
@@ -114,45 +388,73 @@ class GrpcToolBridge:
         Returns:
             ToolResult-compatible dict with success, output, error keys
         """
-        if self._stub is None:
+        await self._ensure_connected()
+        stubs = self._stubs
+        if stubs:
+            # asyncio runs execute() on one thread, so a plain counter is
+            # enough to spread concurrent calls over the pooled channels.
+            stub = stubs[self._next_stub % len(stubs)]
+            self._next_stub += 1
+        else:
+            stub = self._stub
+        if stub is None:
             raise RuntimeError(
                 f"gRPC channel not connected for tool '{self._name}'. "
                 "Call connect() first or use load_grpc_module()."
             )
 
-        input_bytes, content_type = self._serialize_input(kwargs)
-
+        # Input the encoder can't represent is the caller's error, not a bug
+        # here: report it as a failed tool result like an RPC failure.
         try:
-            # Import proto types lazily to avoid hard dependency
-            from amplifier_core._grpc_gen import amplifier_module_pb2
+            input_bytes, content_type = self._serialize_input(kwargs)
+        except _ENCODE_ERRORS as e:
+            logger.error(f"Failed to encode input for gRPC tool '{self._name}': {e}")
+            return {
+                "success": False,
+                "output": None,
+                "error": {"message": f"Failed to encode tool input: {e}"},
+            }
+
+        if amplifier_module_pb2 is None:
+            raise ImportError("protobuf is required for gRPC tool calls")
+        request = amplifier_module_pb2.ToolExecuteRequest(
+            input=input_bytes,
+            content_type=content_type,
+        )
 
-            request = amplifier_module_pb2.ToolExecuteRequest(
-                input=input_bytes,
-                content_type=content_type,
+        # Only RPC failures become an error result; anything else is a bug
+        # in this process and propagates to the caller.
+        try:
+            response = await stub.Execute(request)
+        except AioRpcError as e:
+            code = e.code().name
+            details = e.details() or code
+            logger.error(
+                f"gRPC tool execution failed for '{self._name}': {code} {details}"
             )
-            response = await self._stub.Execute(request)
-
-            if response.success:
-                output = self._deserialize_output(
-                    response.output, response.content_type
-                )
-                return {"success": True, "output": output, "error": None}
-            else:
-                return {
-                    "success": False,
-                    "output": None,
-                    "error": {"message": response.error},
-                }
-
-        except Exception as e:
-            logger.error(f"gRPC tool execution failed for '{self._name}': {e}")
-            return {"success": False, "output": None, "error": {"message": str(e)}}
+            return {
+                "success": False,
+                "output": None,
+                "error": {"code": code, "message": details},
+            }
+
+        if response.success:
+            output = self._deserialize_output(response.output, response.content_type)
+            return {"success": True, "output": output, "error": None}
+        return {
+            "success": False,
+            "output": None,
+            "error": {"message": response.error},
+        }
 
     async def cleanup(self) -> None:
-        """Close the gRPC channel."""
-        if self._channel:
-            await self._channel.close()
-            logger.debug(f"Closed gRPC channel for tool '{self._name}'")
+        """Close the gRPC channel and any pooled channels."""
+        channels = [c for c in (self._channel, *self._pool_channels) if c]
+        if channels:
+            await asyncio.gather(*(c.close() for c in channels))
+            logger.debug(
+                f"Closed {len(channels)} gRPC channel(s) for tool '{self._name}'"
+            )
 
 
 async def load_grpc_module(
@@ -160,38 +462,50 @@ async def load_grpc_module(
     config: dict[str, Any] | None,
     meta: dict[str, Any],
     coordinator: Any,
+    module_path: Path | None = None,
 ) -> Any:
     """Load a gRPC module and return a mount function.
 
-    Connects to the gRPC service, fetches the tool spec via GetSpec,
-    and returns a mount function compatible with the module loading chain.
+    If amplifier.toml declares the tool spec under ``[grpc.spec]`` (the
+    ToolSpec fields: name, description, parameters_json), the bridge is
+    mounted without connecting and opens its channels on the first call.
+    Otherwise connects to the gRPC service and fetches the spec via GetSpec.
+    Either way, returns a mount function compatible with the module loading
+    chain.
 
     Args:
         module_id: Module identifier
         config: Optional module configuration
         meta: Parsed amplifier.toml contents
         coordinator: The coordinator instance
+        module_path: Module directory containing amplifier.toml, used in
+            error messages
 
     Returns:
         Async mount function that registers the tool on the coordinator
+
+    Raises:
+        ValueError: ``[grpc.spec]`` is present but malformed
     """
     endpoint = _extract_endpoint(meta, module_id)
+    content_type = _extract_content_type(meta, module_id)
+    pool_size = _extract_pool_size(meta, module_id)
+    options = _extract_channel_options(meta, module_id)
+    spec = meta.get("grpc", {}).get("spec")
+    if spec is not None:
+        spec = _validate_spec(spec, module_id, module_path)
 
     try:
-        import grpc.aio
+        import grpc.aio  # noqa: F401
     except ImportError:
         raise ImportError(
             "grpcio is required for gRPC module loading. "
             "Install it with: pip install grpcio grpcio-tools"
         )
 
-    # Connect to the gRPC service
-    channel = grpc.aio.insecure_channel(endpoint)
-
     try:
         # Import generated proto stubs
-        from amplifier_core._grpc_gen import amplifier_module_pb2
-        from amplifier_core._grpc_gen import amplifier_module_pb2_grpc
+        from amplifier_core._grpc_gen import amplifier_module_pb2_grpc  # noqa: F401
     except ImportError:
         raise ImportError(
             "gRPC proto stubs not generated. Run: "
@@ -199,22 +513,41 @@ async def load_grpc_module(
             "--grpc_python_out=python/amplifier_core/_grpc_gen proto/amplifier_module.proto"
         )
 
-    stub = amplifier_module_pb2_grpc.ToolServiceStub(channel)
-
-    # Fetch tool spec
-    spec_response = await stub.GetSpec(amplifier_module_pb2.Empty())
+    connect = functools.partial(_open_channels, endpoint, pool_size, options)
+
+    if spec is not None:
+        # Spec known up front: skip the GetSpec round trip and don't hold
+        # connections open for a tool that may never be called.
+        bridge = GrpcToolBridge(
+            name=spec["name"],
+            description=spec.get("description", ""),
+            parameters_json=spec.get("parameters_json", ""),
+            endpoint=endpoint,
+            content_type=content_type,
+            connect=connect,
+        )
+        logger.info(f"Loaded gRPC tool '{bridge.name}' (connects on first use)")
+    else:
+        channels, stubs = connect()
 
-    # Create bridge
-    bridge = GrpcToolBridge(
-        name=spec_response.name,
-        description=spec_response.description,
-        parameters_json=spec_response.parameters_json,
-        endpoint=endpoint,
-        channel=channel,
-    )
-    bridge._stub = stub
+        # Fetch tool spec; don't leak the freshly opened pool if it fails.
+        try:
+            spec_response = await stubs[0].GetSpec(amplifier_module_pb2.Empty())
+        except BaseException:
+            await asyncio.gather(*(c.close() for c in channels))
+            raise
+
+        # Create bridge
+        bridge = GrpcToolBridge(
+            name=spec_response.name,
+            description=spec_response.description,
+            parameters_json=spec_response.parameters_json,
+            endpoint=endpoint,
+            content_type=content_type,
+        )
+        bridge._attach(channels, stubs)
 
-    logger.info(f"Connected to gRPC tool '{bridge.name}' at {endpoint}")
+        logger.info(f"Connected to gRPC tool '{bridge.name}' at {endpoint}")
 
     # Return mount function matching the Python module loading pattern
     async def mount(coord: Any) -> Any:
@@ -110,14 +110,24 @@ class EventRecorder:
 
     Implements the HookRegistry interface for emit() to allow use
     as a mock hooks object in orchestrator tests.
+
+    Payloads are recorded by reference, like call arguments on a mock. Pass
+    ``copy_payloads=True`` to snapshot each payload at emit time when the
+    code under test reuses or mutates the dicts it emits.
     """
 
-    def __init__(self):
+    def __init__(self, copy_payloads: bool = False):
+        self._copy_payloads = copy_payloads
         self.events: list[tuple] = []
+        # Same tuples as ``events``, indexed by event name so filtered
+        # get_events() calls don't rescan the whole recording.
+        self._by_type: dict[str, list[tuple]] = {}
 
     async def emit(self, event: str, data: dict) -> HookResult:
         """Emit (record) an event - compatible with HookRegistry.emit()."""
-        self.events.append((event, data.copy()))
+        entry = (event, data.copy() if self._copy_payloads else data)
+        self.events.append(entry)
+        self._by_type.setdefault(event, []).append(entry)
         return HookResult(action="continue")
 
     async def record(self, event: str, data: dict) -> HookResult:
@@ -127,11 +137,12 @@ class EventRecorder:
     def clear(self):
         """Clear recorded events."""
         self.events.clear()
+        self._by_type.clear()
 
     def get_events(self, event_type: str | None = None) -> list[tuple]:
         """Get recorded events, optionally filtered by type."""
         if event_type:
-            return [e for e in self.events if e[0] == event_type]
+            return list(self._by_type.get(event_type, ()))
         return self.events.copy()
 
 
@@ -177,6 +188,10 @@ async def wait_for(condition: Callable[[], bool], timeout: float = 1.0) -> bool:
     """
     Wait for a condition to become true.
 
+    Polls ``condition`` with a backoff from 1ms up to 10ms. When the code
+    under test can set an ``asyncio.Event`` instead, prefer
+    ``wait_for_event``, which wakes as soon as the event is set.
+
     Args:
         condition: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
@@ -184,11 +199,32 @@ async def wait_for(condition: Callable[[], bool], timeout: float = 1.0) -> bool:
     Returns:
         True if condition was met, False if timeout
     """
-    start = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.001
 
-    while asyncio.get_event_loop().time() - start < timeout:
+    while loop.time() < deadline:
         if condition():
             return True
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.01)
 
     return False
+
+
+async def wait_for_event(event: asyncio.Event, timeout: float = 1.0) -> bool:
+    """
+    Wait for an event to be set.
+
+    Args:
+        event: Event the code under test sets when it is done
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the event was set, False if timeout
+    """
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except TimeoutError:
+        return False
+    return True
@@ -77,15 +77,36 @@ def redact_secrets(obj: Any, sensitive_keys: frozenset[str] = SENSITIVE_KEYS) ->
         [{'token': '[REDACTED]'}]
     """
     if isinstance(obj, dict):
-        result = {}
-        for key, value in obj.items():
-            if isinstance(key, str) and key.lower() in sensitive_keys:
-                result[key] = "[REDACTED]"
-            else:
-                result[key] = redact_secrets(value, sensitive_keys)
-        return result
+        return _redact_dict(obj, sensitive_keys)
     elif isinstance(obj, list):
-        return [redact_secrets(item, sensitive_keys) for item in obj]
+        return _redact_list(obj, sensitive_keys)
     else:
         # Pass through all other types unchanged
         return obj
+
+
+def _redact_dict(obj: dict, sensitive_keys: frozenset[str]) -> dict:
+    # Only containers recurse; scalar values are copied as-is without a call.
+    result = {}
+    for key, value in obj.items():
+        if isinstance(key, str) and key.lower() in sensitive_keys:
+            result[key] = "[REDACTED]"
+        elif isinstance(value, dict):
+            result[key] = _redact_dict(value, sensitive_keys)
+        elif isinstance(value, list):
+            result[key] = _redact_list(value, sensitive_keys)
+        else:
+            result[key] = value
+    return result
+
+
+def _redact_list(obj: list, sensitive_keys: frozenset[str]) -> list:
+    result = []
+    for item in obj:
+        if isinstance(item, dict):
+            result.append(_redact_dict(item, sensitive_keys))
+        elif isinstance(item, list):
+            result.append(_redact_list(item, sensitive_keys))
+        else:
+            result.append(item)
+    return result
@@ -8,10 +8,14 @@ Validates that GitHub Actions workflow YAML files:
 
 from __future__ import annotations
 
+import functools
 import pathlib
 
 import yaml
 
+# libyaml's C loader when available; the pure-Python one otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Root of the amplifier-core submodule
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 
@@ -27,6 +31,22 @@ def _normalize_on_key(data: dict) -> dict:
     return data
 
 
+def _uses(steps: list[dict]):
+    """Lazily yield each step's ``uses`` value ("" when absent)."""
+    return (s.get("uses", "") for s in steps)
+
+
+def _runs(steps: list[dict]):
+    """Lazily yield each step's ``run`` command ("" when absent)."""
+    return (s.get("run", "") for s in steps)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_workflow(path: pathlib.Path) -> dict:
+    """Parse a workflow file once; tests only read the returned dict."""
+    return _normalize_on_key(yaml.load(path.read_text(), Loader=_YAML_LOADER))
+
+
 class TestRustCoreCIWorkflow:
     """Task 8.1: Rust + Python CI workflow."""
 
@@ -38,7 +58,7 @@ class TestRustCoreCIWorkflow:
         )
 
     def _load(self) -> dict:
-        return _normalize_on_key(yaml.safe_load(self.WORKFLOW_PATH.read_text()))
+        return _load_workflow(self.WORKFLOW_PATH)
 
     # -- trigger configuration --
 
@@ -62,33 +82,29 @@ class TestRustCoreCIWorkflow:
     def test_rust_tests_uses_rust_cache(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("rust-cache" in u for u in uses_list), (
+        assert any("rust-cache" in u for u in _uses(steps)), (
             "rust-tests job must use Swatinem/rust-cache"
         )
 
     def test_rust_tests_runs_cargo_test(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("cargo test" in r for r in run_cmds)
+        assert any("cargo test" in r for r in _runs(steps))
 
     def test_rust_tests_runs_cargo_check(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("cargo check" in r and "amplifier-core" in r for r in run_cmds)
+        assert any("cargo check" in r and "amplifier-core" in r for r in _runs(steps))
 
     def test_rust_tests_runs_cargo_fmt_check(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("cargo fmt" in r and "--check" in r for r in run_cmds)
+        assert any("cargo fmt" in r and "--check" in r for r in _runs(steps))
 
     def test_rust_tests_fmt_before_clippy(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
+        run_cmds = list(_runs(steps))
         fmt_idx = next(i for i, r in enumerate(run_cmds) if "cargo fmt" in r)
         clippy_idx = next(i for i, r in enumerate(run_cmds) if "cargo clippy" in r)
         assert fmt_idx < clippy_idx, "cargo fmt --check must run before clippy"
@@ -104,8 +120,7 @@ class TestRustCoreCIWorkflow:
     def test_rust_tests_runs_clippy_deny_warnings(self):
         wf = self._load()
         steps = wf["jobs"]["rust-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("cargo clippy" in r and "-D warnings" in r for r in run_cmds)
+        assert any("cargo clippy" in r and "-D warnings" in r for r in _runs(steps))
 
     # -- python-tests job --
 
@@ -123,26 +138,22 @@ class TestRustCoreCIWorkflow:
     def test_python_tests_uses_rust_cache(self):
         wf = self._load()
         steps = wf["jobs"]["python-tests"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("rust-cache" in u for u in uses_list)
+        assert any("rust-cache" in u for u in _uses(steps))
 
     def test_python_tests_builds_with_maturin(self):
         wf = self._load()
         steps = wf["jobs"]["python-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("maturin" in r for r in run_cmds)
+        assert any("maturin" in r for r in _runs(steps))
 
     def test_python_tests_runs_original_tests(self):
         wf = self._load()
         steps = wf["jobs"]["python-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("pytest tests/" in r or "pytest tests" in r for r in run_cmds)
+        assert any("pytest tests/" in r or "pytest tests" in r for r in _runs(steps))
 
     def test_python_tests_runs_bridge_tests(self):
         wf = self._load()
         steps = wf["jobs"]["python-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("bindings/python/tests" in r for r in run_cmds)
+        assert any("bindings/python/tests" in r for r in _runs(steps))
 
 
 class TestBuildWheelsWorkflow:
@@ -156,7 +167,7 @@ class TestBuildWheelsWorkflow:
         )
 
     def _load(self) -> dict:
-        return _normalize_on_key(yaml.safe_load(self.WORKFLOW_PATH.read_text()))
+        return _load_workflow(self.WORKFLOW_PATH)
 
     # -- trigger configuration --
 
@@ -201,14 +212,12 @@ class TestBuildWheelsWorkflow:
     def test_build_wheels_uses_maturin_action(self):
         wf = self._load()
         steps = wf["jobs"]["build-wheels"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("maturin-action" in u for u in uses_list)
+        assert any("maturin-action" in u for u in _uses(steps))
 
     def test_build_wheels_uploads_artifacts(self):
         wf = self._load()
         steps = wf["jobs"]["build-wheels"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("upload-artifact" in u for u in uses_list)
+        assert any("upload-artifact" in u for u in _uses(steps))
 
     def test_has_linux_aarch64_job(self):
         wf = self._load()
@@ -224,8 +233,7 @@ class TestBuildWheelsWorkflow:
     def test_linux_aarch64_uploads_artifacts(self):
         wf = self._load()
         steps = wf["jobs"]["build-linux-aarch64"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("upload-artifact" in u for u in uses_list)
+        assert any("upload-artifact" in u for u in _uses(steps))
 
     # -- publish job --
 
@@ -247,8 +255,7 @@ class TestBuildWheelsWorkflow:
     def test_publish_uses_pypi_action(self):
         wf = self._load()
         steps = wf["jobs"]["publish"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("pypi-publish" in u for u in uses_list)
+        assert any("pypi-publish" in u for u in _uses(steps))
 
 
 class TestNodeBindingsCIWorkflow:
@@ -257,7 +264,7 @@ class TestNodeBindingsCIWorkflow:
     WORKFLOW_PATH = ROOT / ".github" / "workflows" / "rust-core-ci.yml"
 
     def _load(self) -> dict:
-        return _normalize_on_key(yaml.safe_load(self.WORKFLOW_PATH.read_text()))
+        return _load_workflow(self.WORKFLOW_PATH)
 
     def test_has_node_tests_job(self):
         wf = self._load()
@@ -266,29 +273,26 @@ class TestNodeBindingsCIWorkflow:
     def test_node_tests_uses_setup_node(self):
         wf = self._load()
         steps = wf["jobs"]["node-tests"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("setup-node" in u for u in uses_list)
+        assert any("setup-node" in u for u in _uses(steps))
 
     def test_node_tests_uses_rust_cache(self):
         wf = self._load()
         steps = wf["jobs"]["node-tests"]["steps"]
-        uses_list = [s.get("uses", "") for s in steps]
-        assert any("rust-cache" in u for u in uses_list)
+        assert any("rust-cache" in u for u in _uses(steps))
 
     def test_node_tests_runs_npm_build(self):
         wf = self._load()
         steps = wf["jobs"]["node-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("npm" in r and "build" in r for r in run_cmds)
+        assert any("npm" in r and "build" in r for r in _runs(steps))
 
     def test_node_tests_runs_vitest(self):
         wf = self._load()
         steps = wf["jobs"]["node-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("vitest" in r for r in run_cmds)
+        assert any("vitest" in r for r in _runs(steps))
 
     def test_node_tests_runs_clippy_for_node_binding(self):
         wf = self._load()
         steps = wf["jobs"]["node-tests"]["steps"]
-        run_cmds = [s.get("run", "") for s in steps]
-        assert any("cargo clippy" in r and "amplifier-core-node" in r for r in run_cmds)
+        assert any(
+            "cargo clippy" in r and "amplifier-core-node" in r for r in _runs(steps)
+        )
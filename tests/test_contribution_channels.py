@@ -27,7 +27,7 @@ async def test_register_contributor(coordinator):
 
     assert "test-channel" in coordinator.channels
     assert len(coordinator.channels["test-channel"]) == 1
-    assert coordinator.channels["test-channel"][0]["name"] == "test-module"
+    assert coordinator.channels["test-channel"][0][1] == "test-module"
 
 
 @pytest.mark.asyncio
@@ -206,3 +206,56 @@ async def test_registration_order_preserved(coordinator):
 
     # Order should be preserved
     assert contributions == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_registration_classifies_async_callbacks(coordinator):
+    """Test that registration records whether each callback is a coroutine function."""
+
+    async def async_contributor():
+        return ["async-data"]
+
+    coordinator.register_contributor("test", "sync-mod", lambda: ["sync-data"])
+    coordinator.register_contributor("test", "async-mod", async_contributor)
+
+    (_, _, sync_is_coro), (_, _, async_is_coro) = coordinator.channels["test"]
+    assert sync_is_coro is False
+    assert async_is_coro is True
+
+
+@pytest.mark.asyncio
+async def test_sync_callback_returning_coroutine(coordinator):
+    """Test that a sync callable returning a coroutine is still awaited."""
+
+    async def produce():
+        return ["deferred-data"]
+
+    coordinator.register_contributor("test", "wrapper", lambda: produce())
+
+    contributions = await coordinator.collect_contributions("test")
+
+    assert contributions == [["deferred-data"]]
+
+
+@pytest.mark.asyncio
+async def test_async_callbacks_run_concurrently(coordinator):
+    """Test that async contributors are awaited together, not one after another."""
+    import asyncio
+
+    ready = asyncio.Event()
+
+    async def waiter():
+        # Only completes if the setter runs while this contributor is pending.
+        await asyncio.wait_for(ready.wait(), timeout=1.0)
+        return "waiter"
+
+    async def setter():
+        ready.set()
+        return "setter"
+
+    coordinator.register_contributor("test", "waiter", waiter)
+    coordinator.register_contributor("test", "setter", setter)
+
+    contributions = await coordinator.collect_contributions("test")
+
+    assert contributions == ["waiter", "setter"]
@@ -0,0 +1,49 @@
+"""Tests for amplifier_core.testing.EventRecorder."""
+
+import pytest
+
+from amplifier_core.testing import EventRecorder
+
+
+@pytest.mark.asyncio
+async def test_get_events_filters_and_preserves_order():
+    recorder = EventRecorder()
+    await recorder.emit("tool:pre", {"n": 1})
+    await recorder.emit("tool:post", {"n": 2})
+    await recorder.emit("tool:pre", {"n": 3})
+
+    assert recorder.get_events("tool:pre") == [
+        ("tool:pre", {"n": 1}),
+        ("tool:pre", {"n": 3}),
+    ]
+    assert recorder.get_events("missing") == []
+    assert [e for e, _ in recorder.get_events()] == [
+        "tool:pre",
+        "tool:post",
+        "tool:pre",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clear_resets_filtered_view():
+    recorder = EventRecorder()
+    await recorder.emit("tool:pre", {})
+
+    recorder.clear()
+
+    assert recorder.events == []
+    assert recorder.get_events("tool:pre") == []
+
+
+@pytest.mark.asyncio
+async def test_copy_payloads_snapshots_at_emit_time():
+    payload = {"n": 1}
+    shared = EventRecorder()
+    copying = EventRecorder(copy_payloads=True)
+    await shared.emit("tool:pre", payload)
+    await copying.emit("tool:pre", payload)
+
+    payload["n"] = 2
+
+    assert shared.get_events("tool:pre") == [("tool:pre", {"n": 2})]
+    assert copying.get_events("tool:pre") == [("tool:pre", {"n": 1})]
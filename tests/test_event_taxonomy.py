@@ -3,24 +3,32 @@ Tests for event taxonomy integrity.
 Catches runtime bugs that aren't obvious from reading the code.
 """
 
+import re
+from collections import Counter
+
 from amplifier_core import events
 
+# Exactly one ':' between two non-empty lowercase snake_case parts.
+_EVENT_NAME = re.compile(r"[a-z][a-z0-9_]*:[a-z][a-z0-9_]*")
+
 
 def test_no_duplicate_events_in_all_events():
     """Verify ALL_EVENTS contains no duplicates (catches copy-paste errors)."""
-    duplicates = [e for e in events.ALL_EVENTS if events.ALL_EVENTS.count(e) > 1]
+    counts = Counter(events.ALL_EVENTS)
+    duplicates = [e for e, count in counts.items() if count > 1]
     assert len(duplicates) == 0, f"ALL_EVENTS contains duplicates: {set(duplicates)}"
 
 
 def test_all_event_constants_in_all_events():
     """Verify every event constant is in ALL_EVENTS (catches forgotten additions)."""
     event_constants = [
-        getattr(events, name)
-        for name in dir(events)
+        value
+        for name, value in vars(events).items()
         if name.isupper() and not name.startswith("_") and name != "ALL_EVENTS"
     ]
 
-    missing = [e for e in event_constants if e not in events.ALL_EVENTS]
+    all_events = set(events.ALL_EVENTS)
+    missing = [e for e in event_constants if e not in all_events]
     assert len(missing) == 0, f"Event constants not in ALL_EVENTS: {missing}"
 
     # Verify count matches (catches constants in ALL_EVENTS that don't exist)
@@ -32,18 +40,6 @@ def test_all_event_constants_in_all_events():
 def test_events_follow_naming_convention():
     """Verify all events follow namespace:action convention."""
     for event in events.ALL_EVENTS:
-        assert ":" in event, f"Event {event} missing namespace separator ':'"
-        parts = event.split(":")
-        assert len(parts) >= 2, (
-            f"Event {event} should follow namespace:action convention"
-        )
-        # All events must be exactly 2 parts (namespace:action)
-        assert len(parts) == 2, f"Event {event} has more than 2 ':' parts"
-        namespace = parts[0]
-        action = parts[1]
-        assert namespace, f"Event {event} has empty namespace"
-        assert action, f"Event {event} has empty action"
-        # Allow lowercase with underscores
-        assert event.islower() or "_" in event, (
-            f"Event {event} not lowercase/snake_case"
+        assert _EVENT_NAME.fullmatch(event), (
+            f"Event {event} must be lowercase snake_case namespace:action"
         )
@@ -114,7 +114,7 @@ class TestOrchestratorProtocol:
         var_keyword_params = [
             p
             for p in sig.parameters.values()
-            if p.kind == inspect.Parameter.VAR_KEYWORD
+            if p.kind is inspect.Parameter.VAR_KEYWORD
         ]
         assert len(var_keyword_params) == 1, (
             "Orchestrator.execute must have a **kwargs parameter "
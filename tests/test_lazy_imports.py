@@ -0,0 +1,76 @@
+"""Tests for lazy loading of pure-Python re-exports in amplifier_core."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _modules_loaded_after(code: str) -> set[str]:
+    """Run *code* in a fresh interpreter and return the amplifier_core modules it loaded."""
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('amplifier_core')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Verify that importing amplifier_core defers pure-Python submodules."""
+
+    def test_import_does_not_load_pure_python_submodules(self) -> None:
+        loaded = _modules_loaded_after("import amplifier_core")
+
+        assert "amplifier_core.testing" not in loaded
+        assert "amplifier_core.utils.retry" not in loaded
+        assert "amplifier_core.message_models" not in loaded
+
+    def test_attribute_access_loads_submodule(self) -> None:
+        loaded = _modules_loaded_after("from amplifier_core import RetryConfig")
+
+        assert "amplifier_core.utils.retry" in loaded
+        assert "amplifier_core.testing" not in loaded
+
+    def test_lazy_name_resolves_to_submodule_object(self) -> None:
+        import amplifier_core
+        from amplifier_core.message_models import TextBlock
+
+        assert amplifier_core.TextBlock is TextBlock
+
+    def test_dir_lists_lazy_names(self) -> None:
+        import amplifier_core
+
+        assert set(amplifier_core.__all__) <= set(dir(amplifier_core))
+
+    def test_unknown_attribute_raises(self) -> None:
+        import amplifier_core
+
+        with pytest.raises(AttributeError):
+            amplifier_core.DoesNotExist  # noqa: B018
+
+    def test_type_checking_imports_match_lazy_names(self) -> None:
+        """The TYPE_CHECKING block imports every lazy name from its submodule."""
+        import amplifier_core
+
+        tree = ast.parse(Path(amplifier_core.__file__).read_text())
+        block = next(
+            node
+            for node in tree.body
+            if isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        )
+        static = {
+            alias.name: "." * stmt.level + (stmt.module or "")
+            for stmt in block.body
+            if isinstance(stmt, ast.ImportFrom)
+            for alias in stmt.names
+        }
+
+        assert static == amplifier_core._LAZY_IMPORTS
@@ -20,6 +20,35 @@ from amplifier_core.llm_errors import (
     StreamError,
 )
 
+# (error class, retryable default, direct parent) for every error subtype.
+ERROR_TABLE = [
+    (RateLimitError, True, LLMError),
+    (AuthenticationError, False, LLMError),
+    (ContextLengthError, False, LLMError),
+    (ContentFilterError, False, LLMError),
+    (InvalidRequestError, False, LLMError),
+    (ProviderUnavailableError, True, LLMError),
+    (LLMTimeoutError, True, LLMError),
+    (NotFoundError, False, LLMError),
+    (StreamError, True, LLMError),
+    (AbortError, False, LLMError),
+    (InvalidToolCallError, False, LLMError),
+    (ConfigurationError, False, LLMError),
+    (AccessDeniedError, False, AuthenticationError),
+    (NetworkError, True, ProviderUnavailableError),
+    (QuotaExceededError, False, RateLimitError),
+]
+ERROR_IDS = [cls.__name__ for cls, _, _ in ERROR_TABLE]
+ALL_ERROR_NAMES = ("LLMError", *ERROR_IDS)
+
+
+@pytest.fixture(scope="module")
+def amplifier_core():
+    """The top-level package, imported once for the export checks."""
+    import amplifier_core
+
+    return amplifier_core
+
 
 class TestLLMErrorBase:
     """Tests for the LLMError base class."""
@@ -50,20 +79,30 @@ class TestLLMErrorBase:
         err = LLMError("test")
         assert isinstance(err, Exception)
 
-    def test_all_subtypes_are_llm_errors(self) -> None:
-        """All error subtypes can be caught as LLMError."""
-        errors = [
-            RateLimitError("rate limited"),
-            AuthenticationError("bad key"),
-            ContextLengthError("too long"),
-            ContentFilterError("blocked"),
-            InvalidRequestError("bad request"),
-            ProviderUnavailableError("down"),
-            LLMTimeoutError("timed out"),
-        ]
-        for err in errors:
-            assert isinstance(err, LLMError), f"{type(err).__name__} is not an LLMError"
-            assert isinstance(err, Exception)
+
+class TestErrorTaxonomy:
+    """Shared behaviour of every error subtype, driven by ERROR_TABLE."""
+
+    @pytest.mark.parametrize("cls,retryable,parent", ERROR_TABLE, ids=ERROR_IDS)
+    def test_retryable_default(self, cls, retryable, parent) -> None:
+        """Each subtype has its documented retryable default."""
+        assert cls("msg").retryable is retryable
+
+    @pytest.mark.parametrize("cls,retryable,parent", ERROR_TABLE, ids=ERROR_IDS)
+    def test_inherits_from_parent(self, cls, retryable, parent) -> None:
+        """Each subtype is an instance of its parent, LLMError and Exception."""
+        err = cls("msg")
+        assert isinstance(err, parent)
+        assert isinstance(err, LLMError)
+        assert isinstance(err, Exception)
+
+    @pytest.mark.parametrize("cls,retryable,parent", ERROR_TABLE, ids=ERROR_IDS)
+    def test_caught_by_except_parent(self, cls, retryable, parent) -> None:
+        """Existing `except Parent:` and `except LLMError:` clauses catch it."""
+        with pytest.raises(parent):
+            raise cls("msg")
+        with pytest.raises(LLMError):
+            raise cls("msg")
 
 
 class TestRateLimitError:
@@ -95,17 +134,7 @@ class TestRateLimitError:
 
 
 class TestRetryableErrors:
-    """Tests for errors that are retryable by default."""
-
-    def test_provider_unavailable_is_retryable(self) -> None:
-        """ProviderUnavailableError is retryable by default."""
-        err = ProviderUnavailableError("Service down")
-        assert err.retryable is True
-
-    def test_timeout_is_retryable(self) -> None:
-        """LLMTimeoutError is retryable by default."""
-        err = LLMTimeoutError("Request timed out")
-        assert err.retryable is True
+    """Tests for overriding the retryable default."""
 
     def test_rate_limit_retryable_override(self) -> None:
         """RateLimitError retryable default can be overridden."""
@@ -134,30 +163,6 @@ class TestRetryableErrors:
         assert err.retryable is True
 
 
-class TestNonRetryableErrors:
-    """Tests for errors that are NOT retryable by default."""
-
-    def test_authentication_not_retryable(self) -> None:
-        """AuthenticationError is not retryable."""
-        err = AuthenticationError("Invalid API key")
-        assert err.retryable is False
-
-    def test_context_length_not_retryable(self) -> None:
-        """ContextLengthError is not retryable."""
-        err = ContextLengthError("Exceeds 200k context window")
-        assert err.retryable is False
-
-    def test_content_filter_not_retryable(self) -> None:
-        """ContentFilterError is not retryable."""
-        err = ContentFilterError("Content blocked by safety filter")
-        assert err.retryable is False
-
-    def test_invalid_request_not_retryable(self) -> None:
-        """InvalidRequestError is not retryable."""
-        err = InvalidRequestError("Malformed request")
-        assert err.retryable is False
-
-
 class TestRepr:
     """Tests for LLMError.__repr__ with structured info."""
 
@@ -242,27 +247,13 @@ class TestExceptionChaining:
 class TestImportFromCore:
     """Tests that error types are importable from amplifier_core."""
 
-    def test_import_from_top_level(self) -> None:
-        """All error types are importable from amplifier_core."""
-        import amplifier_core
-
-        error_names = [
-            "LLMError",
-            "RateLimitError",
-            "AuthenticationError",
-            "ContextLengthError",
-            "ContentFilterError",
-            "InvalidRequestError",
-            "ProviderUnavailableError",
-            "LLMTimeoutError",
-        ]
-        for name in error_names:
-            assert hasattr(amplifier_core, name), (
-                f"{name} not exported from amplifier_core"
-            )
-            cls = getattr(amplifier_core, name)
-            assert issubclass(cls, Exception), f"{name} is not an Exception subclass"
-            assert issubclass(cls, LLMError), f"{name} is not an LLMError subclass"
+    @pytest.mark.parametrize("name", ALL_ERROR_NAMES)
+    def test_exported(self, name, amplifier_core) -> None:
+        """Each error type is exported from amplifier_core as an LLMError."""
+        assert hasattr(amplifier_core, name), f"{name} not exported from amplifier_core"
+        cls = getattr(amplifier_core, name)
+        assert issubclass(cls, Exception), f"{name} is not an Exception subclass"
+        assert issubclass(cls, LLMError), f"{name} is not an LLMError subclass"
 
 
 class TestNotFoundError:
@@ -276,63 +267,18 @@ class TestNotFoundError:
         assert err.provider == "openai"
         assert err.status_code == 404
 
-    def test_inherits_from_llm_error(self) -> None:
-        err = NotFoundError("not found")
-        assert isinstance(err, LLMError)
-        assert isinstance(err, Exception)
-
-    def test_not_retryable_by_default(self) -> None:
-        err = NotFoundError("not found")
-        assert err.retryable is False
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise NotFoundError("not found")
-
 
 class TestStreamError:
     """Tests for StreamError."""
 
-    def test_retryable_by_default(self) -> None:
-        err = StreamError("Connection dropped mid-stream")
-        assert err.retryable is True
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = StreamError("stream broke")
-        assert isinstance(err, LLMError)
-
     def test_retryable_override(self) -> None:
         err = StreamError("corrupt", retryable=False)
         assert err.retryable is False
 
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise StreamError("stream broke")
-
-
-class TestAbortError:
-    """Tests for AbortError."""
-
-    def test_not_retryable_by_default(self) -> None:
-        err = AbortError("User cancelled")
-        assert err.retryable is False
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = AbortError("cancelled")
-        assert isinstance(err, LLMError)
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise AbortError("cancelled")
-
 
 class TestInvalidToolCallError:
     """Tests for InvalidToolCallError."""
 
-    def test_not_retryable_by_default(self) -> None:
-        err = InvalidToolCallError("Bad JSON in arguments")
-        assert err.retryable is False
-
     def test_tool_name_and_raw_arguments(self) -> None:
         err = InvalidToolCallError(
             "Failed to parse arguments",
@@ -347,10 +293,6 @@ class TestInvalidToolCallError:
         assert err.tool_name is None
         assert err.raw_arguments is None
 
-    def test_inherits_from_llm_error(self) -> None:
-        err = InvalidToolCallError("bad call")
-        assert isinstance(err, LLMError)
-
     def test_accepts_provider_and_status_code(self) -> None:
         err = InvalidToolCallError(
             "bad call",
@@ -362,141 +304,20 @@ class TestInvalidToolCallError:
         assert err.provider == "anthropic"
         assert err.status_code == 400
 
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise InvalidToolCallError("bad")
-
-
-class TestConfigurationError:
-    """Tests for ConfigurationError."""
-
-    def test_not_retryable_by_default(self) -> None:
-        err = ConfigurationError("Missing API key")
-        assert err.retryable is False
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = ConfigurationError("bad config")
-        assert isinstance(err, LLMError)
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise ConfigurationError("bad config")
-
-
-class TestAccessDeniedError:
-    """Tests for AccessDeniedError (subclass of AuthenticationError)."""
-
-    def test_not_retryable_by_default(self) -> None:
-        err = AccessDeniedError("Forbidden")
-        assert err.retryable is False
-
-    def test_inherits_from_authentication_error(self) -> None:
-        err = AccessDeniedError("forbidden")
-        assert isinstance(err, AuthenticationError)
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = AccessDeniedError("forbidden")
-        assert isinstance(err, LLMError)
-
-    def test_caught_by_except_authentication_error(self) -> None:
-        """Backward compat: existing `except AuthenticationError:` catches this."""
-        with pytest.raises(AuthenticationError):
-            raise AccessDeniedError("forbidden")
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise AccessDeniedError("forbidden")
-
-
-class TestNetworkError:
-    """Tests for NetworkError (subclass of ProviderUnavailableError)."""
-
-    def test_retryable_by_default(self) -> None:
-        """Inherits retryable=True from ProviderUnavailableError."""
-        err = NetworkError("DNS resolution failed")
-        assert err.retryable is True
-
-    def test_inherits_from_provider_unavailable(self) -> None:
-        err = NetworkError("connection refused")
-        assert isinstance(err, ProviderUnavailableError)
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = NetworkError("connection refused")
-        assert isinstance(err, LLMError)
-
-    def test_caught_by_except_provider_unavailable(self) -> None:
-        """Backward compat: existing `except ProviderUnavailableError:` catches this."""
-        with pytest.raises(ProviderUnavailableError):
-            raise NetworkError("connection refused")
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise NetworkError("connection refused")
-
 
 class TestQuotaExceededError:
     """Tests for QuotaExceededError (subclass of RateLimitError)."""
 
-    def test_not_retryable_by_default(self) -> None:
-        """Unlike parent RateLimitError (retryable=True), QuotaExceededError defaults to False."""
-        err = QuotaExceededError("Monthly quota exhausted")
-        assert err.retryable is False
-
-    def test_inherits_from_rate_limit_error(self) -> None:
-        err = QuotaExceededError("quota exceeded")
-        assert isinstance(err, RateLimitError)
-
-    def test_inherits_from_llm_error(self) -> None:
-        err = QuotaExceededError("quota exceeded")
-        assert isinstance(err, LLMError)
-
     def test_has_retry_after(self) -> None:
         """Inherits retry_after from RateLimitError."""
         err = QuotaExceededError("quota exceeded", retry_after=3600.0)
         assert err.retry_after == 3600.0
 
-    def test_caught_by_except_rate_limit_error(self) -> None:
-        """Backward compat: existing `except RateLimitError:` catches this."""
-        with pytest.raises(RateLimitError):
-            raise QuotaExceededError("quota exceeded")
-
-    def test_caught_by_except_llm_error(self) -> None:
-        with pytest.raises(LLMError):
-            raise QuotaExceededError("quota exceeded")
-
     def test_retryable_can_be_overridden(self) -> None:
         err = QuotaExceededError("quota exceeded", retryable=True)
         assert err.retryable is True
 
 
-class TestNewErrorsInAllSubtypesCheck:
-    """Verify all 15 error types are caught by except LLMError."""
-
-    def test_all_types_are_llm_errors(self) -> None:
-        errors = [
-            # Original 7
-            RateLimitError("rate limited"),
-            AuthenticationError("bad key"),
-            ContextLengthError("too long"),
-            ContentFilterError("blocked"),
-            InvalidRequestError("bad request"),
-            ProviderUnavailableError("down"),
-            LLMTimeoutError("timed out"),
-            # New 8
-            NotFoundError("not found"),
-            StreamError("stream broke"),
-            AbortError("cancelled"),
-            InvalidToolCallError("bad tool call"),
-            ConfigurationError("bad config"),
-            AccessDeniedError("forbidden"),
-            NetworkError("connection refused"),
-            QuotaExceededError("quota exceeded"),
-        ]
-        for err in errors:
-            assert isinstance(err, LLMError), f"{type(err).__name__} is not an LLMError"
-            assert isinstance(err, Exception)
-
-
 class TestDelayMultiplierDocstring:
     """Verify delay_multiplier docstring reflects Rust kernel usage."""
 
@@ -512,28 +333,3 @@ class TestDelayMultiplierDocstring:
         docstring = LLMError.__doc__
         assert docstring is not None
         assert "not used by the Rust kernel" not in docstring
-
-
-class TestNewErrorsImportFromCore:
-    """Verify all 8 new error types are importable from amplifier_core."""
-
-    def test_import_new_types_from_top_level(self) -> None:
-        import amplifier_core
-
-        new_error_names = [
-            "NotFoundError",
-            "StreamError",
-            "AbortError",
-            "InvalidToolCallError",
-            "ConfigurationError",
-            "AccessDeniedError",
-            "NetworkError",
-            "QuotaExceededError",
-        ]
-        for name in new_error_names:
-            assert hasattr(amplifier_core, name), (
-                f"{name} not exported from amplifier_core"
-            )
-            cls = getattr(amplifier_core, name)
-            assert issubclass(cls, Exception), f"{name} is not an Exception subclass"
-            assert issubclass(cls, LLMError), f"{name} is not an LLMError subclass"
@@ -144,3 +144,38 @@ async def test_loader_backward_compat_single_instance(loader, monkeypatch):
     assert result == config, (
         f"Single load() must pass the correct config. Expected {config!r}, got {result!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# amplifier.toml parse cache
+# ---------------------------------------------------------------------------
+
+
+def test_module_meta_parsed_once_until_file_changes(tmp_path):
+    """_read_module_meta reuses the parse until amplifier.toml's mtime changes."""
+    import os
+
+    from amplifier_core.loader import _parse_module_meta
+    from amplifier_core.loader import _read_module_meta
+
+    _parse_module_meta.cache_clear()
+    toml_path = tmp_path / "amplifier.toml"
+    toml_path.write_text('[grpc]\nendpoint = "localhost:1"\n')
+
+    first = _read_module_meta(tmp_path)
+    second = _read_module_meta(tmp_path)
+    assert first == {"grpc": {"endpoint": "localhost:1"}}
+    assert second is first
+
+    toml_path.write_text('[grpc]\nendpoint = "localhost:2"\n')
+    stat = toml_path.stat()
+    os.utime(toml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _read_module_meta(tmp_path) == {"grpc": {"endpoint": "localhost:2"}}
+
+
+def test_module_meta_missing_file_is_empty(tmp_path):
+    """A module directory without amplifier.toml yields an empty dict."""
+    from amplifier_core.loader import _read_module_meta
+
+    assert _read_module_meta(tmp_path) == {}
@@ -0,0 +1,53 @@
+"""
+Tests that the PyO3 bindings never drive Python coroutines on a second event loop.
+
+Every coroutine returned by a Python handler or module must be awaited through
+pyo3_async_runtimes::tokio::into_future(), which runs it on the caller's event
+loop. The old run_coroutine_threadsafe / asyncio.run() fallback either
+deadlocked or ran handlers on a throwaway loop; this guards against it coming
+back.
+"""
+
+from pathlib import Path
+
+BINDINGS_SRC = Path(__file__).parent.parent / "bindings" / "python" / "src"
+
+FORBIDDEN = (
+    "run_coroutine_threadsafe",
+    "asyncio.run(",
+    'call_method("run"',
+    'call_method0("run"',
+    'call_method1("run"',
+    'getattr("run")',
+    'intern!(py, "run")',
+    "new_event_loop",
+    "run_until_complete",
+)
+
+
+def _code_lines(path: Path):
+    """Yield (line number, line) for non-comment lines of a Rust source file."""
+    for lineno, line in enumerate(path.read_text().splitlines(), start=1):
+        code = line.split("//", 1)[0]
+        if code.strip():
+            yield lineno, code
+
+
+def test_bindings_do_not_start_their_own_event_loops():
+    """No binding source may call into asyncio to run a coroutine on another loop."""
+    offenders = [
+        f"{path.relative_to(BINDINGS_SRC)}:{lineno}: {code.strip()}"
+        for path in sorted(BINDINGS_SRC.rglob("*.rs"))
+        for lineno, code in _code_lines(path)
+        if any(pattern in code for pattern in FORBIDDEN)
+    ]
+    assert offenders == [], (
+        "Coroutines must be awaited via pyo3_async_runtimes::tokio::into_future(), "
+        "not on a separate event loop:\n" + "\n".join(offenders)
+    )
+
+
+def test_hook_handler_bridge_awaits_via_into_future():
+    """PyHookHandlerBridge converts async handler results with into_future()."""
+    bridges = (BINDINGS_SRC / "bridges.rs").read_text()
+    assert "pyo3_async_runtimes::tokio::into_future(" in bridges
@@ -0,0 +1,55 @@
+"""Tests for amplifier_core.utils.redact_secrets."""
+
+import re
+from pathlib import Path
+
+from amplifier_core.utils import SENSITIVE_KEYS
+from amplifier_core.utils import redact_secrets
+
+REDACTION_RS = (
+    Path(__file__).parent.parent / "crates" / "amplifier-core" / "src" / "redaction.rs"
+)
+
+
+def test_redacts_nested_dicts_and_lists():
+    config = {
+        "session": {"orchestrator": "loop-basic"},
+        "providers": [
+            {"module": "provider-a", "config": {"API_KEY": "sk-1", "model": "m"}},
+            [{"token": "t"}, "plain", 3],
+        ],
+        "max_tokens": 100,
+    }
+
+    assert redact_secrets(config) == {
+        "session": {"orchestrator": "loop-basic"},
+        "providers": [
+            {"module": "provider-a", "config": {"API_KEY": "[REDACTED]", "model": "m"}},
+            [{"token": "[REDACTED]"}, "plain", 3],
+        ],
+        "max_tokens": 100,
+    }
+
+
+def test_returns_copy_without_mutating_input():
+    config = {"auth": {"user": "u"}, "nested": {"password": "p"}}
+
+    redacted = redact_secrets(config)
+
+    assert config == {"auth": {"user": "u"}, "nested": {"password": "p"}}
+    assert redacted["nested"] is not config["nested"]
+
+
+def test_non_string_keys_and_scalars_pass_through():
+    assert redact_secrets({1: "one", None: {"secret": "s"}}) == {
+        1: "one",
+        None: {"secret": "[REDACTED]"},
+    }
+    assert redact_secrets("token") == "token"
+
+
+def test_rust_key_set_matches_python():
+    """The kernel's redaction.rs must redact exactly the same keys."""
+    source = REDACTION_RS.read_text()
+    block = source.split("pub const SENSITIVE_KEYS", 1)[1].split("];", 1)[0]
+    assert frozenset(re.findall(r'"([^"]+)"', block)) == SENSITIVE_KEYS
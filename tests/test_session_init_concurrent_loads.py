@@ -0,0 +1,146 @@
+"""Tests for concurrent module loading in initialize_session().
+
+Providers, tools and hooks are loaded with asyncio.gather, but their mount
+functions must still run one at a time in config order.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from amplifier_core._session_init import initialize_session
+
+
+def _make_coordinator(loader):
+    coordinator = MagicMock()
+    coordinator.loader = loader
+    coordinator.register_cleanup = MagicMock()
+    coordinator.hooks = MagicMock()
+    coordinator.hooks.emit = AsyncMock()
+    return coordinator
+
+
+def _make_loader(load):
+    loader = MagicMock()
+    loader.load = AsyncMock(side_effect=load)
+    loader.get_on_session_ready_queue = MagicMock(return_value=[])
+    loader._on_session_ready_queue = []
+    return loader
+
+
+_CONFIG = {
+    "session": {"orchestrator": "loop-basic", "context": "context-simple"},
+    "providers": [{"module": "provider-a"}],
+    "tools": [{"module": "tool-b"}],
+    "hooks": [{"module": "hooks-c"}],
+}
+
+
+@pytest.mark.asyncio
+async def test_module_loads_overlap():
+    """Every provider/tool/hook load is in flight before any of them finishes."""
+    modules = {"provider-a", "tool-b", "hooks-c"}
+    started: set[str] = set()
+    all_started = asyncio.Event()
+
+    async def load(module_id, config=None, source_hint=None, coordinator=None):
+        if module_id in modules:
+            started.add(module_id)
+            if started == modules:
+                all_started.set()
+            # Only completes if the other loads start while this one is pending.
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+        return AsyncMock(return_value=None)
+
+    loader = _make_loader(load)
+    coordinator = _make_coordinator(loader)
+
+    await initialize_session(_CONFIG, coordinator, session_id="s", parent_id=None)
+
+    assert started == modules
+
+
+@pytest.mark.asyncio
+async def test_mounts_run_in_config_order():
+    """Mount order follows the config, not the order loads complete in."""
+    mounted: list[str] = []
+    delays = {"provider-a": 0.03, "tool-b": 0.02, "hooks-c": 0.0}
+
+    async def load(module_id, config=None, source_hint=None, coordinator=None):
+        await asyncio.sleep(delays.get(module_id, 0.0))
+
+        async def mount(coord):
+            mounted.append(module_id)
+
+        return mount
+
+    loader = _make_loader(load)
+    coordinator = _make_coordinator(loader)
+
+    await initialize_session(_CONFIG, coordinator, session_id="s", parent_id=None)
+
+    assert mounted == [
+        "loop-basic",
+        "context-simple",
+        "provider-a",
+        "tool-b",
+        "hooks-c",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_load_does_not_block_other_modules():
+    """A failing load is logged and skipped; the remaining modules still mount."""
+    mounted: list[str] = []
+
+    async def load(module_id, config=None, source_hint=None, coordinator=None):
+        if module_id == "tool-b":
+            raise ValueError("not found")
+
+        async def mount(coord):
+            mounted.append(module_id)
+
+        return mount
+
+    loader = _make_loader(load)
+    coordinator = _make_coordinator(loader)
+
+    await initialize_session(_CONFIG, coordinator, session_id="s", parent_id=None)
+
+    assert "tool-b" not in mounted
+    assert mounted[-2:] == ["provider-a", "hooks-c"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_module_loads_after_first_completes():
+    """A second entry for the same module waits for the first load (cache hit)."""
+    in_flight: dict[str, int] = {}
+    overlapped: list[str] = []
+    configs: list[dict] = []
+
+    async def load(module_id, config=None, source_hint=None, coordinator=None):
+        if in_flight.get(module_id):
+            overlapped.append(module_id)
+        in_flight[module_id] = in_flight.get(module_id, 0) + 1
+        await asyncio.sleep(0.01)
+        in_flight[module_id] -= 1
+        if module_id == "provider-a":
+            configs.append(config)
+        return AsyncMock(return_value=None)
+
+    loader = _make_loader(load)
+    coordinator = _make_coordinator(loader)
+    config = {
+        **_CONFIG,
+        "providers": [
+            {"module": "provider-a", "config": {"n": 1}},
+            {"module": "provider-a", "instance_id": "a-2", "config": {"n": 2}},
+        ],
+    }
+
+    await initialize_session(config, coordinator, session_id="s", parent_id=None)
+
+    assert overlapped == []
+    assert configs == [{"n": 1}, {"n": 2}]
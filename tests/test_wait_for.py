@@ -0,0 +1,30 @@
+"""Tests for the wait helpers in amplifier_core.testing."""
+
+import asyncio
+
+import pytest
+
+from amplifier_core.testing import wait_for
+from amplifier_core.testing import wait_for_event
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_returns_when_set():
+    event = asyncio.Event()
+    asyncio.get_running_loop().call_soon(event.set)
+
+    assert await wait_for_event(event, timeout=1.0) is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_times_out():
+    assert await wait_for_event(asyncio.Event(), timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_polls_until_condition():
+    state = {"done": False}
+    asyncio.get_running_loop().call_later(0.005, state.update, {"done": True})
+
+    assert await wait_for(lambda: state["done"], timeout=1.0) is True
+    assert await wait_for(lambda: False, timeout=0.01) is False